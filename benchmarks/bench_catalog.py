@@ -0,0 +1,114 @@
+"""
+Catalog load and schema conversion time per column, on synthetic catalogs.
+
+    python benchmarks/bench_catalog.py [--columns 10000 100000 500000] [--columns-per-table 50] [--output ...]
+
+The catalogs cycle through every supported datatype of _mssql_datatype_dictionary and _mysql_datatype_dictionary.
+Each phase is timed on its own, add_table_to_database, database_table_convert_new to the other system and the
+CREATE TABLE of the converted tables, and is then run again under tracemalloc for its peak bytes and the blocks it
+leaves allocated.  No database is needed.
+"""
+from argparse import ArgumentParser
+from json import dump
+from platform import platform, python_version
+from time import perf_counter
+from typing import Callable
+import tracemalloc
+from sql_system_transfer.datatype import SQLDatatypeError
+from sql_system_transfer.datatype_dictionary import _mssql_datatype_dictionary, _mysql_datatype_dictionary
+from sql_system_transfer.engine import Column, Database
+from sql_system_transfer.system import SQLSystem
+
+SYSTEMS = {
+    SQLSystem.MSSQL: (_mssql_datatype_dictionary, SQLSystem.MYSQL, "latin1"),
+    SQLSystem.MYSQL: (_mysql_datatype_dictionary, SQLSystem.MSSQL, "latin1"),
+}
+
+
+def catalog_columns(system: SQLSystem, count: int) -> list[dict]:
+    datatype_dictionary, _, character_set = SYSTEMS[system]
+    columns = []
+    for datatype_name in datatype_dictionary:
+        column = {"column_name": f"c_{datatype_name}", "nullable": "YES", "datatype_name": datatype_name,
+                  "character_size": 50, "character_set": character_set, "numeric_precision": 18,
+                  "numeric_scale": 4, "datetime_precision": 3}
+        try:
+            Column(system=system, **column)
+        except SQLDatatypeError:
+            continue
+        columns.append(column)
+    return [{**columns[index % len(columns)], "column_name": f"c{index}"} for index in range(count)]
+
+
+def catalog_tables(system: SQLSystem, columns: int, columns_per_table: int) -> list[tuple[dict, list]]:
+    table_columns = catalog_columns(system, columns_per_table)
+    return [({"table": f"Table{index}", "table_type": "BASE TABLE", "table_rows": 1000}, table_columns)
+            for index in range(max(1, columns // columns_per_table))]
+
+
+def bench_phase(phase: Callable, columns: int) -> dict:
+    start = perf_counter()
+    phase()
+    seconds = perf_counter() - start
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    phase()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum([max(0, statistic.count_diff) for statistic in after.compare_to(before, "filename")])
+    return {"seconds": seconds, "us_per_column": seconds / columns * 1e6, "peak_bytes_per_column": peak / columns,
+            "retained_blocks_per_column": blocks / columns}
+
+
+def bench_catalog(system: SQLSystem, columns: int, columns_per_table: int) -> dict:
+    _, convert_to_system, _ = SYSTEMS[system]
+    tables = catalog_tables(system, columns, columns_per_table)
+    columns = len(tables) * columns_per_table
+    database = Database(system=system, database="Bench")
+    names = [f"Bench.{'dbo.' if system == SQLSystem.MSSQL else ''}{table['table']}" for table, _ in tables]
+    converted = []
+
+    def add_tables() -> None:
+        database.database_tables.clear()
+        for table, table_columns in tables:
+            database.add_table_to_database(table=table, columns=table_columns)
+
+    def convert_tables() -> None:
+        converted[:] = database.database_table_convert_new(tables=names, convert_to_system=convert_to_system)
+
+    def render_tables() -> None:
+        # statement_create_table is cached per Table, the cache is cleared so that every run renders
+        for table in converted:
+            table._statements.clear()
+            table.statement_create_table(database="Bench")
+
+    return {
+        "system": system.name,
+        "convert_to_system": convert_to_system.name,
+        "columns": columns,
+        "tables": len(tables),
+        "add_table_to_database": bench_phase(add_tables, columns),
+        "database_table_convert_new": bench_phase(convert_tables, columns),
+        "statement_create_table": bench_phase(render_tables, columns),
+    }
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--columns", nargs="+", type=int, default=[10_000, 100_000, 500_000])
+    parser.add_argument("--columns-per-table", type=int, default=50)
+    parser.add_argument("--output", default="bench_catalog.json")
+    args = parser.parse_args()
+
+    results = {"python": python_version(), "platform": platform(), "cases": []}
+    for system in SYSTEMS:
+        for columns in args.columns:
+            case = bench_catalog(system, columns, args.columns_per_table)
+            results["cases"].append(case)
+            for phase in ["add_table_to_database", "database_table_convert_new", "statement_create_table"]:
+                print(f"{case['system']:<6} {case['columns']:>8,} columns {phase:<26} "
+                      f"{case[phase]['us_per_column']:>8.2f} us/column {case[phase]['peak_bytes_per_column']:>8,.0f} "
+                      f"B/column peak {case[phase]['retained_blocks_per_column']:>6.1f} blocks/column retained")
+    with open(args.output, "w") as file:
+        dump(results, file, indent=2)
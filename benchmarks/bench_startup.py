@@ -0,0 +1,44 @@
+"""
+Import and construct time of the Engine.
+
+    python benchmarks/bench_startup.py [--runs 20]
+
+Each import is timed in a fresh interpreter. Construction is timed in-process and does not need a database, as the
+connection and the catalog are opened on first use.
+"""
+from argparse import ArgumentParser
+from statistics import median
+from subprocess import run
+from time import perf_counter
+import sys
+
+IMPORT = "from time import perf_counter; start = perf_counter(); import sql_system_transfer.engine; " \
+         "print(perf_counter() - start)"
+
+
+def bench_import(runs: int) -> float:
+    return median([float(run([sys.executable, "-c", IMPORT], capture_output=True, text=True, check=True).stdout)
+                   for _ in range(runs)])
+
+
+def bench_construct(runs: int) -> float:
+    from sql_system_transfer.engine import Engine, SQLSystem
+    start = perf_counter()
+    for _ in range(runs):
+        Engine(system=SQLSystem.MSSQL, server="localhost", database="AdventureWorks", trusted_connection="yes")
+    return (perf_counter() - start) / runs
+
+
+def bench_loaded() -> list:
+    from sql_system_transfer import engine  # noqa: F401
+    return [name for name in ["pyodbc", "concurrent.futures", "sql_system_transfer.planner", "sql_system_transfer.verify"]
+            if name in sys.modules]
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    print(f"import sql_system_transfer.engine: {bench_import(args.runs) * 1000:.1f} ms (median of {args.runs})")
+    print(f"Engine(...): {bench_construct(args.runs * 100) * 1e6:.1f} us")
+    print(f"loaded by import: {', '.join(bench_loaded()) or 'none of pyodbc, concurrent.futures, planner, verify'}")
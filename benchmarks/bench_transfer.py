@@ -0,0 +1,125 @@
+"""
+End-to-end transfer throughput against the in-process FakeBackend.
+
+    python benchmarks/bench_transfer.py [--scale 1.0] [--latency 0.0002] [--output bench_transfer.json]
+    python benchmarks/bench_transfer.py --baseline bench_transfer.json [--threshold 0.10]
+
+Every case runs in a fresh interpreter, so that the peak RSS is that of the case alone.  The cases cover narrow, wide
+and LOB rows, many small tables and one huge table, under each write mode and worker count.  The results are written
+as JSON; with --baseline, cases whose rows/s fell by more than threshold are reported and the exit code is 1.
+
+The fake rows share their text values, so the peak RSS is that of the engine's batches and tasks, not of the driver.
+"""
+from argparse import ArgumentParser
+from json import dump, dumps, load, loads
+from platform import platform, python_version
+from resource import getrusage, RUSAGE_SELF
+from subprocess import run
+from time import perf_counter
+import sys
+
+SCENARIOS = {
+    "narrow": {"count": 1, "row_count": 200_000, "row_width": 32, "columns": 2},
+    "wide": {"count": 1, "row_count": 20_000, "row_width": 2000, "columns": 40},
+    "lob": {"count": 1, "row_count": 2_000, "row_width": 64 * 1024, "columns": 1, "lob": True},
+    "many_small": {"count": 200, "row_count": 500, "row_width": 100, "columns": 4},
+    "huge": {"count": 1, "row_count": 1_000_000, "row_width": 100, "columns": 4},
+}
+WRITE_MODES = ["replace", "append", "upsert"]
+WORKERS = [1, 4]
+
+
+def bench_case(scenario: str, write_mode: str, workers: int, scale: float, latency: float, batch_size: int) -> dict:
+    from sql_system_transfer.engine import Engine, SQLSystem
+    from sql_system_transfer.fake import FakeBackend, fake_tables
+
+    parameters = {**SCENARIOS[scenario]}
+    count = parameters.pop("count")
+    parameters["row_count"] = max(1, int(parameters["row_count"] * scale))
+    tables = fake_tables(count, prefix=f"{scenario.title().replace('_', '')}", **parameters)
+    source = FakeBackend(tables=tables, latency=latency)
+    # append and upsert write into tables that already exist and hold the same rows, as on a rerun of the transfer
+    target = FakeBackend(tables=tables if write_mode != "replace" else [], latency=latency)
+    source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Bench", connection_factory=source)
+    target_engine = Engine(system=SQLSystem.MYSQL, server="fake", database="Bench", connection_factory=target)
+    names = [f"Bench.dbo.{table.table}" for table in tables]
+
+    # the huge table is split into key ranges so that the workers share it
+    split_threshold = tables[0].fake_data_bytes() // workers + 1 if scenario == "huge" and workers > 1 else None
+    start = perf_counter()
+    source_engine.engine_transfer_tables(
+        tables=names, engine=target_engine, write_mode=write_mode, batch_size=batch_size, workers=workers,
+        split_threshold=split_threshold, keys={name: ["id"] for name in names}
+    )
+    seconds = perf_counter() - start
+    rows = sum(target.rows_written.values())
+    data_bytes = sum([table.fake_data_bytes() for table in tables])
+    return {
+        "case": f"{scenario}/{write_mode}/{workers}",
+        "scenario": scenario,
+        "write_mode": write_mode,
+        "workers": workers,
+        "tables": count,
+        "rows": rows,
+        "bytes": data_bytes,
+        "seconds": seconds,
+        "rows_per_second": rows / seconds,
+        "bytes_per_second": data_bytes / seconds,
+        "round_trips": source.round_trips + target.round_trips,
+        # ru_maxrss is in KiB on Linux
+        "peak_rss_bytes": getrusage(RUSAGE_SELF).ru_maxrss * 1024,
+    }
+
+
+def bench_regressions(results: dict, baseline: dict, threshold: float) -> list:
+    previous = {case["case"]: case for case in baseline["cases"]}
+    regressions = []
+    for case in results["cases"]:
+        if case["case"] in previous:
+            change = case["rows_per_second"] / previous[case["case"]]["rows_per_second"] - 1
+            if change < -threshold:
+                regressions.append((case["case"], change))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplies the row count of every scenario")
+    parser.add_argument("--latency", type=float, default=0.0002, help="seconds per round trip")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--write-modes", nargs="+", choices=WRITE_MODES, default=WRITE_MODES)
+    parser.add_argument("--workers", nargs="+", type=int, default=WORKERS)
+    parser.add_argument("--output", default="bench_transfer.json")
+    parser.add_argument("--baseline", default=None, help="earlier --output to compare rows/s against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="rows/s drop reported as a regression")
+    parser.add_argument("--case", nargs=3, default=None, help="run one case in this process: scenario mode workers")
+    args = parser.parse_args()
+
+    if args.case is not None:
+        scenario, write_mode, workers = args.case
+        print(dumps(bench_case(scenario, write_mode, int(workers), args.scale, args.latency, args.batch_size)))
+        sys.exit(0)
+
+    options = ["--scale", str(args.scale), "--latency", str(args.latency), "--batch-size", str(args.batch_size)]
+    results = {"python": python_version(), "platform": platform(), "scale": args.scale, "latency": args.latency,
+               "batch_size": args.batch_size, "cases": []}
+    for scenario in args.scenarios:
+        for write_mode in args.write_modes:
+            for workers in args.workers:
+                output = run([sys.executable, __file__, *options, "--case", scenario, write_mode, str(workers)],
+                             capture_output=True, text=True, check=True).stdout
+                case = loads(output.splitlines()[-1])
+                results["cases"].append(case)
+                print(f"{case['case']:<24} {case['rows_per_second']:>12,.0f} rows/s "
+                      f"{case['bytes_per_second'] / 1024 ** 2:>9,.1f} MiB/s {case['round_trips']:>9,} round trips "
+                      f"{case['peak_rss_bytes'] / 1024 ** 2:>7,.0f} MiB peak RSS")
+    with open(args.output, "w") as file:
+        dump(results, file, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            regressions = bench_regressions(results, load(file), args.threshold)
+        for case, change in regressions:
+            print(f"regression: {case} rows/s {change:+.1%}")
+        sys.exit(1 if regressions else 0)
@@ -57,6 +57,8 @@ class CharacterSetDictionary:
 
 _mssql_character_set_dictionary: dict = frozendict({})
 
+_sqlite_character_set_dictionary: dict = frozendict({})
+
 _mysql_character_set_dictionary: Dict[str, Dict[str, str | int]] = frozendict({
         "armscii8": {
             "description": "ARMSCII-8 Armenian",
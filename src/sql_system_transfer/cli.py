@@ -0,0 +1,235 @@
+from __future__ import annotations
+from argparse import ArgumentParser, Namespace
+from configparser import ConfigParser
+from fnmatch import fnmatchcase
+from json import JSONDecodeError, dump, load
+from os import fdopen, path, remove, replace
+from tempfile import mkstemp
+from threading import Lock
+from time import perf_counter
+from typing import Optional
+import sys
+# engine.py is not type checked as a whole, so its names are unknown to mypy
+from sql_system_transfer.engine import Engine, SQLDriverError, SQLWriteModeError, engine_errors  # type: ignore[attr-defined]
+from sql_system_transfer.events import TransferEvent
+from sql_system_transfer.progress import TransferProgress
+from sql_system_transfer.report import TransferReport, report_merge
+from sql_system_transfer.system import SQLSystem, SQLSystemError
+
+
+EXIT_SUCCESS = 0
+EXIT_TRANSFER_FAILED = 1
+EXIT_USAGE = 2
+EXIT_VERIFY_FAILED = 3
+EXIT_CONNECTION_FAILED = 4
+
+DEFAULT_PROFILES = path.join("~", ".sql_system_transfer.ini")
+
+
+class SQLProfileError(Exception):
+    pass
+
+
+class SQLStateError(Exception):
+    pass
+
+
+class CopyState:
+    """Hook that adds each table to the state file as soon as its last task finishes, and prints its rows/s."""
+
+    def __init__(self, state: str, source: str, target: str, completed: list) -> None:
+        self.state = state
+        self.source = source
+        self.target = target
+        self.completed = completed
+        self.selected = 0
+        self.rows = 0
+        self._started = perf_counter()
+        self._lock = Lock()
+
+    def copy_start(self, selected: int) -> None:
+        self.selected, self.rows, self._started = selected, 0, perf_counter()
+
+    def __call__(self, event: TransferEvent) -> None:
+        if event.phase != "table":
+            return
+        with self._lock:
+            self.completed.append(event.table_name)
+            cli_state_save(self.state, self.source, self.target, self.completed)
+            self.rows += event.rows
+            elapsed = perf_counter() - self._started
+            print(
+                f"[{len(self.completed)}/{self.selected}] {event.table_name} - {event.rows:,} rows in "
+                f"{event.seconds:.1f}s ({event.rows / max(event.seconds, 1e-9):,.0f} rows/s, "
+                f"{self.rows / max(elapsed, 1e-9):,.0f} rows/s overall)", flush=True
+            )
+
+
+def cli_parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="sql-system-transfer", description="Transfer tables between SQL Systems.")
+    parser.add_argument("--profiles", default=DEFAULT_PROFILES, help="connection profile file (INI)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    copy = commands.add_parser("copy", help="copy tables from a source profile to a target profile")
+    copy.add_argument("source", help="source connection profile")
+    copy.add_argument("target", help="target connection profile")
+    copy.add_argument("tables", nargs="+", help="table names or glob patterns, e.g. 'AdventureWorksDW.dbo.Dim*'")
+    copy.add_argument("--workers", type=int, default=1)
+    copy.add_argument("--batch-size", type=int, default=1000)
+    copy.add_argument("--page-size", type=int, default=None)
+    copy.add_argument("--split-threshold", type=int, default=None)
+    copy.add_argument("--write-mode", choices=["replace", "append", "upsert"], default="replace")
+    copy.add_argument("--fast-load", action="store_true")
+    copy.add_argument("--retries", type=int, default=3,
+                      help="replays of a failed batch, each batch is committed in its own transaction (0 to disable)")
+    copy.add_argument("--state", default=".sql_system_transfer.state.json", help="file of completed tables")
+    copy.add_argument("--resume", action="store_true", help="skip the tables completed in the state file")
+    copy.add_argument("--verify", choices=["sample", "checksum"], default=None)
+    copy.add_argument("--report", default=None, help="JSON file of rows, time, rows/s and retries per table")
+    copy.add_argument("--progress", action="store_true", help="print rows done, rows/s and an ETA every few seconds")
+    return parser
+
+
+def cli_profile(profiles: str, name: str) -> dict:
+    config = ConfigParser()
+    if not config.read(path.expanduser(profiles)):
+        raise SQLProfileError(f"profile file {profiles} could not be read")
+    if not config.has_section(name):
+        raise SQLProfileError(f"profile {name} not found in {profiles}")
+    profile = dict(config.items(name))
+    try:
+        system = SQLSystem[profile.pop("system").upper()]
+    except KeyError:
+        raise SQLProfileError(f"profile {name} must have a system: {', '.join([s.name.lower() for s in SQLSystem])}")
+    return {"system": system, **profile}
+
+
+def cli_tables(table_names: list, patterns: list) -> list:
+    tables = [table for table in table_names if any([fnmatchcase(table, pattern) for pattern in patterns])]
+    return list(dict.fromkeys(tables))
+
+
+def cli_state_load(state: str, source: str, target: str) -> list:
+    if not path.exists(state):
+        return []
+    with open(state) as file:
+        try:
+            saved = load(file)
+        except JSONDecodeError as error:
+            raise SQLStateError(f"state file {state} could not be read - {error}")
+    if not isinstance(saved, dict):
+        raise SQLStateError(f"state file {state} could not be read - not a JSON object")
+    # the completed tables of one copy are not completed in a copy between other profiles
+    if (saved.get("source"), saved.get("target")) != (source, target):
+        raise SQLStateError(
+            f"state file {state} is of a copy from {saved.get('source')} to {saved.get('target')}, "
+            f"not from {source} to {target}"
+        )
+    completed: list = saved.get("completed", [])
+    return completed
+
+
+def cli_state_save(state: str, source: str, target: str, completed: list) -> None:
+    # written to a temporary file next to the state file and renamed, so that a stopped copy never leaves a partial file
+    directory, name = path.split(path.abspath(state))
+    descriptor, temporary = mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    try:
+        with fdopen(descriptor, "w") as file:
+            dump({"source": source, "target": target, "completed": completed}, file, indent=2)
+        replace(temporary, state)
+    except BaseException:
+        remove(temporary)
+        raise
+
+
+def cli_report_save(report: Optional[str], reports: list[TransferReport]) -> None:
+    if report is not None:
+        with open(report, "w") as file:
+            file.write(report_merge(reports).report_json())
+
+
+def cli_report_failed(error: Exception, tables: list) -> TransferReport:
+    # the engine attaches its report to the error, with the failed tables marked
+    report = getattr(error, "report", None)
+    if report is None:
+        report = TransferReport()
+        for table in tables:
+            report.report_fail(table_name=table, reason=str(error))
+    return report
+
+
+def cli_copy(args: Namespace) -> int:
+    progress = TransferProgress() if args.progress else None
+    try:
+        completed = cli_state_load(args.state, source=args.source, target=args.target) if args.resume else []
+    except SQLStateError as error:
+        print(f"{error}", file=sys.stderr)
+        return EXIT_USAGE
+    copied = CopyState(state=args.state, source=args.source, target=args.target, completed=completed)
+    try:
+        source = Engine(**cli_profile(args.profiles, args.source),
+                        hooks=(copied,) if progress is None else (progress, copied))
+        target = Engine(**cli_profile(args.profiles, args.target))
+        tables = {
+            table.table_format(database=source.database): table
+            for table in source.database_object.database_tables if table.table_type == "BASE TABLE"
+        }
+        target.connection  # opened here so that an unreachable target fails before any table is copied
+    except (SQLProfileError, SQLSystemError, SQLDriverError, *engine_errors()) as error:
+        print(f"connection failed - {error}", file=sys.stderr)
+        return EXIT_CONNECTION_FAILED
+
+    selected = cli_tables(table_names=list(tables), patterns=args.tables)
+    if not selected:
+        print("no tables matched", file=sys.stderr)
+        return EXIT_USAGE
+    remaining = [table for table in selected if table not in copied.completed]
+    print(f"{len(remaining)} of {len(selected)} tables to copy from {args.source} to {args.target}")
+
+    # one transfer of every remaining table, so that the workers share one largest-first queue; the state file is kept
+    # by CopyState as each table finishes
+    copied.copy_start(selected=len(selected))
+    try:
+        report = source.engine_transfer_tables(
+            tables=remaining, engine=target, write_mode=args.write_mode, page_size=args.page_size,
+            batch_size=args.batch_size, workers=args.workers, split_threshold=args.split_threshold,
+            fast_load=args.fast_load, retries=args.retries
+        )
+    except SQLWriteModeError as error:
+        print(f"{error}", file=sys.stderr)
+        return EXIT_USAGE
+    except engine_errors() as error:
+        print(f"transfer failed - {error}", file=sys.stderr)
+        report = cli_report_failed(
+            error=error, tables=[table for table in remaining if table not in copied.completed]
+        )
+    for skipped in report.report_skipped():
+        print(skipped.report_format(), file=sys.stderr)
+
+    cli_report_save(args.report, [report])
+    failed = [table.table_name for table in report.report_failed()]
+    if failed:
+        print(f"{len(failed)} tables failed: {', '.join(failed)}", file=sys.stderr)
+        return EXIT_TRANSFER_FAILED
+    if args.verify is not None:
+        completed = [table for table in selected if table in copied.completed]
+        if args.verify == "sample":
+            verifications = source.engine_sample_tables(tables=completed, engine=target, workers=max(1, args.workers))
+        else:
+            verifications = source.engine_verify_tables(tables=completed, engine=target, workers=max(1, args.workers))
+        for verification in verifications:
+            print(verification.verification_format())
+        if not all([verification.verification_passed() for verification in verifications]):
+            return EXIT_VERIFY_FAILED
+    return EXIT_SUCCESS
+
+
+def main(argv: Optional[list] = None) -> int:
+    args = cli_parser().parse_args(argv)
+    if args.command == "copy":
+        return cli_copy(args)
+    return EXIT_USAGE
+
+
+if __name__ == "__main__":
+    sys.exit(main())
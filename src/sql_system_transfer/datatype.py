@@ -204,6 +204,70 @@ class MySQLDatatypeFactory(DatatypeFactory):
             raise SQLDatatypeError("Not a valid MySQL Datatype")
 
 
+class SQLiteDatatypeFactory(DatatypeFactory):
+
+    def __init__(self) -> None:
+        super().__init__(system=SQLSystem.SQLITE)
+
+    def _datatype_factory(self, datatype_name: str,
+                          character_size: int,
+                          character_set: str,
+                          numeric_precision: int,
+                          numeric_scale: int,
+                          datetime_precision: int
+                          ) -> Datatype:
+        if datatype_name == "varchar":
+            return SQLiteText("varchar", character_size)
+        elif datatype_name == "nvarchar":
+            return SQLiteText("nvarchar", character_size)
+        elif datatype_name == "char":
+            return SQLiteText("char", character_size)
+        elif datatype_name == "nchar":
+            return SQLiteText("nchar", character_size)
+        elif datatype_name == "text":
+            return SQLiteText("text")
+        elif datatype_name == "blob":
+            return SQLiteBlob("blob")
+        elif datatype_name == "binary":
+            return SQLiteBlob("binary", character_size)
+        elif datatype_name == "varbinary":
+            return SQLiteBlob("varbinary", character_size)
+        elif datatype_name == "integer":
+            return SQLiteInteger("integer")
+        elif datatype_name == "bigint":
+            return SQLiteInteger("bigint")
+        elif datatype_name == "int":
+            return SQLiteInteger("int")
+        elif datatype_name == "mediumint":
+            return SQLiteInteger("mediumint")
+        elif datatype_name == "smallint":
+            return SQLiteInteger("smallint")
+        elif datatype_name == "tinyint":
+            return SQLiteInteger("tinyint")
+        elif datatype_name == "boolean":
+            return SQLiteInteger("boolean")
+        elif datatype_name == "real":
+            return SQLiteReal("real")
+        elif datatype_name == "double":
+            return SQLiteReal("double")
+        elif datatype_name == "float":
+            return SQLiteReal("float")
+        elif datatype_name == "numeric":
+            return SQLiteNumeric("numeric", numeric_precision, numeric_scale)
+        elif datatype_name == "decimal":
+            return SQLiteNumeric("decimal", numeric_precision, numeric_scale)
+        elif datatype_name == "date":
+            return SQLiteDatetime("date")
+        elif datatype_name == "datetime":
+            return SQLiteDatetime("datetime", datetime_precision)
+        elif datatype_name == "timestamp":
+            return SQLiteDatetime("timestamp", datetime_precision)
+        elif datatype_name == "time":
+            return SQLiteDatetime("time", datetime_precision)
+        else:
+            raise SQLDatatypeError("Not a valid SQLite Datatype")
+
+
 class Datatype(ABC):
     _datatype_name: str
 
@@ -234,6 +298,9 @@ class Datatype(ABC):
     def _datatype_convert_to_mysql(self) -> Datatype:
         return self
 
+    def _datatype_convert_to_sqlite(self) -> Datatype:
+        return self
+
     def datatype_convert(self, convert_to_system: SQLSystem) -> Datatype:
         sql_system = convert_to_system.system_abbreviation_lower()
         return getattr(self, f"_datatype_convert_to_{sql_system}")()
@@ -283,6 +350,11 @@ class MsSQLVarchar(Datatype):
             else:
                 return MySQLVarchar(character_size=self.character_size)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteText:
+        return SQLiteText(
+            datatype_name=self.datatype_name, character_size=None if self.character_size == -1 else self.character_size
+        )
+
 
 class _MySQLCharacterSetMixin:
     _character_set_dictionary = None
@@ -362,6 +434,13 @@ class MySQLVarchar(Datatype, _MySQLCharacterSetMixin):
         else:
             return 16383
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteText:
+        charset_category = self._character_set_dictionary.character_set_category(character_set=self.character_set)
+        if charset_category == "unicode":
+            return SQLiteText(datatype_name="nvarchar", character_size=self.character_size)
+        else:
+            return SQLiteText(datatype_name="varchar", character_size=self.character_size)
+
 
 class MsSQLText(Datatype):
 
@@ -385,6 +464,9 @@ class MsSQLText(Datatype):
         else:
             return MySQLOtherText(datatype_name="longtext", character_set="latin1")
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteText:
+        return SQLiteText(datatype_name="text")
+
 
 class MySQLText(Datatype, _MySQLCharacterSetMixin):
 
@@ -437,6 +519,9 @@ class MySQLText(Datatype, _MySQLCharacterSetMixin):
             else:
                 return MsSQLVarchar(datatype_name="varchar", character_size=-1)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteText:
+        return SQLiteText(datatype_name="text")
+
 
 class MySQLOtherText(Datatype, _MySQLCharacterSetMixin):
 
@@ -470,6 +555,9 @@ class MySQLOtherText(Datatype, _MySQLCharacterSetMixin):
             else:
                 return MsSQLVarchar(datatype_name="varchar", character_size=-1)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteText:
+        return SQLiteText(datatype_name="text")
+
 
 class MsSQLChar(Datatype):
 
@@ -511,6 +599,9 @@ class MsSQLChar(Datatype):
             else:
                 return MySQLVarchar(character_size=self.character_size, character_set="latin1")
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteText:
+        return SQLiteText(datatype_name=self.datatype_name, character_size=self.character_size)
+
 
 class MySQLChar(Datatype, _MySQLCharacterSetMixin):
 
@@ -543,6 +634,13 @@ class MySQLChar(Datatype, _MySQLCharacterSetMixin):
         else:
             return MsSQLChar(datatype_name="char", character_size=self.character_size)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteText:
+        charset_category = self._character_set_dictionary.character_set_category(character_set=self.character_set)
+        if charset_category == "unicode":
+            return SQLiteText(datatype_name="nchar", character_size=self.character_size)
+        else:
+            return SQLiteText(datatype_name="char", character_size=self.character_size)
+
 
 class MsSQLBinary(Datatype):
 
@@ -571,6 +669,9 @@ class MsSQLBinary(Datatype):
         else:
             return MySQLBlob()
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteBlob:
+        return SQLiteBlob(datatype_name="binary", character_size=self.character_size)
+
 
 class MySQLBinary(Datatype):
 
@@ -596,6 +697,9 @@ class MySQLBinary(Datatype):
     def _datatype_convert_to_mssql(self) -> MsSQLBinary:
         return MsSQLBinary(character_size=self.character_size)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteBlob:
+        return SQLiteBlob(datatype_name="binary", character_size=self.character_size)
+
 
 class MsSQLVarbinary(Datatype):
 
@@ -628,6 +732,11 @@ class MsSQLVarbinary(Datatype):
         else:
             return MySQLVarbinary(character_size=self.character_size)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteBlob:
+        return SQLiteBlob(
+            datatype_name="varbinary", character_size=None if self.character_size == -1 else self.character_size
+        )
+
 
 class MySQLVarbinary(Datatype):
 
@@ -653,6 +762,9 @@ class MySQLVarbinary(Datatype):
     def _datatype_convert_to_mssql(self) -> MsSQLVarbinary:
         return MsSQLVarbinary(character_size=self.character_size)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteBlob:
+        return SQLiteBlob(datatype_name="varbinary", character_size=self.character_size)
+
 
 class MySQLBlob(Datatype):
 
@@ -692,6 +804,9 @@ class MySQLBlob(Datatype):
     def _datatype_convert_to_mssql(self) -> MsSQLVarbinary:
         return MsSQLVarbinary(character_size=-1)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteBlob:
+        return SQLiteBlob(datatype_name="blob")
+
 
 class MySQLOtherBlob(Datatype):
 
@@ -715,6 +830,9 @@ class MySQLOtherBlob(Datatype):
         else:
             return MsSQLVarbinary(character_size=-1)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteBlob:
+        return SQLiteBlob(datatype_name="blob")
+
 
 class MsSQLOther(Datatype):
 
@@ -753,6 +871,16 @@ class MsSQLOther(Datatype):
         else:
             return MySQLText()
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteBlob | SQLiteText:
+        if self.datatype_name in ["geography", "geometry", "hierarchyid", "image"]:
+            return SQLiteBlob(datatype_name="blob")
+        elif self.datatype_name == "sysname":
+            return SQLiteText(datatype_name="nvarchar", character_size=128)
+        elif self.datatype_name == "uniqueidentifier":
+            return SQLiteText(datatype_name="char", character_size=36)
+        else:
+            return SQLiteText(datatype_name="text")
+
 
 class MsSQLNumeric(Datatype):
 
@@ -799,6 +927,11 @@ class MsSQLNumeric(Datatype):
     def _datatype_convert_to_mysql(self) -> MySQLDecimal:
         return MySQLDecimal(numeric_precision=self.numeric_precision, numeric_scale=self.numeric_scale)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteNumeric:
+        return SQLiteNumeric(
+            datatype_name=self.datatype_name, numeric_precision=self.numeric_precision, numeric_scale=self.numeric_scale
+        )
+
 
 class MySQLDecimal(Datatype):
 
@@ -854,6 +987,11 @@ class MySQLDecimal(Datatype):
                 numeric_scale=self.numeric_scale
             )
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteNumeric:
+        return SQLiteNumeric(
+            datatype_name="decimal", numeric_precision=self.numeric_precision, numeric_scale=self.numeric_scale
+        )
+
 
 class MsSQLFloat(Datatype):
 
@@ -890,6 +1028,9 @@ class MsSQLFloat(Datatype):
         else:
             return MySQLFloat(datatype_name="float")
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteReal:
+        return SQLiteReal(datatype_name=self.datatype_name)
+
 
 class MySQLFloat(Datatype):
 
@@ -929,6 +1070,9 @@ class MySQLFloat(Datatype):
         else:
             return MsSQLFloat(datatype_name="real")
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteReal:
+        return SQLiteReal(datatype_name=self.datatype_name)
+
 
 class MsSQLInteger(Datatype):
 
@@ -956,6 +1100,12 @@ class MsSQLInteger(Datatype):
         else:
             return MySQLInteger(datatype_name="bigint")
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteInteger:
+        if self.datatype_name == "bit":
+            return SQLiteInteger(datatype_name="boolean")
+        else:
+            return SQLiteInteger(datatype_name=self.datatype_name)
+
 
 class MySQLInteger(Datatype):
 
@@ -1006,6 +1156,14 @@ class MySQLInteger(Datatype):
         else:
             return MsSQLNumeric(datatype_name="numeric", numeric_precision=20, numeric_scale=0)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteInteger | SQLiteNumeric:
+        if self.datatype_name == "serial" or (self.datatype_name == "bigint" and self.signed_unsigned == "unsigned"):
+            return SQLiteNumeric(datatype_name="numeric", numeric_precision=20, numeric_scale=0)
+        elif self.signed_unsigned == "unsigned":
+            return SQLiteInteger(datatype_name="bigint")
+        else:
+            return SQLiteInteger(datatype_name=self.datatype_name)
+
 
 class MySQLBit(Datatype):
 
@@ -1034,6 +1192,12 @@ class MySQLBit(Datatype):
     def _datatype_convert_to_mssql(self) -> MsSQLNumeric:
         return MsSQLNumeric(datatype_name="numeric", numeric_precision=20, numeric_scale=0)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteInteger | SQLiteNumeric:
+        if self.numeric_precision == 1:
+            return SQLiteInteger(datatype_name="boolean")
+        else:
+            return SQLiteNumeric(datatype_name="numeric", numeric_precision=20, numeric_scale=0)
+
 
 class MsSQLMoney(Datatype):
 
@@ -1057,6 +1221,12 @@ class MsSQLMoney(Datatype):
         else:
             return MySQLDecimal(numeric_precision=19, numeric_scale=4)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteNumeric:
+        if self.datatype_name == "smallmoney":
+            return SQLiteNumeric(datatype_name="decimal", numeric_precision=10, numeric_scale=4)
+        else:
+            return SQLiteNumeric(datatype_name="decimal", numeric_precision=19, numeric_scale=4)
+
 
 class MsSQLDatetimeOne(Datatype):
 
@@ -1080,6 +1250,12 @@ class MsSQLDatetimeOne(Datatype):
         else:
             return MySQLDatetime(datatype_name="datetime")
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteDatetime:
+        if self.datatype_name == "date":
+            return SQLiteDatetime(datatype_name="date")
+        else:
+            return SQLiteDatetime(datatype_name="datetime")
+
 
 class MsSQLDatetimeTwo(Datatype):
 
@@ -1115,6 +1291,12 @@ class MsSQLDatetimeTwo(Datatype):
         else:
             return MySQLDatetime(datatype_name="datetime")
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteDatetime:
+        if self.datatype_name == "time":
+            return SQLiteDatetime(datatype_name="time", datetime_precision=self.datetime_precision)
+        else:
+            return SQLiteDatetime(datatype_name="datetime", datetime_precision=self.datetime_precision)
+
 
 class MsSQLTimestamp(Datatype):
 
@@ -1128,6 +1310,9 @@ class MsSQLTimestamp(Datatype):
     def _datatype_convert_to_mysql(self) -> MySQLInteger:
         return MySQLInteger(datatype_name="bigint")
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteBlob:
+        return SQLiteBlob(datatype_name="binary", character_size=8)
+
 
 class MySQLDate(Datatype):
 
@@ -1141,6 +1326,9 @@ class MySQLDate(Datatype):
     def _datatype_convert_to_mssql(self) -> MsSQLDatetimeOne:
         return MsSQLDatetimeOne(datatype_name="date")
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteDatetime:
+        return SQLiteDatetime(datatype_name="date")
+
 
 class MySQLDatetime(Datatype):
 
@@ -1176,6 +1364,9 @@ class MySQLDatetime(Datatype):
         else:
             return MsSQLDatetimeTwo(datatype_name="datetime2", datetime_precision=self.datetime_precision)
 
+    def _datatype_convert_to_sqlite(self) -> SQLiteDatetime:
+        return SQLiteDatetime(datatype_name=self.datatype_name, datetime_precision=self.datetime_precision)
+
 
 class MySQLYear(Datatype):
 
@@ -1188,3 +1379,290 @@ class MySQLYear(Datatype):
 
     def _datatype_convert_to_mssql(self) -> MsSQLInteger:
         return MsSQLInteger(datatype_name="int")
+
+    def _datatype_convert_to_sqlite(self) -> SQLiteInteger:
+        return SQLiteInteger(datatype_name="smallint")
+
+
+class SQLiteText(Datatype):
+
+    def __init__(self, datatype_name: Literal["varchar", "nvarchar", "char", "nchar", "text"],
+                 character_size: Optional[int] = None) -> None:
+        super().__init__()
+        self.datatype_name = datatype_name
+        self.character_size = character_size
+
+    @Datatype.datatype_name.setter
+    def datatype_name(self, new_datatype_name: Literal["varchar", "nvarchar", "char", "nchar", "text"]) -> None:
+        if new_datatype_name not in ["varchar", "nvarchar", "char", "nchar", "text"]:
+            self._datatype_name = "text"
+        else:
+            self._datatype_name = new_datatype_name
+
+    @property
+    def character_size(self) -> Optional[int]:
+        return self._character_size
+
+    @character_size.setter
+    def character_size(self, new_character_size: Optional[int]) -> None:
+        if self.datatype_name == "text" or not isinstance(new_character_size, int) or new_character_size <= 0:
+            self._character_size = None
+        else:
+            self._character_size = new_character_size
+
+    def datatype_format(self) -> str:
+        if self.character_size is None:
+            return f"{self.datatype_name}"
+        else:
+            return f"{self.datatype_name}({self.character_size})"
+
+    def _datatype_convert_to_mssql(self) -> MsSQLChar | MsSQLVarchar:
+        size = self.character_size
+        if self.datatype_name in ["char", "nchar"] and size is not None and size <= 8000:
+            return MsSQLChar(datatype_name=self.datatype_name, character_size=size)
+        elif self.datatype_name in ["varchar", "nvarchar"] and size is not None and size <= 8000:
+            return MsSQLVarchar(datatype_name=self.datatype_name, character_size=size)
+        elif self.datatype_name in ["varchar", "char"]:
+            return MsSQLVarchar(datatype_name="varchar", character_size=-1)
+        else:
+            return MsSQLVarchar(datatype_name="nvarchar", character_size=-1)
+
+    def _datatype_convert_to_mysql(self) -> MySQLChar | MySQLVarchar | MySQLOtherText:
+        size = self.character_size
+        if self.datatype_name in ["char", "nchar"] and size is not None and size <= 255:
+            return MySQLChar(character_size=size, character_set="utf8mb4")
+        elif size is not None and size <= 16383:
+            return MySQLVarchar(character_size=size, character_set="utf8mb4")
+        else:
+            return MySQLOtherText(datatype_name="longtext", character_set="utf8mb4")
+
+
+class SQLiteBlob(Datatype):
+
+    def __init__(self, datatype_name: Literal["blob", "binary", "varbinary"],
+                 character_size: Optional[int] = None) -> None:
+        super().__init__()
+        self.datatype_name = datatype_name
+        self.character_size = character_size
+
+    @Datatype.datatype_name.setter
+    def datatype_name(self, new_datatype_name: Literal["blob", "binary", "varbinary"]) -> None:
+        if new_datatype_name not in ["blob", "binary", "varbinary"]:
+            self._datatype_name = "blob"
+        else:
+            self._datatype_name = new_datatype_name
+
+    @property
+    def character_size(self) -> Optional[int]:
+        return self._character_size
+
+    @character_size.setter
+    def character_size(self, new_character_size: Optional[int]) -> None:
+        if self.datatype_name == "blob" or not isinstance(new_character_size, int) or new_character_size <= 0:
+            self._character_size = None
+        else:
+            self._character_size = new_character_size
+
+    def datatype_format(self) -> str:
+        if self.character_size is None:
+            return f"{self.datatype_name}"
+        else:
+            return f"{self.datatype_name}({self.character_size})"
+
+    def _datatype_convert_to_mssql(self) -> MsSQLBinary | MsSQLVarbinary:
+        size = self.character_size
+        if self.datatype_name == "binary" and size is not None and size <= 8000:
+            return MsSQLBinary(character_size=size)
+        elif self.datatype_name == "varbinary" and size is not None and size <= 8000:
+            return MsSQLVarbinary(character_size=size)
+        else:
+            return MsSQLVarbinary(character_size=-1)
+
+    def _datatype_convert_to_mysql(self) -> MySQLBinary | MySQLVarbinary | MySQLOtherBlob:
+        size = self.character_size
+        if self.datatype_name == "binary" and size is not None and size <= 255:
+            return MySQLBinary(character_size=size)
+        elif self.datatype_name != "blob" and size is not None and size <= 65532:
+            return MySQLVarbinary(character_size=size)
+        else:
+            return MySQLOtherBlob(datatype_name="longblob")
+
+
+class SQLiteInteger(Datatype):
+
+    def __init__(
+            self, datatype_name: Literal["integer", "bigint", "int", "mediumint", "smallint", "tinyint", "boolean"]
+    ) -> None:
+        super().__init__()
+        self.datatype_name = datatype_name
+
+    @Datatype.datatype_name.setter
+    def datatype_name(
+            self, new_datatype_name: Literal["integer", "bigint", "int", "mediumint", "smallint", "tinyint", "boolean"]
+    ) -> None:
+        if new_datatype_name not in ["integer", "bigint", "int", "mediumint", "smallint", "tinyint", "boolean"]:
+            self._datatype_name = "integer"
+        else:
+            self._datatype_name = new_datatype_name
+
+    def datatype_format(self) -> str:
+        return f"{self.datatype_name}"
+
+    # every SQLite integer is stored in up to 8 bytes whatever its declared name, so integer maps to bigint
+    def _datatype_convert_to_mssql(self) -> MsSQLInteger:
+        if self.datatype_name == "boolean":
+            return MsSQLInteger(datatype_name="bit")
+        elif self.datatype_name == "tinyint":
+            return MsSQLInteger(datatype_name="smallint")
+        elif self.datatype_name in ["int", "mediumint"]:
+            return MsSQLInteger(datatype_name="int")
+        elif self.datatype_name == "smallint":
+            return MsSQLInteger(datatype_name="smallint")
+        else:
+            return MsSQLInteger(datatype_name="bigint")
+
+    def _datatype_convert_to_mysql(self) -> MySQLInteger:
+        if self.datatype_name == "boolean":
+            return MySQLInteger(datatype_name="tinyint")
+        elif self.datatype_name == "integer":
+            return MySQLInteger(datatype_name="bigint")
+        else:
+            return MySQLInteger(datatype_name=self.datatype_name)
+
+
+class SQLiteReal(Datatype):
+
+    def __init__(self, datatype_name: Literal["real", "double", "float"]) -> None:
+        super().__init__()
+        self.datatype_name = datatype_name
+
+    @Datatype.datatype_name.setter
+    def datatype_name(self, new_datatype_name: Literal["real", "double", "float"]) -> None:
+        if new_datatype_name not in ["real", "double", "float"]:
+            self._datatype_name = "real"
+        else:
+            self._datatype_name = new_datatype_name
+
+    def datatype_format(self) -> str:
+        return f"{self.datatype_name}"
+
+    # a SQLite real is always an 8 byte float
+    def _datatype_convert_to_mssql(self) -> MsSQLFloat:
+        return MsSQLFloat(datatype_name="float")
+
+    def _datatype_convert_to_mysql(self) -> MySQLFloat:
+        return MySQLFloat(datatype_name="double")
+
+
+class SQLiteNumeric(Datatype):
+
+    def __init__(self, datatype_name: Literal["numeric", "decimal"], numeric_precision: Optional[int] = None,
+                 numeric_scale: Optional[int] = None) -> None:
+        super().__init__()
+        self.datatype_name = datatype_name
+        self.numeric_precision = numeric_precision
+        self.numeric_scale = numeric_scale
+
+    @Datatype.datatype_name.setter
+    def datatype_name(self, new_datatype_name: Literal["numeric", "decimal"]) -> None:
+        if new_datatype_name not in ["numeric", "decimal"]:
+            self._datatype_name = "numeric"
+        else:
+            self._datatype_name = new_datatype_name
+
+    @property
+    def numeric_precision(self) -> Optional[int]:
+        return self._numeric_precision
+
+    @numeric_precision.setter
+    def numeric_precision(self, new_precision: Optional[int]) -> None:
+        if not isinstance(new_precision, int) or new_precision <= 0:
+            self._numeric_precision = None
+        else:
+            self._numeric_precision = new_precision
+
+    @property
+    def numeric_scale(self) -> Optional[int]:
+        return self._numeric_scale
+
+    @numeric_scale.setter
+    def numeric_scale(self, new_scale: Optional[int]) -> None:
+        if self.numeric_precision is None:
+            self._numeric_scale = None
+        elif not isinstance(new_scale, int) or new_scale < 0 or new_scale > self.numeric_precision:
+            self._numeric_scale = 0
+        else:
+            self._numeric_scale = new_scale
+
+    def datatype_format(self) -> str:
+        if self.numeric_precision is None:
+            return f"{self.datatype_name}"
+        else:
+            return f"{self.datatype_name}({self.numeric_precision}, {self.numeric_scale})"
+
+    # a numeric declared without a precision takes any value, so it gets the widest decimal with a scale of 10
+    def _datatype_convert_to_mssql(self) -> MsSQLNumeric:
+        if self.numeric_precision is None:
+            return MsSQLNumeric(datatype_name=self.datatype_name, numeric_precision=38, numeric_scale=10)
+        else:
+            return MsSQLNumeric(
+                datatype_name=self.datatype_name,
+                numeric_precision=min(self.numeric_precision, 38),
+                numeric_scale=min(self.numeric_scale, 38)
+            )
+
+    def _datatype_convert_to_mysql(self) -> MySQLDecimal:
+        if self.numeric_precision is None:
+            return MySQLDecimal(numeric_precision=38, numeric_scale=10)
+        else:
+            return MySQLDecimal(numeric_precision=self.numeric_precision, numeric_scale=self.numeric_scale)
+
+
+class SQLiteDatetime(Datatype):
+
+    def __init__(self, datatype_name: Literal["date", "datetime", "timestamp", "time"],
+                 datetime_precision: Optional[int] = None) -> None:
+        super().__init__()
+        self.datatype_name = datatype_name
+        self.datetime_precision = datetime_precision
+
+    @Datatype.datatype_name.setter
+    def datatype_name(self, new_datatype_name: Literal["date", "datetime", "timestamp", "time"]) -> None:
+        if new_datatype_name not in ["date", "datetime", "timestamp", "time"]:
+            self._datatype_name = "datetime"
+        else:
+            self._datatype_name = new_datatype_name
+
+    @property
+    def datetime_precision(self) -> Optional[int]:
+        return self._datetime_precision
+
+    @datetime_precision.setter
+    def datetime_precision(self, new_datetime_precision: Optional[int]) -> None:
+        if self.datatype_name == "date" or not isinstance(new_datetime_precision, int) \
+                or new_datetime_precision < 0 or new_datetime_precision > 7:
+            self._datetime_precision = None
+        else:
+            self._datetime_precision = new_datetime_precision
+
+    def datatype_format(self) -> str:
+        if self.datetime_precision is None:
+            return f"{self.datatype_name}"
+        else:
+            return f"{self.datatype_name}({self.datetime_precision})"
+
+    def _datatype_convert_to_mssql(self) -> MsSQLDatetimeOne | MsSQLDatetimeTwo:
+        if self.datatype_name == "date":
+            return MsSQLDatetimeOne(datatype_name="date")
+        elif self.datatype_name == "time":
+            return MsSQLDatetimeTwo(datatype_name="time", datetime_precision=self.datetime_precision)
+        else:
+            return MsSQLDatetimeTwo(datatype_name="datetime2", datetime_precision=self.datetime_precision)
+
+    def _datatype_convert_to_mysql(self) -> MySQLDate | MySQLDatetime:
+        if self.datatype_name == "date":
+            return MySQLDate()
+        elif self.datatype_name == "time":
+            return MySQLDatetime(datatype_name="time", datetime_precision=self.datetime_precision)
+        else:
+            return MySQLDatetime(datatype_name="datetime", datetime_precision=self.datetime_precision)
@@ -339,3 +339,102 @@ _mysql_datatype_dictionary: Dict[str, Dict[str, Union[List[str], str]]] = frozen
         'category': "Datetime",
     },
 })
+
+_sqlite_datatype_dictionary: Dict[str, Dict[str, Union[List[str], str]]] = frozendict({
+    'varchar': {
+        'synonyms': ['varchar', 'character varying', 'varying character'],
+        'category': "CharacterString",
+    },
+    'nvarchar': {
+        'synonyms': ['nvarchar', 'national varchar', 'national character varying'],
+        'category': "CharacterString",
+    },
+    'char': {
+        'synonyms': ['char', 'character'],
+        'category': "CharacterString",
+    },
+    'nchar': {
+        'synonyms': ['nchar', 'native character', 'national character'],
+        'category': "CharacterString",
+    },
+    'text': {
+        'synonyms': ['text', 'clob'],
+        'category': "CharacterString",
+    },
+    'blob': {
+        'synonyms': ['blob', ''],
+        'category': "Binary",
+    },
+    'binary': {
+        'synonyms': ['binary'],
+        'category': "Binary",
+    },
+    'varbinary': {
+        'synonyms': ['varbinary'],
+        'category': "Binary",
+    },
+    'integer': {
+        'synonyms': ['integer'],
+        'category': "Numeric",
+    },
+    'bigint': {
+        'synonyms': ['bigint', 'int8', 'unsigned big int'],
+        'category': "Numeric",
+    },
+    'int': {
+        'synonyms': ['int', 'int4'],
+        'category': "Numeric",
+    },
+    'mediumint': {
+        'synonyms': ['mediumint'],
+        'category': "Numeric",
+    },
+    'smallint': {
+        'synonyms': ['smallint', 'int2'],
+        'category': "Numeric",
+    },
+    'tinyint': {
+        'synonyms': ['tinyint'],
+        'category': "Numeric",
+    },
+    'boolean': {
+        'synonyms': ['boolean', 'bool', 'bit'],
+        'category': "Numeric",
+    },
+    'real': {
+        'synonyms': ['real'],
+        'category': "Numeric",
+    },
+    'double': {
+        'synonyms': ['double', 'double precision'],
+        'category': "Numeric",
+    },
+    'float': {
+        'synonyms': ['float'],
+        'category': "Numeric",
+    },
+    'numeric': {
+        'synonyms': ['numeric'],
+        'category': "Numeric",
+    },
+    'decimal': {
+        'synonyms': ['decimal'],
+        'category': "Numeric",
+    },
+    'date': {
+        'synonyms': ['date'],
+        'category': "Datetime",
+    },
+    'datetime': {
+        'synonyms': ['datetime'],
+        'category': "Datetime",
+    },
+    'timestamp': {
+        'synonyms': ['timestamp'],
+        'category': "Datetime",
+    },
+    'time': {
+        'synonyms': ['time'],
+        'category': "Datetime",
+    },
+})
@@ -1,16 +1,40 @@
 # type: ignore
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass, field, InitVar
-from typing import Optional
+from functools import cached_property, lru_cache, wraps
+from logging import getLogger
+from queue import Empty, Queue
+from math import ceil
+from random import Random
+from time import perf_counter, sleep
+from typing import Callable, Iterator, Optional
 from sys import modules
-import pyodbc
+from sql_system_transfer.lazy import lazy_import
 from sql_system_transfer.system import SQLSystem, SQLSystemError
 import sql_system_transfer.statements as sql_st
 import sql_system_transfer.datatype as sql_dt
+from sql_system_transfer.report import TransferReport, report_merge
+from sql_system_transfer.retry import RetryPolicy, error_connection, error_transient
+from sql_system_transfer.scheduler import TransferTask, partition_ranges, schedule_order, schedule_waves, \
+    table_cost, table_partition_count
 
 
+# the driver manager, the thread pool and the plan and verify modules are imported on first use
+pyodbc = lazy_import("pyodbc")
+cf = lazy_import("concurrent.futures")
+sql_pl = lazy_import("sql_system_transfer.planner")
+sql_vf = lazy_import("sql_system_transfer.verify")
+sql_lt = lazy_import("sql_system_transfer.sqlite")
+sql_ev = lazy_import("sql_system_transfer.events")
+sql_pf = lazy_import("sql_system_transfer.profiler")
+
 dbc = modules[__name__]
+logger = getLogger("sql_system_transfer")
+
+# SQL Server's CONCAT takes at most 254 arguments, wider checksum rows are concatenated in nested groups
+CHECKSUM_CONCAT_ARGUMENTS = 100
 
 
 class SQLTableError(Exception):
@@ -21,6 +45,28 @@ class SQLDriverError(Exception):
     pass
 
 
+class SQLWriteModeError(Exception):
+    pass
+
+
+@lru_cache(maxsize=None)
+def engine_driver_installed(driver: str) -> bool:
+    # pyodbc.drivers() asks the driver manager to read odbcinst.ini, so it is checked once per driver per process
+    installed = driver.replace("{", "").replace("}", "") in pyodbc.drivers()
+    if installed:
+        logger.info(f"{driver} driver installed")
+    return installed
+
+
+@lru_cache(maxsize=None)
+def engine_errors() -> tuple:
+    # the errors a database call raises, the SQLite backend runs without pyodbc and the ODBC driver manager installed
+    try:
+        return pyodbc.Error, sql_lt.SQLiteError
+    except ImportError:
+        return (sql_lt.SQLiteError,)
+
+
 @dataclass(kw_only=True, frozen=True)
 class Engine:
     system: SQLSystem
@@ -30,42 +76,350 @@ class Engine:
     pwd: Optional[str] = field(default=None)
     trusted_connection: str = field(default=None)
     autocommit: bool = field(default=True)
-    connection: pyodbc.Connection = field(init=False, repr=False)
-    statements: sql_st.Statements = field(init=False, repr=False)
-    database_object: Database = field(init=False, repr=False)
+    connection_factory: Optional[Callable[[Engine], pyodbc.Connection]] = field(default=None, repr=False, compare=False)
+    hooks: tuple = field(default=(), repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self._engine_system_error()
-        object.__setattr__(self, "connection", pyodbc.connect(**self._connection_dict()))
-        object.__setattr__(self, "statements", getattr(sql_st, f"{self.system.system_abbreviation()}Statements")())
-        object.__setattr__(self, "database_object", self._initialize_database())
 
-    def engine_transfer_tables(self, tables: list, engine: Engine) -> None:
+    # the connection and the catalog are opened on first use, so an Engine is cheap to construct
+    @cached_property
+    def connection(self) -> pyodbc.Connection:
+        return self._engine_connect()
+
+    @cached_property
+    def statements(self) -> sql_st.Statements:
+        return getattr(sql_st, f"{self.system.system_abbreviation()}Statements")()
+
+    @cached_property
+    def database_object(self) -> Database:
+        return self._initialize_database()
+
+    def engine_transfer_tables(self, tables: list, engine: Engine, write_mode: str = "replace",
+                               watermarks: Optional[dict] = None, keys: Optional[dict] = None,
+                               page_size: Optional[int] = None, batch_size: int = 1000,
+                               columns: Optional[dict] = None, predicates: Optional[dict] = None,
+                               workers: int = 1, split_threshold: Optional[int] = None, indexes: bool = True,
+                               fast_load: bool = False, retries: int = 0, profile: bool = False,
+                               profile_memory: bool = False, profile_directory: str = "profiles") -> TransferReport:
+        start, report = perf_counter(), TransferReport()
+        watermarks, keys, columns, predicates = self._engine_table_options(
+            tables=tables, write_mode=write_mode, watermarks=watermarks, keys=keys, columns=columns,
+            predicates=predicates
+        )
         old_cursor = self.connection.cursor()
         new_cursor = engine.connection.cursor()
-        old_tables = self.database_object.database_table_convert_old(tables=tables)
-        new_tables = self.database_object.database_table_convert_new(tables=tables, convert_to_system=engine.system)
+        prepared, skipped = self._engine_table_tasks(
+            tables=tables, engine=engine, old_cursor=old_cursor, new_cursor=new_cursor, write_mode=write_mode,
+            watermarks=watermarks, keys=keys, columns=columns, predicates=predicates, split_threshold=split_threshold
+        )
+        for table_name, reason in skipped.items():
+            report.report_skip(table_name=table_name, reason=reason)
+        tasks = [task for _, _, _, table_tasks in prepared for task in table_tasks]
+        for table_name, count in Counter([task.table_name for task in tasks]).items():
+            report.report_expect(table_name=table_name, tasks=count)
+        for table_name, table_rows in {task.table_name: task.old_table.table_rows for task in tasks}.items():
+            self._engine_event(phase="estimate", table_name=table_name, rows=table_rows or 0)
+        options = {
+            'page_size': page_size,
+            'batch_size': batch_size,
+            'fast_load': fast_load,
+            'retry': RetryPolicy(retries=retries) if retries > 0 else None,
+            'report': report,
+            'profiler': sql_pf.TableProfiler(directory=profile_directory, memory=profile_memory) if profile else None
+        }
+        restore_statements = engine._fast_load_database(cursor=new_cursor) if fast_load else []
+        try:
+            # profiled tables run one at a time: tracemalloc traces every thread, and from Python 3.12 only one cProfile
+            # profiler can be active in the process
+            if workers > 1 and len(tasks) > 1 and not profile:
+                self._transfer_tasks_parallel(engine=engine, tasks=tasks, workers=workers, options=options)
+            else:
+                self._engine_event(phase="worker_start")
+                ordered = schedule_order(tasks)
+                try:
+                    for index, task in enumerate(ordered):
+                        self._engine_event(phase="task", table_name=task.table_name, partition=task.partition,
+                                           queued=len(ordered) - index - 1)
+                        new_cursor = self._transfer_task(
+                            engine=engine, task=task, old_cursor=old_cursor, new_cursor=new_cursor, **options
+                        )
+                finally:
+                    self._engine_event(phase="worker_stop")
+        except Exception as error:
+            # the tables left unfinished are failed too, and the report goes up with the error, e.g. to the CLI
+            for table in report.report_unfinished():
+                report.report_fail(table_name=table.table_name, reason=f"not finished - {error}")
+            report.seconds = perf_counter() - start
+            error.report = report
+            raise
+        finally:
+            self._restore_statements(cursor=new_cursor, statements=restore_statements)
+            if profile:
+                options['profiler'].profiler_write()
+        old_cursor.close()
+        new_cursor.close()
+        if new_cursor.connection is not engine.connection:
+            new_cursor.connection.close()
+        if indexes:
+            failures = engine._create_indexes(
+                tables={task.table_name: task.new_table for task in tasks if task.created}, workers=workers
+            )
+            for table_name, reasons in failures.items():
+                for reason in reasons:
+                    self._engine_warning(report=report, table_name=table_name, reason=reason)
+        report.seconds = perf_counter() - start
+        return report
+
+    def engine_plan_tables(self, tables: list, engine: Engine, write_mode: str = "replace",
+                           watermarks: Optional[dict] = None, keys: Optional[dict] = None,
+                           page_size: Optional[int] = None, batch_size: int = 1000,
+                           columns: Optional[dict] = None, predicates: Optional[dict] = None,
+                           workers: int = 1, split_threshold: Optional[int] = None, indexes: bool = True,
+                           fast_load: bool = False, rows_per_second: Optional[float] = None) -> sql_pl.TransferPlan:
+        rows_per_second = sql_pl.DEFAULT_ROWS_PER_SECOND if rows_per_second is None else rows_per_second
+        watermarks, keys, columns, predicates = self._engine_table_options(
+            tables=tables, write_mode=write_mode, watermarks=watermarks, keys=keys, columns=columns,
+            predicates=predicates
+        )
+        old_cursor = self.connection.cursor()
+        new_cursor = engine.connection.cursor()
+        prepared, skipped = self._engine_table_tasks(
+            tables=tables, engine=engine, old_cursor=old_cursor, new_cursor=new_cursor, write_mode=write_mode,
+            watermarks=watermarks, keys=keys, columns=columns, predicates=predicates, split_threshold=split_threshold,
+            execute=False
+        )
+        tasks, plans = [], []
+        for old, new, statements, table_tasks in prepared:
+            table_name = old.table_format(database=self.database)
+            tasks.extend(table_tasks)
+            plans.append(sql_pl.table_plan(
+                tasks=table_tasks,
+                new_table_name=new.table_format(database=engine.database),
+                statements=statements,
+                index_statements=new.statement_create_indexes(database=engine.database) if indexes and statements else [],
+                predicate=predicates.get(table_name),
+                watermark=watermarks.get(table_name),
+                page_size=page_size,
+                batch_size=batch_size,
+                fast_load=fast_load,
+                rows_per_second=rows_per_second
+            ))
+        old_cursor.close()
+        new_cursor.close()
+        return sql_pl.TransferPlan(
+            tables=plans,
+            skipped=skipped,
+            workers=workers,
+            rows_per_second=rows_per_second,
+            estimated_seconds=sql_pl.plan_makespan(tasks=tasks, workers=workers, rows_per_second=rows_per_second)
+        )
+
+    def engine_verify_tables(self, tables: list, engine: Engine, keys: Optional[dict] = None,
+                             columns: Optional[dict] = None, predicates: Optional[dict] = None, workers: int = 4,
+                             split_threshold: Optional[int] = 256 * 1024 ** 2) -> list[sql_vf.TableVerification]:
+        columns = {} if columns is None else columns
+        keys = {**self.database_object.database_table_keys(tables=tables, columns=columns), **({} if keys is None else keys)}
+        predicates = {} if predicates is None else predicates
+        old_cursor = self.connection.cursor()
+        old_tables = self.database_object.database_table_convert_old(tables=tables, columns=columns)
+        new_tables = self.database_object.database_table_convert_new(
+            tables=tables, convert_to_system=engine.system, columns=columns
+        )
+        tasks = []
         for old, new in zip(old_tables, new_tables):
-            try:
-                self._transfer_table(
-                    engine=engine,
-                    old_table=old,
-                    new_table=new,
-                    old_cursor=old_cursor,
-                    new_cursor=new_cursor
-                )
-            except SQLTableError:
-                print(f"{old.table} must have table type BASE TABLE")
+            table_name = old.table_format(database=self.database)
+            tasks.extend(self._table_tasks(
+                old_table=old, new_table=new, old_cursor=old_cursor, keys=keys.get(table_name),
+                columns=columns.get(table_name),
+                predicates=[] if predicates.get(table_name) is None else [predicates[table_name]],
+                split_threshold=split_threshold
+            ))
         old_cursor.close()
+        queue = Queue()
+        for task in schedule_order(tasks):
+            queue.put(task)
+        results, workers = [], max(1, min(workers, len(tasks)))
+        with cf.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._verify_worker, engine, queue) for _ in range(workers)]
+        for future in futures:
+            results.extend(future.result())
+        return [
+            sql_vf.TableVerification(
+                table_name=table_name,
+                chunks=sorted(
+                    [result for result in results if result.table_name == table_name],
+                    key=lambda result: -1 if result.partition is None else result.partition
+                )
+            )
+            for table_name in dict.fromkeys([task.table_name for task in tasks])
+        ]
+
+    def engine_sample_tables(self, tables: list, engine: Engine, sample_size: int = 1000, keys: Optional[dict] = None,
+                             columns: Optional[dict] = None, workers: int = 4, confidence: float = 0.95,
+                             seed: Optional[int] = None) -> list[sql_vf.SampleVerification]:
+        columns = {} if columns is None else columns
+        keys = {**self.database_object.database_table_keys(tables=tables, columns=columns), **({} if keys is None else keys)}
+        old_tables = self.database_object.database_table_convert_old(tables=tables, columns=columns)
+        new_tables = self.database_object.database_table_convert_new(
+            tables=tables, convert_to_system=engine.system, columns=columns
+        )
+        samples = []
+        for old, new in zip(old_tables, new_tables):
+            table_name = old.table_format(database=self.database)
+            if not keys.get(table_name):
+                logger.warning(f"{table_name} must have key columns to be sampled")
+                continue
+            samples.append((old, new, keys[table_name]))
+        rng = Random(seed)
+        seeds = [rng.random() for _ in samples]
+        with cf.ThreadPoolExecutor(max_workers=max(1, min(workers, len(samples)))) as executor:
+            futures = [
+                executor.submit(self._sample_table, engine, old, new, table_keys, sample_size, confidence, table_seed)
+                for (old, new, table_keys), table_seed in zip(samples, seeds)
+            ]
+        return [future.result() for future in futures]
+
+    def engine_migrate_database(self, engine: Engine, workers: int = 4, keys: Optional[dict] = None,
+                                page_size: Optional[int] = None, batch_size: int = 1000,
+                                split_threshold: Optional[int] = None, retries: int = 0) -> TransferReport:
+        tables = [
+            table.table_format(database=self.database)
+            for table in self.database_object.database_tables
+            if table.table_type == 'BASE TABLE'
+        ]
+        waves = schedule_waves(self.database_object.database_table_dependencies(tables=tables))
+        old_tables = self.database_object.database_table_convert_old(tables=tables)
+        new_tables = self.database_object.database_table_convert_new(tables=tables, convert_to_system=engine.system)
+        new_tables = {old.table_format(database=self.database): new for old, new in zip(old_tables, new_tables)}
+        new_cursor = engine.connection.cursor()
+        for wave in reversed(waves):
+            for table in wave:
+                new_cursor.execute(new_tables[table].statement_drop_table(database=engine.database))
+        reports = [
+            self.engine_transfer_tables(
+                tables=wave, engine=engine, keys=keys, page_size=page_size, batch_size=batch_size, workers=workers,
+                split_threshold=split_threshold, retries=retries
+            )
+            for wave in waves
+        ]
+        report = report_merge(reports)
+        for table_name, reason in self.database_object.database_skipped_tables.items():
+            report.report_skip(table_name=table_name, reason=reason)
+        for table in self.database_object.database_tables:
+            if table.table_type != 'BASE TABLE':
+                report.report_skip(table_name=table.table_format(database=self.database),
+                                   reason=f"table type {table.table_type} is not BASE TABLE")
+        for table_name, table in new_tables.items():
+            for statement in table.statement_add_foreign_keys(database=engine.database):
+                try:
+                    new_cursor.execute(statement)
+                except engine_errors() as error:
+                    self._engine_warning(report=report, table_name=table_name,
+                                         reason=f"foreign key could not be added - {statement} - {error}")
         new_cursor.close()
+        return report
+
+    def _fast_load_database(self, cursor: pyodbc.Cursor) -> list[str]:
+        statement = self.statements.statement_recovery_model(database=self.database)
+        if statement is None:
+            return []
+        cursor.execute(statement, *self.statements.parameters_recovery_model(database=self.database))
+        recovery_model = cursor.fetchone()[0]
+        if recovery_model != "FULL":
+            return []
+        try:
+            cursor.execute(self.statements.statement_set_recovery_model(database=self.database, recovery_model="BULK_LOGGED"))
+        except engine_errors():
+            logger.warning(f"{self.database} recovery model could not be set to BULK_LOGGED")
+            return []
+        return [self.statements.statement_set_recovery_model(database=self.database, recovery_model=recovery_model)]
+
+    def _create_indexes(self, tables: dict[str, Table], workers: int = 1) -> dict[str, list[str]]:
+        # the reasons of the primary keys and indexes that could not be created, per table name
+        if workers > 1 and len(tables) > 1:
+            with cf.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {table_name: executor.submit(self._create_table_indexes, table)
+                           for table_name, table in tables.items()}
+            failures = {table_name: future.result() for table_name, future in futures.items()}
+        else:
+            cursor = self.connection.cursor()
+            failures = {table_name: self._create_table_indexes(table=table, cursor=cursor)
+                        for table_name, table in tables.items()}
+            cursor.close()
+        return {table_name: reasons for table_name, reasons in failures.items() if reasons}
+
+    def _create_table_indexes(self, table: Table, cursor: Optional[pyodbc.Cursor] = None) -> list[str]:
+        connection = self._engine_connect() if cursor is None else None
+        index_cursor = connection.cursor() if cursor is None else cursor
+        reasons = []
+        try:
+            for statement in table.statement_create_indexes(database=self.database):
+                try:
+                    index_cursor.execute(statement)
+                except engine_errors() as error:
+                    reasons.append(f"index could not be created - {statement} - {error}")
+        finally:
+            if connection is not None:
+                index_cursor.close()
+                connection.close()
+        return reasons
+
+    def _engine_warning(self, report: TransferReport, table_name: str, reason: str) -> None:
+        # a transferred table that misses a primary key, index or foreign key: logged, reported and an error event
+        logger.warning(f"{table_name} {reason}")
+        report.report_warn(table_name=table_name, reason=reason)
+        self._engine_event(phase="error", table_name=table_name)
 
     def _engine_system_error(self) -> None:
         if not isinstance(self.system, SQLSystem):
             raise SQLSystemError("Not a valid SQL System.")
-        elif self.system.system_driver().replace("{", "").replace("}", "") not in pyodbc.drivers():
+
+    def _engine_driver_error(self) -> None:
+        if not engine_driver_installed(self.system.system_driver()):
             raise SQLDriverError(f"{self.system} must have driver - {self.system.system_driver()} on your system.")
+
+    @staticmethod
+    def _engine_write_mode_error(tables: list, write_mode: str, watermarks: dict, keys: dict,
+                                 columns: Optional[dict] = None) -> None:
+        columns = {} if columns is None else columns
+        if write_mode not in ["replace", "append", "upsert"]:
+            raise SQLWriteModeError("write_mode must be one of: replace, append, upsert")
+        elif write_mode == "replace" and watermarks:
+            raise SQLWriteModeError("watermarks require write_mode append or upsert")
+        for table in tables:
+            if write_mode == "upsert" and not keys.get(table):
+                raise SQLWriteModeError(f"{table} must have key columns for write_mode upsert")
+            if table in columns:
+                required = [*keys.get(table, []), *([watermarks[table]] if table in watermarks else [])]
+                missing = [column for column in required if column not in columns[table]]
+                if missing:
+                    raise SQLWriteModeError(f"{table} column list must include: {', '.join(missing)}")
+
+    def _engine_connect(self) -> pyodbc.Connection:
+        start = perf_counter()
+        if self.connection_factory is not None:
+            connection = self.connection_factory(self)
+        elif self.system.system_driver() is None:
+            # SQLite goes through the sqlite3 module, server is the database file and database the schema, e.g. main
+            connection = sql_lt.sqlite_connect(database=self.server, autocommit=self.autocommit)
         else:
-            print(f"{self.system} system requirements successful - {self.system.system_driver()} installed.")
+            self._engine_driver_error()
+            connection = pyodbc.connect(**self._connection_dict())
+        self._engine_event(phase="connect", seconds=perf_counter() - start)
+        return connection
+
+    def _engine_event(self, phase: str, seconds: float = 0.0, table_name: Optional[str] = None,
+                      partition: Optional[int] = None, rows: int = 0, bytes: Optional[int] = None,
+                      queued: Optional[int] = None) -> None:
+        if not self.hooks:
+            return
+        event = sql_ev.TransferEvent(
+            phase=phase, seconds=seconds, database=self.database, table_name=table_name, partition=partition,
+            rows=rows, bytes=bytes, queued=queued
+        )
+        for hook in self.hooks:
+            hook(event)
 
     def _connection_dict(self) -> dict:
         return {
@@ -79,57 +433,654 @@ class Engine:
         }
 
     def _initialize_database(self) -> Database:
+        start = perf_counter()
         database = Database(system=self.system, database=self.database)
         tables = self._table_information_schema()
+        cursor = self.connection.cursor()
         for table in tables:
             try:
-                columns = self._column_information_schema(table=table.get("table"), schema=table.get("schema"))
+                columns = self._column_information_schema(
+                    table=table.get("table"), schema=table.get("schema"), cursor=cursor
+                )
                 database.add_table_to_database(table=table, columns=columns)
-            except sql_dt.SQLDatatypeError:
-                print(f"{table} has a unsupported datatype")
+            except sql_dt.SQLDatatypeError as error:
+                database.add_skipped_table(table=table, reason=f"unsupported datatype - {error}")
+        cursor.close()
+        self._engine_event(phase="catalog", seconds=perf_counter() - start, rows=len(database.database_tables))
         return database
 
-    def _transfer_table(self, engine: Engine, old_table: Table, new_table: Table, old_cursor: pyodbc.Cursor,
-                        new_cursor: pyodbc.Cursor) -> None:
-        if old_table.table_type != 'BASE TABLE':
-            raise SQLTableError("table_type must be BASE TABLE")
-
-        select_statement = old_table.statement_select_table(database=self.database)
-        drop_statement = new_table.statement_drop_table(database=engine.database)
-        create_statement = new_table.statement_create_table(database=engine.database)
-        insert_statement = new_table.statement_insert_table(database=engine.database)
-        old_cursor.execute(select_statement)
-        new_cursor.execute(drop_statement)
-        new_cursor.execute(create_statement)
-        row = old_cursor.fetchone()
-        while row:
-            new_cursor.execute(insert_statement, *row)
-            row = old_cursor.fetchone()
+    def _engine_table_options(self, tables: list, write_mode: str = "replace", watermarks: Optional[dict] = None,
+                              keys: Optional[dict] = None, columns: Optional[dict] = None,
+                              predicates: Optional[dict] = None) -> tuple[dict, dict, dict, dict]:
+        watermarks = {} if watermarks is None else watermarks
+        columns = {} if columns is None else columns
+        keys = {**self.database_object.database_table_keys(tables=tables, columns=columns), **({} if keys is None else keys)}
+        predicates = {} if predicates is None else predicates
+        self._engine_write_mode_error(
+            tables=tables, write_mode=write_mode, watermarks=watermarks, keys=keys, columns=columns
+        )
+        return watermarks, keys, columns, predicates
+
+    def _engine_table_tasks(self, tables: list, engine: Engine, old_cursor: pyodbc.Cursor, new_cursor: pyodbc.Cursor,
+                            write_mode: str, watermarks: dict, keys: dict, columns: dict, predicates: dict,
+                            split_threshold: Optional[int] = None,
+                            execute: bool = True) -> tuple[list[tuple[Table, Table, list[str], list[TransferTask]]], dict]:
+        # shared by transfer and plan, the plan lists the DDL that the transfer executes
+        old_tables = self.database_object.database_table_convert_old(tables=tables, columns=columns)
+        new_tables = self.database_object.database_table_convert_new(
+            tables=tables, convert_to_system=engine.system, columns=columns
+        )
+        found = [old.table_format(database=self.database) for old in old_tables]
+        skipped = {
+            table_name: self.database_object.database_skipped_tables.get(table_name, "not found in the catalog")
+            for table_name in tables if table_name not in found
+        }
+        prepared = []
+        for old, new in zip(old_tables, new_tables):
+            table_name = old.table_format(database=self.database)
+            if old.table_type != 'BASE TABLE':
+                skipped[table_name] = f"table type {old.table_type} is not BASE TABLE"
+                continue
+            statements = engine._table_statements(table=new, cursor=new_cursor, write_mode=write_mode)
+            table_predicates, parameters = [] if predicates.get(table_name) is None else [predicates[table_name]], []
+            if execute:
+                table_predicates, parameters = self._transfer_table(
+                    engine=engine, new_table=new, new_cursor=new_cursor, table_name=table_name,
+                    statements=statements, predicates=table_predicates, watermark=watermarks.get(table_name)
+                )
+            table_tasks = self._table_tasks(
+                old_table=old, new_table=new, old_cursor=old_cursor, write_mode=write_mode,
+                keys=keys.get(table_name), columns=columns.get(table_name), predicates=table_predicates,
+                parameters=parameters, split_threshold=split_threshold, created=bool(statements)
+            )
+            prepared.append((old, new, list(statements.values()), table_tasks))
+        return prepared, skipped
+
+    def _table_statements(self, table: Table, cursor: pyodbc.Cursor, write_mode: str = "replace") -> dict[str, str]:
+        if write_mode == "replace":
+            return {
+                "drop": table.statement_drop_table(database=self.database),
+                "create": table.statement_create_table(database=self.database)
+            }
+        elif not self._table_exists(table=table, cursor=cursor):
+            return {"create": table.statement_create_table(database=self.database)}
+        return {}
+
+    def _transfer_table(self, engine: Engine, new_table: Table, new_cursor: pyodbc.Cursor, table_name: str,
+                        statements: dict[str, str], predicates: list,
+                        watermark: Optional[str] = None) -> tuple[list, list]:
+        predicates, parameters = [*predicates], []
+        for phase, statement in statements.items():
+            start = perf_counter()
+            new_cursor.execute(statement)
+            self._engine_event(phase=phase, seconds=perf_counter() - start, table_name=table_name)
+        if not statements and watermark is not None:
+            new_cursor.execute(new_table.statement_select_max(database=engine.database, column_name=watermark))
+            high_watermark = new_cursor.fetchone()[0]
+            if high_watermark is not None:
+                predicates.append(f"{watermark} > ?")
+                parameters.append(high_watermark)
+        return predicates, parameters
+
+    def _table_tasks(self, old_table: Table, new_table: Table, old_cursor: pyodbc.Cursor, write_mode: str = "replace",
+                     keys: Optional[list] = None, columns: Optional[list] = None, predicates: Optional[list] = None,
+                     parameters: Optional[list] = None, split_threshold: Optional[int] = None,
+                     created: bool = True) -> list[TransferTask]:
+        predicates = [] if predicates is None else predicates
+        parameters = [] if parameters is None else parameters
+        cost = table_cost(old_table)
+        ranges = [(None, None)]
+        partitions = table_partition_count(cost=cost, split_threshold=split_threshold)
+        if partitions > 1 and keys:
+            ranges = self._table_partition_ranges(
+                table=old_table, cursor=old_cursor, column_name=keys[0], partitions=partitions,
+                predicate=self._join_predicates(predicates), parameters=parameters
+            )
+
+        tasks = []
+        for index, (lower, upper) in enumerate(ranges):
+            range_predicates, range_parameters = [*predicates], [*parameters]
+            if lower is not None:
+                range_predicates.append(f"{keys[0]} >= ?")
+                range_parameters.append(lower)
+            if upper is not None:
+                range_predicates.append(f"{keys[0]} < ?")
+                range_parameters.append(upper)
+            tasks.append(TransferTask(
+                table_name=old_table.table_format(database=self.database),
+                old_table=old_table,
+                new_table=new_table,
+                write_mode=write_mode,
+                keys=keys,
+                columns=None if columns is None else [column.column_name for column in old_table.table_columns],
+                predicate=self._join_predicates(range_predicates),
+                parameters=tuple(range_parameters),
+                cost=cost // len(ranges),
+                partition=None if len(ranges) == 1 else index,
+                partitions=len(ranges),
+                created=created
+            ))
+        return tasks
+
+    def _transfer_task(self, engine: Engine, task: TransferTask, old_cursor: pyodbc.Cursor,
+                       new_cursor: pyodbc.Cursor, page_size: Optional[int] = None, batch_size: int = 1000,
+                       fast_load: bool = False, retry: Optional[RetryPolicy] = None,
+                       report: Optional[TransferReport] = None,
+                       profiler: Optional[sql_pf.TableProfiler] = None,
+                       on_batch: Optional[Callable[[], None]] = None) -> pyodbc.Cursor:
+        if profiler is not None:
+            with profiler.profiler_table(table_name=task.table_name):
+                return self._transfer_task(
+                    engine=engine, task=task, old_cursor=old_cursor, new_cursor=new_cursor, page_size=page_size,
+                    batch_size=batch_size, fast_load=fast_load, retry=retry, report=report,
+                    on_batch=profiler.profiler_batch
+                )
+        if task.write_mode == "upsert":
+            insert_statement = task.new_table.statement_upsert_table(database=engine.database, keys=task.keys)
+        else:
+            insert_statement = task.new_table.statement_insert_table(
+                database=engine.database, table_lock=fast_load and task.partitions == 1
+            )
+        settings = self._fast_load_settings(engine=engine, task=task, new_cursor=new_cursor) if fast_load else None
+        new_cursor = self._transfer_session(
+            engine=engine, task=task, new_cursor=new_cursor, fast_load=fast_load, retry=retry
+        )
+        started = perf_counter()
+        try:
+            batches = self._select_table_batches(
+                table=task.old_table,
+                cursor=old_cursor,
+                batch_size=batch_size,
+                predicate=task.predicate,
+                parameters=[*task.parameters],
+                keys=task.keys,
+                page_size=page_size,
+                columns=task.columns
+            )
+            # the first fetch includes the SELECT, its time is also reported as the first row latency
+            first, start, rows_read, rows_written = True, started, 0, 0
+            for rows in batches:
+                rows_read += len(rows)
+                if self.hooks:
+                    seconds = perf_counter() - start
+                    if first:
+                        self._engine_event(phase="first_row", seconds=seconds, table_name=task.table_name,
+                                           partition=task.partition)
+                    self._engine_event(phase="fetch", seconds=seconds, table_name=task.table_name,
+                                       partition=task.partition, rows=len(rows),
+                                       bytes=task.old_table.table_bytes(len(rows)))
+                    first = False
+                new_cursor = self._write_batch(
+                    engine=engine, task=task, new_cursor=new_cursor, insert_statement=insert_statement, rows=rows,
+                    fast_load=fast_load, retry=retry, report=report
+                )
+                rows_written += len(rows)
+                if on_batch is not None:
+                    on_batch()
+                start = perf_counter()
+            table = None if report is None else report.report_task(
+                table_name=task.table_name, started=started, finished=perf_counter(), rows_read=rows_read,
+                rows_written=rows_written, bytes=task.old_table.table_bytes(rows_written)
+            )
+            if table is not None:
+                self._engine_event(phase="table", seconds=table.seconds, table_name=task.table_name,
+                                   rows=table.rows_written, bytes=table.bytes)
+        except engine_errors() as error:
+            self._engine_event(phase="error", seconds=perf_counter() - started, table_name=task.table_name,
+                               partition=task.partition)
+            if report is not None:
+                report.report_fail(table_name=task.table_name, reason=str(error))
+            raise
+        finally:
+            if retry is not None:
+                new_cursor.connection.autocommit = engine.autocommit
+            if fast_load:
+                if getattr(new_cursor, "fast_executemany", None) is not None:
+                    new_cursor.fast_executemany = False
+                self._restore_statements(
+                    cursor=new_cursor, statements=task.new_table.statement_fast_load_restore(
+                        database=engine.database, settings=settings
+                    )
+                )
+        return new_cursor
+
+    @staticmethod
+    def _restore_statements(cursor: pyodbc.Cursor, statements: list[str]) -> None:
+        # restores run in finally blocks, a failed restore is logged so that it does not hide the transfer's own error
+        for statement in statements:
+            try:
+                cursor.execute(statement)
+            except engine_errors() as error:
+                logger.warning(f"fast load setting could not be restored - {statement} - {error}")
+
+    @staticmethod
+    def _fast_load_settings(engine: Engine, task: TransferTask, new_cursor: pyodbc.Cursor) -> Optional[tuple]:
+        # the settings fast load changes are read first, so that the restore puts back what was there before
+        statement = task.new_table.statement_fast_load_settings(database=engine.database)
+        if statement is None:
+            return None
+        return tuple(new_cursor.execute(statement).fetchone() or ()) or None
+
+    @staticmethod
+    def _transfer_session(engine: Engine, task: TransferTask, new_cursor: pyodbc.Cursor, fast_load: bool = False,
+                          retry: Optional[RetryPolicy] = None) -> pyodbc.Cursor:
+        if fast_load:
+            for statement in task.new_table.statement_fast_load(database=engine.database):
+                new_cursor.execute(statement)
+            if getattr(new_cursor, "fast_executemany", None) is not None:
+                new_cursor.fast_executemany = engine.system.system_fast_executemany()
+        if retry is not None:
+            new_cursor.connection.autocommit = False
+        return new_cursor
+
+    def _write_batch(self, engine: Engine, task: TransferTask, new_cursor: pyodbc.Cursor, insert_statement: str,
+                     rows: list, fast_load: bool = False, retry: Optional[RetryPolicy] = None,
+                     report: Optional[TransferReport] = None) -> pyodbc.Cursor:
+        attempt = 0
+        while True:
+            try:
+                start = perf_counter()
+                new_cursor.executemany(insert_statement, rows)
+                write_seconds, commit_seconds = perf_counter() - start, None
+                if retry is not None:
+                    start = perf_counter()
+                    new_cursor.commit()
+                    commit_seconds = perf_counter() - start
+                # the batch is only reported once it is durable, so that a batch replayed after a failed commit counts
+                # its rows once
+                if self.hooks:
+                    self._engine_event(phase="write", seconds=write_seconds, table_name=task.table_name,
+                                       partition=task.partition, rows=len(rows),
+                                       bytes=task.old_table.table_bytes(len(rows)))
+                    if commit_seconds is not None:
+                        self._engine_event(phase="commit", seconds=commit_seconds, table_name=task.table_name,
+                                           partition=task.partition, rows=len(rows))
+                return new_cursor
+            except engine_errors() as error:
+                if retry is None or attempt >= retry.retries or not error_transient(error):
+                    raise
+                attempt += 1
+                if report is not None:
+                    report.report_retry(table_name=task.table_name)
+                self._engine_event(phase="retry", table_name=task.table_name, partition=task.partition, rows=len(rows))
+                sleep(retry.retry_delay(attempt))
+                if error_connection(error):
+                    self._close_connection(new_cursor.connection)
+                    new_cursor = self._transfer_session(
+                        engine=engine, task=task, new_cursor=engine._engine_connect().cursor(), fast_load=fast_load,
+                        retry=retry
+                    )
+                else:
+                    new_cursor.rollback()
+
+    @staticmethod
+    def _close_connection(connection: pyodbc.Connection) -> None:
+        # the connection is already broken, closing it only releases the driver's handle
+        try:
+            connection.close()
+        except engine_errors():
+            pass
+
+    def _transfer_tasks_parallel(self, engine: Engine, tasks: list[TransferTask], workers: int,
+                                 options: Optional[dict] = None) -> None:
+        queue = Queue()
+        for task in schedule_order(tasks):
+            queue.put(task)
+        with cf.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._transfer_worker, engine, queue, options)
+                for _ in range(min(workers, len(tasks)))
+            ]
+        for future in futures:
+            future.result()
+
+    def _transfer_worker(self, engine: Engine, queue: Queue, options: Optional[dict] = None) -> None:
+        options = {} if options is None else options
+        old_connection = self._engine_connect()
+        new_connection = engine._engine_connect()
+        old_cursor = old_connection.cursor()
+        new_cursor = new_connection.cursor()
+        self._engine_event(phase="worker_start")
+        try:
+            while True:
+                try:
+                    task = queue.get_nowait()
+                except Empty:
+                    break
+                self._engine_event(phase="task", table_name=task.table_name, partition=task.partition,
+                                   queued=queue.qsize())
+                new_cursor = self._transfer_task(
+                    engine=engine, task=task, old_cursor=old_cursor, new_cursor=new_cursor, **options
+                )
+        finally:
+            self._engine_event(phase="worker_stop")
+            old_cursor.close()
+            new_cursor.close()
+            old_connection.close()
+            new_connection.close()
+            if new_cursor.connection is not new_connection:
+                new_cursor.connection.close()
+
+    def _verify_worker(self, engine: Engine, queue: Queue) -> list[sql_vf.ChunkVerification]:
+        old_connection = self._engine_connect()
+        new_connection = engine._engine_connect()
+        old_cursor = old_connection.cursor()
+        new_cursor = new_connection.cursor()
+        results = []
+        try:
+            while True:
+                try:
+                    task = queue.get_nowait()
+                except Empty:
+                    break
+                results.append(self._verify_task(engine=engine, task=task, old_cursor=old_cursor, new_cursor=new_cursor))
+        finally:
+            old_cursor.close()
+            new_cursor.close()
+            old_connection.close()
+            new_connection.close()
+        return results
+
+    def _verify_task(self, engine: Engine, task: TransferTask, old_cursor: pyodbc.Cursor,
+                     new_cursor: pyodbc.Cursor) -> sql_vf.ChunkVerification:
+        source_rows, target_rows, mismatches = self._verify_range(
+            engine=engine, task=task, old_cursor=old_cursor, new_cursor=new_cursor,
+            predicates=[] if task.predicate is None else [task.predicate], parameters=[*task.parameters]
+        )
+        if mismatches is None:
+            return sql_vf.ChunkVerification(
+                table_name=task.table_name, partition=task.partition, source_rows=source_rows, target_rows=target_rows
+            )
+        missing_keys, extra_keys, changed_keys = mismatches
+        return sql_vf.ChunkVerification(
+            table_name=task.table_name,
+            partition=task.partition,
+            source_rows=source_rows,
+            target_rows=target_rows,
+            matched=False,
+            missing_keys=missing_keys,
+            extra_keys=extra_keys,
+            changed_keys=changed_keys
+        )
+
+    def _verify_range(self, engine: Engine, task: TransferTask, old_cursor: pyodbc.Cursor, new_cursor: pyodbc.Cursor,
+                      predicates: list, parameters: list) -> tuple[int, int, Optional[tuple[list, list, list]]]:
+        # a range whose checksums differ is halved on its integer key until it is small enough to fetch by row
+        predicate = self._join_predicates(predicates)
+        old_cursor.execute(task.old_table.statement_select_checksum(database=self.database, predicate=predicate),
+                           *parameters)
+        source_rows, source_checksum = sql_vf.verify_checksum(old_cursor.fetchone())
+        new_cursor.execute(task.new_table.statement_select_checksum(database=engine.database, predicate=predicate),
+                           *parameters)
+        target_rows, target_checksum = sql_vf.verify_checksum(new_cursor.fetchone())
+        if (source_rows, source_checksum) == (target_rows, target_checksum):
+            return source_rows, target_rows, None
+
+        bounds = None
+        if task.keys and max(source_rows, target_rows) > sql_vf.VERIFY_LEAF_ROWS:
+            bounds = self._verify_bounds(
+                engine=engine, task=task, old_cursor=old_cursor, new_cursor=new_cursor, predicate=predicate,
+                parameters=parameters
+            )
+        if bounds is None:
+            return source_rows, target_rows, self._verify_rows(
+                engine=engine, task=task, old_cursor=old_cursor, new_cursor=new_cursor, predicate=predicate,
+                parameters=parameters
+            )
+        middle = (bounds[0] + bounds[1]) // 2 + 1
+        mismatches: tuple[list, list, list] = ([], [], [])
+        for half in [f"{task.keys[0]} < ?", f"{task.keys[0]} >= ?"]:
+            _, _, half_mismatches = self._verify_range(
+                engine=engine, task=task, old_cursor=old_cursor, new_cursor=new_cursor,
+                predicates=[*predicates, half], parameters=[*parameters, middle]
+            )
+            if half_mismatches is not None:
+                mismatches = tuple([
+                    [*keys, *half_keys][0:sql_vf.MAX_MISMATCH_KEYS] for keys, half_keys in zip(mismatches, half_mismatches)
+                ])
+        return source_rows, target_rows, mismatches
+
+    def _verify_bounds(self, engine: Engine, task: TransferTask, old_cursor: pyodbc.Cursor, new_cursor: pyodbc.Cursor,
+                       predicate: Optional[str], parameters: list) -> Optional[tuple[int, int]]:
+        # both sides, as the target can hold keys that the source does not
+        old_cursor.execute(task.old_table.statement_select_range(
+            database=self.database, column_name=task.keys[0], predicate=predicate
+        ), *parameters)
+        new_cursor.execute(task.new_table.statement_select_range(
+            database=engine.database, column_name=task.keys[0], predicate=predicate
+        ), *parameters)
+        values = [value for value in [*old_cursor.fetchone(), *new_cursor.fetchone()] if value is not None]
+        if not values or not all([isinstance(value, int) for value in values]) or min(values) == max(values):
+            return None
+        return min(values), max(values)
+
+    def _verify_rows(self, engine: Engine, task: TransferTask, old_cursor: pyodbc.Cursor, new_cursor: pyodbc.Cursor,
+                     predicate: Optional[str], parameters: list) -> tuple[list, list, list]:
+        old_cursor.execute(
+            task.old_table.statement_select_table(database=self.database, predicate=predicate, columns=task.columns),
+            *parameters
+        )
+        old_rows = old_cursor.fetchall()
+        new_cursor.execute(
+            task.new_table.statement_select_table(database=engine.database, predicate=predicate, columns=task.columns),
+            *parameters
+        )
+        new_rows = new_cursor.fetchall()
+        column_names = [column.column_name for column in task.old_table.table_columns]
+        return sql_vf.verify_rows(
+            old_rows=old_rows, new_rows=new_rows,
+            key_index=None if not task.keys else [column_names.index(key) for key in task.keys],
+            datatype_names=[column.column_datatype() for column in task.old_table.table_columns]
+        )
+
+    def _sample_table(self, engine: Engine, old_table: Table, new_table: Table, keys: list, sample_size: int = 1000,
+                      confidence: float = 0.95, seed: Optional[float] = None) -> sql_vf.SampleVerification:
+        old_connection = self._engine_connect()
+        new_connection = engine._engine_connect()
+        old_cursor = old_connection.cursor()
+        new_cursor = new_connection.cursor()
+        try:
+            sample_keys = self._sample_table_keys(
+                table=old_table, cursor=old_cursor, keys=keys, sample_size=sample_size, rng=Random(seed)
+            )
+            old_datatypes = {column.column_name: column.column_datatype() for column in old_table.table_columns}
+            new_datatypes = {column.column_name: column.column_datatype() for column in new_table.table_columns}
+            old_rows, new_rows = [], []
+            for batch in sql_vf.sample_batches(keys=sample_keys, key_count=len(keys)):
+                parameters = [value for key in batch for value in key]
+                old_cursor.execute(
+                    old_table.statement_select_keys(database=self.database, keys=keys, key_count=len(batch)), *parameters
+                )
+                old_rows.extend(old_cursor.fetchall())
+                new_cursor.execute(
+                    new_table.statement_select_keys(database=engine.database, keys=keys, key_count=len(batch)),
+                    *[
+                        sql_vf.verify_parameter(value, old_datatypes.get(key), new_datatypes.get(key))
+                        for values in batch for key, value in zip(keys, values)
+                    ]
+                )
+                new_rows.extend(new_cursor.fetchall())
+        finally:
+            old_cursor.close()
+            new_cursor.close()
+            old_connection.close()
+            new_connection.close()
+        column_names = [column.column_name for column in old_table.table_columns]
+        missing_keys, _, changed_keys = sql_vf.verify_rows(
+            old_rows=old_rows, new_rows=new_rows, key_index=[column_names.index(key) for key in keys],
+            datatype_names=[column.column_datatype() for column in old_table.table_columns], limit=None
+        )
+        return sql_vf.SampleVerification(
+            table_name=old_table.table_format(database=self.database),
+            samples=len(old_rows),
+            missing_keys=missing_keys,
+            changed_keys=changed_keys,
+            confidence=confidence
+        )
+
+    def _sample_table_keys(self, table: Table, cursor: pyodbc.Cursor, keys: list, sample_size: int,
+                           rng: Random) -> list[tuple]:
+        # random values in the range of an integer first key column are looked up on its index, the other keys are
+        # sampled by the system without sorting the table
+        cursor.execute(table.statement_select_range(database=self.database, column_name=keys[0]))
+        lower, upper = cursor.fetchone()
+        if isinstance(lower, int) and isinstance(upper, int):
+            key_range = upper - lower + 1
+            density = min(1.0, table.table_rows / key_range) if table.table_rows else 1.0
+            candidates = rng.sample(range(lower, upper + 1), min(key_range, ceil(sample_size / max(density, 0.01))))
+            sample_keys = []
+            for batch in sql_vf.sample_batches(keys=[(candidate,) for candidate in candidates], key_count=1):
+                cursor.execute(
+                    table.statement_select_keys(database=self.database, keys=keys[0:1], key_count=len(batch),
+                                                columns=keys),
+                    *[key[0] for key in batch]
+                )
+                sample_keys.extend([tuple(row) for row in cursor.fetchall()])
+            return rng.sample(sample_keys, min(sample_size, len(sample_keys)))
+        # the fraction draws about 1.5 times the sample and the limit is only a cap for stale row counts, so that the
+        # scan is not cut short in the first part of the table
+        fraction = min(1.0, 1.5 * sample_size / table.table_rows) if table.table_rows else 1.0
+        cursor.execute(table.statement_select_sample_keys(
+            database=self.database, keys=keys, sample_size=3 * sample_size, fraction=fraction
+        ))
+        sample_keys = [tuple(row) for row in cursor.fetchall()]
+        return rng.sample(sample_keys, min(sample_size, len(sample_keys)))
+
+    def _table_partition_ranges(self, table: Table, cursor: pyodbc.Cursor, column_name: str, partitions: int,
+                                predicate: Optional[str] = None, parameters: Optional[list] = None) -> list:
+        parameters = [] if parameters is None else parameters
+        statement = table.statement_select_range(database=self.database, column_name=column_name, predicate=predicate)
+        cursor.execute(statement, *parameters)
+        lower, upper = cursor.fetchone()
+        if not isinstance(lower, int) or not isinstance(upper, int):
+            return [(None, None)]
+        return partition_ranges(lower=lower, upper=upper, partitions=partitions)
+
+    @staticmethod
+    def _join_predicates(predicates: list) -> Optional[str]:
+        return " AND ".join([f"({predicate})" for predicate in predicates]) if predicates else None
+
+    def _select_table_batches(self, table: Table, cursor: pyodbc.Cursor, batch_size: int,
+                              predicate: Optional[str] = None, parameters: Optional[list] = None,
+                              keys: Optional[list] = None, page_size: Optional[int] = None,
+                              columns: Optional[list] = None) -> Iterator[list]:
+        parameters = [] if parameters is None else parameters
+        if not keys or page_size is None:
+            statement = table.statement_select_table(database=self.database, predicate=predicate, columns=columns)
+            cursor.execute(statement, *parameters)
+            rows = cursor.fetchmany(batch_size)
+            while rows:
+                yield rows
+                rows = cursor.fetchmany(batch_size)
+            return
+
+        column_names = [column.column_name for column in table.table_columns]
+        key_index = [column_names.index(key) for key in keys]
+        first_statement = table.statement_select_table_page(
+            database=self.database, keys=keys, page_size=page_size, predicate=predicate, columns=columns,
+            first_page=True
+        )
+        next_statement = table.statement_select_table_page(
+            database=self.database, keys=keys, page_size=page_size, predicate=predicate, columns=columns
+        )
+        cursor.execute(first_statement, *parameters)
+        while True:
+            rows = cursor.fetchall()
+            for start in range(0, len(rows), batch_size):
+                yield rows[start:start + batch_size]
+            if len(rows) < page_size:
+                break
+            last_key = [rows[-1][index] for index in key_index]
+            cursor.execute(next_statement, *parameters, *table.table_keyset_parameters(last_key))
+
+    def _table_exists(self, table: Table, cursor: pyodbc.Cursor) -> bool:
+        statement = self.statements.statement_table_exists(database=self.database)
+        parameters = self.statements.parameters_table_exists(
+            database=self.database, table=table.table, table_type="BASE TABLE", schema=table.schema
+        )
+        cursor.execute(statement, *parameters)
+        return cursor.fetchone()[0] > 0
 
     def _table_information_schema(self) -> list:
         tables = []
         cursor = self.connection.cursor()
+        statistics = self._table_statistics(cursor=cursor)
+        foreign_keys = self._table_foreign_keys(cursor=cursor)
+        indexes = self._table_indexes(cursor=cursor)
         statement = self.statements.statement_information_schema_tables(database=self.database)
-        cursor.execute(statement)
+        cursor.execute(statement, *self.statements.parameters_information_schema_tables(database=self.database))
         row = cursor.fetchone()
         while row:
+            schema = None if row[0] == '' else row[0]
             tables.append({
-                'schema': None if row[0] == '' else row[0],
+                'schema': schema,
                 'table': row[1],
                 'table_type': row[2],
+                **statistics.get((schema, row[1]), {}),
+                'table_foreign_keys': foreign_keys.get((schema, row[1]), []),
+                'table_indexes': indexes.get((schema, row[1]), []),
             })
             row = cursor.fetchone()
         cursor.close()
         return tables
 
-    def _column_information_schema(self, table: str, schema: Optional[str] = None) -> list[dict]:
+    def _table_statistics(self, cursor: pyodbc.Cursor) -> dict:
+        statistics = {}
+        statement = self.statements.statement_table_statistics(database=self.database)
+        cursor.execute(statement, *self.statements.parameters_table_statistics(database=self.database))
+        row = cursor.fetchone()
+        while row:
+            statistics[(None if row[0] == '' else row[0], row[1])] = {
+                'table_rows': row[2],
+                'table_data_bytes': row[3],
+                'table_index_bytes': row[4],
+            }
+            row = cursor.fetchone()
+        return statistics
+
+    def _table_foreign_keys(self, cursor: pyodbc.Cursor) -> dict:
+        foreign_keys = {}
+        statement = self.statements.statement_foreign_keys(database=self.database)
+        cursor.execute(statement, *self.statements.parameters_foreign_keys(database=self.database))
+        row = cursor.fetchone()
+        while row:
+            table_foreign_keys = foreign_keys.setdefault((None if row[1] == '' else row[1], row[2]), [])
+            if not table_foreign_keys or table_foreign_keys[-1]['constraint'] != row[0]:
+                table_foreign_keys.append({
+                    'constraint': row[0],
+                    'columns': [],
+                    'referenced_schema': None if row[4] == '' else row[4],
+                    'referenced_table': row[5],
+                    'referenced_columns': [],
+                })
+            table_foreign_keys[-1]['columns'].append(row[3])
+            table_foreign_keys[-1]['referenced_columns'].append(row[6])
+            row = cursor.fetchone()
+        return foreign_keys
+
+    def _table_indexes(self, cursor: pyodbc.Cursor) -> dict:
+        indexes = {}
+        statement = self.statements.statement_indexes(database=self.database)
+        cursor.execute(statement, *self.statements.parameters_indexes(database=self.database))
+        row = cursor.fetchone()
+        while row:
+            table_indexes = indexes.setdefault((None if row[0] == '' else row[0], row[1]), [])
+            if not table_indexes or table_indexes[-1]['index'] != row[2]:
+                table_indexes.append({'index': row[2], 'index_type': row[3], 'columns': []})
+            table_indexes[-1]['columns'].append(row[4])
+            row = cursor.fetchone()
+        return indexes
+
+    def _column_information_schema(self, table: str, schema: Optional[str] = None,
+                                   cursor: Optional[pyodbc.Cursor] = None) -> list[dict]:
         columns = []
-        cursor = self.connection.cursor()
-        statement = self.statements.statement_information_schema_columns(
+        column_cursor = self.connection.cursor() if cursor is None else cursor
+        statement = self.statements.statement_information_schema_columns(database=self.database)
+        parameters = self.statements.parameters_information_schema_columns(
             database=self.database, table=table, schema=schema
         )
-        cursor.execute(statement)
-        row = cursor.fetchone()
+        column_cursor.execute(statement, *parameters)
+        row = column_cursor.fetchone()
         while row:
             columns.append({
                 "column_name": row[0],
@@ -141,8 +1092,9 @@ class Engine:
                 "numeric_scale": row[6],
                 "datetime_precision": row[7]
             })
-            row = cursor.fetchone()
-        cursor.close()
+            row = column_cursor.fetchone()
+        if cursor is None:
+            column_cursor.close()
         return columns
 
 
@@ -151,6 +1103,7 @@ class Database:
     system: SQLSystem
     database: str
     database_tables: list = field(init=False, repr=False, default_factory=list)
+    database_skipped_tables: dict = field(init=False, repr=False, default_factory=dict)
 
     def statement_use_database(self) -> str:
         return f"USE {self.database};"
@@ -161,18 +1114,53 @@ class Database:
     def database_table_parameters(self) -> list:
         return [table.table_parameters() for table in self.database_tables]
 
-    def database_table_convert_old(self, tables: list) -> list[Table]:
+    def database_table_convert_old(self, tables: list, columns: Optional[dict] = None) -> list[Table]:
+        columns = {} if columns is None else columns
         new_tables = self._valid_database_tables(tables=tables)
-        return [table for table in new_tables]
+        return [
+            table if table.table_format(database=self.database) not in columns
+            else table.table_project(columns=columns[table.table_format(database=self.database)])
+            for table in new_tables
+        ]
 
-    def database_table_convert_new(self, tables: list, convert_to_system: SQLSystem) -> list[Table]:
+    def database_table_convert_new(self, tables: list, convert_to_system: SQLSystem,
+                                   columns: Optional[dict] = None) -> list[Table]:
+        columns = {} if columns is None else columns
         new_tables = self._valid_database_tables(tables=tables)
-        return [table.table_convert(convert_to_system=convert_to_system) for table in new_tables]
+        return [
+            table.table_convert(
+                convert_to_system=convert_to_system, columns=columns.get(table.table_format(database=self.database))
+            )
+            for table in new_tables
+        ]
 
     def add_table_to_database(self, table: dict, columns: list) -> None:
         table_object = getattr(dbc, f"{self.system.system_abbreviation()}Table")
         self.database_tables.append(table_object(**table, init_table_columns=columns))
 
+    def add_skipped_table(self, table: dict, reason: str) -> None:
+        table_object = getattr(dbc, f"{self.system.system_abbreviation()}Table")(**table, init_table_columns=[])
+        self.database_skipped_tables[table_object.table_format(database=self.database)] = reason
+
+    def database_table_keys(self, tables: list, columns: Optional[dict] = None) -> dict:
+        columns = {} if columns is None else columns
+        keys = {}
+        for table in self._valid_database_tables(tables=tables):
+            table_name = table.table_format(database=self.database)
+            primary_key = table.table_primary_key()
+            if primary_key and all([key in columns.get(table_name, primary_key) for key in primary_key]):
+                keys[table_name] = primary_key
+        return keys
+
+    def database_table_dependencies(self, tables: list) -> dict:
+        return {
+            table.table_format(database=self.database): {
+                reference for reference in table.table_references(database=self.database)
+                if reference in tables and reference != table.table_format(database=self.database)
+            }
+            for table in self._valid_database_tables(tables=tables)
+        }
+
     def _valid_database_tables(self, tables: list) -> list[Table]:
         return [
             table
@@ -181,14 +1169,42 @@ class Database:
         ]
 
 
+def cached_statement(method: Callable) -> Callable:
+    @wraps(method)
+    def wrapper(self: Table, *args, **kwargs) -> str:
+        statements = self._table_statements()
+        key = (method.__name__, args, tuple(kwargs.items()))
+        try:
+            return statements[key]
+        except KeyError:
+            pass
+        except TypeError:
+            key = (
+                method.__name__,
+                tuple([tuple(arg) if isinstance(arg, list) else arg for arg in args]),
+                tuple([(name, tuple(value) if isinstance(value, list) else value) for name, value in kwargs.items()])
+            )
+            if key in statements:
+                return statements[key]
+        statements[key] = method(self, *args, **kwargs)
+        return statements[key]
+    return wrapper
+
+
 @dataclass(kw_only=True, frozen=True)
 class Table(ABC):
     table: str
     table_type: str
     schema: Optional[str] = field(default=None)
+    table_rows: Optional[int] = field(default=None)
+    table_data_bytes: Optional[int] = field(default=None)
+    table_index_bytes: Optional[int] = field(default=None)
+    table_foreign_keys: list = field(default_factory=list, repr=False)
+    table_indexes: list = field(default_factory=list, repr=False)
     init_table_columns: InitVar[list] = field(default=list)
     table_columns: list = field(init=False, repr=False)
     _system: SQLSystem = field(init=False, repr=False)
+    _statements: dict = field(init=False, repr=False, compare=False, default_factory=dict)
 
     def __post_init__(self, init_table_columns: list) -> None:
         object.__setattr__(self, "table_columns", self._initialize_column_objects(init_table_columns))
@@ -200,38 +1216,233 @@ class Table(ABC):
             'schema': self.schema,
         }
 
+    def _table_statements(self) -> dict:
+        columns = tuple(self.table_columns)
+        if self._statements.get("table_columns") != columns:
+            self._statements.clear()
+            self._statements["table_columns"] = columns
+        return self._statements
+
+    def table_statistics(self) -> dict:
+        return {
+            'table_rows': self.table_rows,
+            'table_data_bytes': self.table_data_bytes,
+            'table_index_bytes': self.table_index_bytes,
+        }
+
+    def table_bytes(self, rows: int) -> Optional[int]:
+        # estimated from the catalog's average row size, the rows themselves are not measured
+        if not self.table_rows or not self.table_data_bytes:
+            return None
+        return self.table_data_bytes * rows // self.table_rows
+
     def table_convert(self, convert_to_system: SQLSystem, **kwargs) -> Table:
         table = kwargs.get("table")
         schema = kwargs.get("schema")
-        columns = [column.column_convert(convert_to_system).column_parameters() for column in self.table_columns]
+        table_columns = self.table_columns if kwargs.get("columns") is None else self._project_columns(kwargs["columns"])
+        columns = [
+            {**column.column_convert(convert_to_system).column_parameters(), "nullable": column.nullable}
+            for column in table_columns
+        ]
+        column_names = [column.column_name for column in table_columns]
         return getattr(dbc, f"{convert_to_system.system_abbreviation()}Table")(
             table=self.table if table is None else table,
             table_type=self.table_type,
             schema=self.schema if schema is None else schema,
+            **self.table_statistics(),
+            table_foreign_keys=[
+                foreign_key for foreign_key in self.table_foreign_keys
+                if all([column in column_names for column in foreign_key['columns']])
+            ],
+            table_indexes=[
+                index for index in self.table_indexes
+                if all([column in column_names for column in index['columns']])
+            ],
             init_table_columns=columns
         )
 
+    def table_project(self, columns: list) -> Table:
+        return self.table_convert(convert_to_system=self._system, columns=columns)
+
     @abstractmethod
     def table_format(self, database: str, alt_table_name: Optional[str] = None) -> str:
         pass
 
+    @abstractmethod
+    def table_reference_format(self, database: str, table: str, schema: Optional[str] = None) -> str:
+        pass
+
+    def table_references(self, database: str) -> list:
+        return [
+            self.table_reference_format(database, foreign_key['referenced_table'], foreign_key['referenced_schema'])
+            for foreign_key in self.table_foreign_keys
+        ]
+
+    def table_primary_key(self) -> Optional[list]:
+        for index in self.table_indexes:
+            if index['index_type'] == 'PRIMARY KEY':
+                return index['columns']
+        return None
+
+    def statement_create_indexes(self, database: str, alt_table_name: Optional[str] = None) -> list[str]:
+        statements = []
+        table_format = self.table_format(database, alt_table_name)
+        for index in self.table_indexes:
+            columns = ', '.join(index['columns'])
+            if index['index_type'] == 'PRIMARY KEY':
+                name = f"PK_{self.table if alt_table_name is None else alt_table_name}" \
+                    if index['index'] == 'PRIMARY' else index['index']
+                statements.append(f"ALTER TABLE {table_format} ADD CONSTRAINT {name} PRIMARY KEY ({columns});")
+            elif index['index_type'] == 'UNIQUE':
+                statements.append(f"CREATE UNIQUE INDEX {index['index']} ON {table_format} ({columns});")
+            else:
+                statements.append(f"CREATE INDEX {index['index']} ON {table_format} ({columns});")
+        return statements
+
+    def statement_add_foreign_keys(self, database: str, alt_table_name: Optional[str] = None) -> list[str]:
+        statements = []
+        for foreign_key in self.table_foreign_keys:
+            references = self.table_reference_format(
+                database, foreign_key['referenced_table'], foreign_key['referenced_schema']
+            )
+            statements.append(
+                f"ALTER TABLE {self.table_format(database, alt_table_name)} ADD CONSTRAINT {foreign_key['constraint']} "
+                f"FOREIGN KEY ({', '.join(foreign_key['columns'])}) "
+                f"REFERENCES {references} ({', '.join(foreign_key['referenced_columns'])});"
+            )
+        return statements
+
+    @cached_statement
     def statement_create_table(self, database: str, alt_table_name: Optional[str] = None) -> str:
         columns = ',\n'.join([column.column_format() for column in self.table_columns])
         statement = f"CREATE TABLE {self.table_format(database, alt_table_name)} (\n\n{columns}\n\n);"
         return statement
 
-    def statement_insert_table(self, database: str, alt_table_name: Optional[str] = None) -> str:
+    @cached_statement
+    def statement_insert_table(self, database: str, alt_table_name: Optional[str] = None,
+                               table_lock: bool = False) -> str:
         q_marks = len(self.table_columns) * "?,"
         columns = ", ".join([column.column_name for column in self.table_columns])
-        statement = f"INSERT INTO {self.table_format(database, alt_table_name)} ({columns}) VALUES ({q_marks[0:-1]});"
+        table_format = f"{self.table_format(database, alt_table_name)}{self._table_lock_hint() if table_lock else ''}"
+        statement = f"INSERT INTO {table_format} ({columns}) VALUES ({q_marks[0:-1]});"
         return statement
 
-    def statement_select_table(self, database: str, alt_table_name: Optional[str] = None) -> str:
-        return f"SELECT * FROM {self.table_format(database, alt_table_name)};"
+    def statement_fast_load(self, database: str, alt_table_name: Optional[str] = None) -> list[str]:
+        return []
+
+    def statement_fast_load_settings(self, database: str) -> Optional[str]:
+        return None
 
+    def statement_fast_load_restore(self, database: str, alt_table_name: Optional[str] = None,
+                                    settings: Optional[tuple] = None) -> list[str]:
+        return []
+
+    def _table_lock_hint(self) -> str:
+        return ""
+
+    @cached_statement
+    def statement_select_table(self, database: str, alt_table_name: Optional[str] = None,
+                               predicate: Optional[str] = None, columns: Optional[list] = None) -> str:
+        where = "" if predicate is None else f" WHERE {predicate}"
+        return f"SELECT {self._select_columns(columns)} FROM {self.table_format(database, alt_table_name)}{where};"
+
+    def statement_select_checksum(self, database: str, alt_table_name: Optional[str] = None,
+                                  predicate: Optional[str] = None) -> str:
+        row = [part for column in self.table_columns
+               for part in [f"COALESCE({self._checksum_column(column)}, '~')", "'|'"]]
+        where = "" if predicate is None else f" WHERE {predicate}"
+        checksum = self._checksum_row(self._checksum_concat(row))
+        return f"SELECT COUNT(*), SUM({checksum}) FROM {self.table_format(database, alt_table_name)}{where};"
+
+    @staticmethod
+    def _checksum_concat(parts: list[str]) -> str:
+        while len(parts) > CHECKSUM_CONCAT_ARGUMENTS:
+            groups = [parts[index:index + CHECKSUM_CONCAT_ARGUMENTS]
+                      for index in range(0, len(parts), CHECKSUM_CONCAT_ARGUMENTS)]
+            # CONCAT needs two arguments, a last group of one is passed on as it is
+            parts = [group[0] if len(group) == 1 else f"CONCAT({', '.join(group)})" for group in groups]
+        return f"CONCAT({', '.join(parts)})"
+
+    @staticmethod
+    def _checksum_float(column_name: str, power: str, exponent: str, mantissa: str) -> str:
+        # floats as a rounded mantissa and an exponent, e.g. 1.234500000000E32, the same text on every system and
+        # without the overflow of a fixed decimal; NULL stays NULL
+        # power, exponent and mantissa are the system's templates for the power of ten and the two casts to text
+        exponent_value = f"FLOOR(LOG10(ABS({column_name})))"
+        mantissa_value = f"ROUND({column_name} / {power.format(exponent_value)}, 12)"
+        return f"CASE WHEN {column_name} = 0 THEN '0' WHEN {column_name} IS NOT NULL " \
+               f"THEN CONCAT({mantissa.format(mantissa_value)}, 'E', {exponent.format(exponent_value)}) END"
+
+    @abstractmethod
+    def _checksum_column(self, column: Column) -> str:
+        pass
+
+    @abstractmethod
+    def _checksum_row(self, row: str) -> str:
+        pass
+
+    def statement_select_max(self, database: str, column_name: str, alt_table_name: Optional[str] = None) -> str:
+        return f"SELECT MAX({column_name}) FROM {self.table_format(database, alt_table_name)};"
+
+    def statement_select_range(self, database: str, column_name: str, alt_table_name: Optional[str] = None,
+                               predicate: Optional[str] = None) -> str:
+        where = "" if predicate is None else f" WHERE {predicate}"
+        return f"SELECT MIN({column_name}), MAX({column_name}) FROM {self.table_format(database, alt_table_name)}{where};"
+
+    def statement_select_keys(self, database: str, keys: list, key_count: int, alt_table_name: Optional[str] = None,
+                              columns: Optional[list] = None) -> str:
+        if len(keys) == 1:
+            where = f"{keys[0]} IN ({', '.join(['?'] * key_count)})"
+        else:
+            key_predicate = f"({' AND '.join([f'{key} = ?' for key in keys])})"
+            where = " OR ".join([key_predicate] * key_count)
+        return f"SELECT {self._select_columns(columns)} FROM {self.table_format(database, alt_table_name)} WHERE {where};"
+
+    @abstractmethod
+    def statement_select_sample_keys(self, database: str, keys: list, sample_size: int, fraction: float = 1.0,
+                                     alt_table_name: Optional[str] = None) -> str:
+        pass
+
+    @abstractmethod
+    def statement_upsert_table(self, database: str, keys: list, alt_table_name: Optional[str] = None) -> str:
+        pass
+
+    @abstractmethod
+    def statement_select_table_page(self, database: str, keys: list, page_size: int,
+                                    alt_table_name: Optional[str] = None, predicate: Optional[str] = None,
+                                    columns: Optional[list] = None, first_page: bool = False) -> str:
+        pass
+
+    @staticmethod
+    def _select_columns(columns: Optional[list] = None) -> str:
+        return "*" if columns is None else ", ".join(columns)
+
+    @staticmethod
+    def table_keyset_parameters(last_key: list) -> list:
+        return [value for index in range(len(last_key)) for value in last_key[0:index + 1]]
+
+    @staticmethod
+    def _keyset_predicate(keys: list, predicate: Optional[str] = None, first_page: bool = False) -> str:
+        predicates = [] if predicate is None else [f"({predicate})"]
+        if not first_page:
+            keyset = []
+            for index, key in enumerate(keys):
+                equals = [f"{previous} = ?" for previous in keys[0:index]]
+                keyset.append(f"({' AND '.join([*equals, f'{key} > ?'])})")
+            predicates.append(f"({' OR '.join(keyset)})")
+        return "" if not predicates else f" WHERE {' AND '.join(predicates)}"
+
+    @cached_statement
     def statement_drop_table(self, database: str, alt_table_name: Optional[str] = None) -> str:
         return f"DROP TABLE IF EXISTS {self.table_format(database, alt_table_name)};"
 
+    def _project_columns(self, columns: list) -> list:
+        table_columns = {column.column_name: column for column in self.table_columns}
+        missing = [column for column in columns if column not in table_columns]
+        if missing:
+            raise SQLTableError(f"{self.table} does not have columns: {', '.join(missing)}")
+        return [table_columns[column] for column in columns]
+
     def _initialize_column_objects(self, columns: list) -> list:
         column_objects = []
         for column in columns:
@@ -253,6 +1464,69 @@ class MsSQLTable(Table):
             alt_table_name = self.table
         return f"{database}.{self.schema}.{alt_table_name}"
 
+    def table_reference_format(self, database: str, table: str, schema: Optional[str] = None) -> str:
+        return f"{database}.{'dbo' if schema is None else schema}.{table}"
+
+    def _table_lock_hint(self) -> str:
+        return " WITH (TABLOCK)"
+
+    def _checksum_column(self, column: Column) -> str:
+        datatype_name, column_name = column.column_datatype(), column.column_name
+        if datatype_name in ["float", "real"]:
+            return self._checksum_float(column_name, power="POWER(CAST(10 AS float), {})", exponent="CAST({} AS int)",
+                                        mantissa="CAST({} AS decimal(15, 12))")
+        elif datatype_name in ["money", "smallmoney", "decimal", "numeric"]:
+            return f"CAST(CAST({column_name} AS decimal(38, 6)) AS varchar(max))"
+        elif datatype_name == "uniqueidentifier":
+            # the hex of the 16 bytes in text order, as a binary(16) target column reads back with HEX
+            return f"REPLACE(CAST({column_name} AS char(36)), '-', '')"
+        elif datatype_name == "date":
+            return f"CONVERT(varchar(10), {column_name}, 120)"
+        elif datatype_name in ["datetime", "smalldatetime", "datetime2", "datetimeoffset"]:
+            return f"CONVERT(varchar(19), {column_name}, 120)"
+        elif datatype_name == "time":
+            return f"CONVERT(varchar(8), {column_name}, 108)"
+        elif datatype_name in ["binary", "varbinary", "image", "timestamp"]:
+            return f"CONVERT(varchar(max), CAST({column_name} AS varbinary(max)), 2)"
+        elif datatype_name in ["char", "nchar"]:
+            return f"RTRIM(CAST({column_name} AS varchar(max)))"
+        elif datatype_name in ["geography", "geometry", "hierarchyid"]:
+            return f"{column_name}.ToString()"
+        else:
+            return f"CAST({column_name} AS varchar(max))"
+
+    def _checksum_row(self, row: str) -> str:
+        return f"CONVERT(bigint, CONVERT(binary(4), HASHBYTES('MD5', {row})))"
+
+    @cached_statement
+    def statement_select_table_page(self, database: str, keys: list, page_size: int,
+                                    alt_table_name: Optional[str] = None, predicate: Optional[str] = None,
+                                    columns: Optional[list] = None, first_page: bool = False) -> str:
+        where = self._keyset_predicate(keys=keys, predicate=predicate, first_page=first_page)
+        order_by = ", ".join(keys)
+        select = f"SELECT TOP ({page_size}) {self._select_columns(columns)}"
+        return f"{select} FROM {self.table_format(database, alt_table_name)}{where} ORDER BY {order_by};"
+
+    def statement_select_sample_keys(self, database: str, keys: list, sample_size: int, fraction: float = 1.0,
+                                     alt_table_name: Optional[str] = None) -> str:
+        # TABLESAMPLE reads random pages rather than sorting every row
+        table_format = self.table_format(database, alt_table_name)
+        return f"SELECT TOP ({sample_size}) {', '.join(keys)} FROM {table_format} " \
+               f"TABLESAMPLE ({fraction * 100:.4f} PERCENT);"
+
+    @cached_statement
+    def statement_upsert_table(self, database: str, keys: list, alt_table_name: Optional[str] = None) -> str:
+        columns = [column.column_name for column in self.table_columns]
+        source = ", ".join([f"? AS {column}" for column in columns])
+        on = " AND ".join([f"target.{key} = source.{key}" for key in keys])
+        update = ", ".join([f"target.{column} = source.{column}" for column in columns if column not in keys])
+        values = ", ".join([f"source.{column}" for column in columns])
+        matched = "" if update == "" else f"WHEN MATCHED THEN UPDATE SET {update}\n"
+        statement = f"MERGE INTO {self.table_format(database, alt_table_name)} AS target\n" \
+                    f"USING (SELECT {source}) AS source\nON {on}\n{matched}" \
+                    f"WHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) VALUES ({values});"
+        return statement
+
 
 @dataclass(kw_only=True, frozen=True)
 class MySQLTable(Table):
@@ -267,6 +1541,186 @@ class MySQLTable(Table):
             alt_table_name = self.table
         return f"{database}.{alt_table_name}"
 
+    def table_reference_format(self, database: str, table: str, schema: Optional[str] = None) -> str:
+        return f"{database}.{table}"
+
+    def _checksum_column(self, column: Column) -> str:
+        datatype_name, column_name = column.column_datatype(), column.column_name
+        if datatype_name in ["float", "double"]:
+            return self._checksum_float(column_name, power="POW(10, {})", exponent="CAST({} AS SIGNED)",
+                                        mantissa="CAST({} AS DECIMAL(15, 12))")
+        elif datatype_name == "decimal":
+            return f"CAST(CAST({column_name} AS DECIMAL(38, 6)) AS CHAR)"
+        elif datatype_name == "date":
+            return f"DATE_FORMAT({column_name}, '%Y-%m-%d')"
+        elif datatype_name in ["datetime", "timestamp"]:
+            return f"DATE_FORMAT({column_name}, '%Y-%m-%d %H:%i:%s')"
+        elif datatype_name == "time":
+            return f"TIME_FORMAT({column_name}, '%H:%i:%s')"
+        elif datatype_name in ["binary", "varbinary", "blob", "tinyblob", "mediumblob", "longblob"]:
+            return f"HEX({column_name})"
+        elif datatype_name == "bit":
+            return f"CAST(CAST({column_name} AS UNSIGNED) AS CHAR)"
+        else:
+            return f"CAST({column_name} AS CHAR)"
+
+    def _checksum_row(self, row: str) -> str:
+        return f"CAST(CONV(LEFT(MD5({row}), 8), 16, 10) AS UNSIGNED)"
+
+    def statement_fast_load(self, database: str, alt_table_name: Optional[str] = None) -> list[str]:
+        # session settings only: DISABLE KEYS is a no-op on InnoDB and, run per task, a split table's first finished
+        # partition would enable the keys while the others still load
+        return [
+            "SET @sst_unique_checks = @@unique_checks, unique_checks = 0;",
+            "SET @sst_foreign_key_checks = @@foreign_key_checks, foreign_key_checks = 0;",
+        ]
+
+    def statement_fast_load_settings(self, database: str) -> Optional[str]:
+        # the session variables set by statement_fast_load keep the previous values
+        return None
+
+    def statement_fast_load_restore(self, database: str, alt_table_name: Optional[str] = None,
+                                    settings: Optional[tuple] = None) -> list[str]:
+        return [
+            "SET foreign_key_checks = @sst_foreign_key_checks;",
+            "SET unique_checks = @sst_unique_checks;",
+        ]
+
+    @cached_statement
+    def statement_select_table_page(self, database: str, keys: list, page_size: int,
+                                    alt_table_name: Optional[str] = None, predicate: Optional[str] = None,
+                                    columns: Optional[list] = None, first_page: bool = False) -> str:
+        where = self._keyset_predicate(keys=keys, predicate=predicate, first_page=first_page)
+        order_by = ", ".join(keys)
+        select = f"SELECT {self._select_columns(columns)}"
+        return f"{select} FROM {self.table_format(database, alt_table_name)}{where} ORDER BY {order_by} LIMIT {page_size};"
+
+    def statement_select_sample_keys(self, database: str, keys: list, sample_size: int, fraction: float = 1.0,
+                                     alt_table_name: Optional[str] = None) -> str:
+        # a Bernoulli sample, the scan stops at the limit and nothing is sorted
+        table_format = self.table_format(database, alt_table_name)
+        return f"SELECT {', '.join(keys)} FROM {table_format} WHERE RAND() < {fraction:.6f} LIMIT {sample_size};"
+
+    @cached_statement
+    def statement_upsert_table(self, database: str, keys: list, alt_table_name: Optional[str] = None) -> str:
+        columns = [column.column_name for column in self.table_columns]
+        update = ", ".join([f"{column} = VALUES({column})" for column in columns if column not in keys])
+        if update == "":
+            update = f"{keys[0]} = {keys[0]}"
+        statement = self.statement_insert_table(database, alt_table_name)
+        return f"{statement[0:-1]} ON DUPLICATE KEY UPDATE {update};"
+
+
+@dataclass(kw_only=True, frozen=True)
+class SQLiteTable(Table):
+    _system: SQLSystem = field(init=False, repr=False, default=SQLSystem.SQLITE)
+
+    def __post_init__(self, init_table_columns: list) -> None:
+        super().__post_init__(init_table_columns)
+        object.__setattr__(self, "schema", None)
+
+    def table_format(self, database: str, alt_table_name: Optional[str] = None) -> str:
+        if alt_table_name is None:
+            alt_table_name = self.table
+        return f"{database}.{alt_table_name}"
+
+    def table_reference_format(self, database: str, table: str, schema: Optional[str] = None) -> str:
+        return f"{database}.{table}"
+
+    # SQLite cannot add a primary key or a foreign key to an existing table, so both are part of the CREATE TABLE
+    @cached_statement
+    def statement_create_table(self, database: str, alt_table_name: Optional[str] = None) -> str:
+        definitions = [column.column_format() for column in self.table_columns]
+        primary_key = self.table_primary_key()
+        if primary_key:
+            definitions.append(f"PRIMARY KEY ({', '.join(primary_key)})")
+        for foreign_key in self.table_foreign_keys:
+            references = foreign_key['referenced_table']
+            if None not in foreign_key['referenced_columns']:
+                references = f"{references} ({', '.join(foreign_key['referenced_columns'])})"
+            definitions.append(f"FOREIGN KEY ({', '.join(foreign_key['columns'])}) REFERENCES {references}")
+        columns = ',\n'.join(definitions)
+        return f"CREATE TABLE {self.table_format(database, alt_table_name)} (\n\n{columns}\n\n);"
+
+    def statement_create_indexes(self, database: str, alt_table_name: Optional[str] = None) -> list[str]:
+        statements = []
+        table = self.table if alt_table_name is None else alt_table_name
+        for index in self.table_indexes:
+            if index['index_type'] == 'PRIMARY KEY':
+                continue
+            unique = "UNIQUE " if index['index_type'] == 'UNIQUE' else ""
+            columns = ', '.join(index['columns'])
+            statements.append(f"CREATE {unique}INDEX {database}.{index['index']} ON {table} ({columns});")
+        return statements
+
+    def statement_add_foreign_keys(self, database: str, alt_table_name: Optional[str] = None) -> list[str]:
+        return []
+
+    def statement_fast_load(self, database: str, alt_table_name: Optional[str] = None) -> list[str]:
+        return [f"PRAGMA {database}.synchronous = OFF;"]
+
+    def statement_fast_load_settings(self, database: str) -> Optional[str]:
+        return f"PRAGMA {database}.synchronous;"
+
+    def statement_fast_load_restore(self, database: str, alt_table_name: Optional[str] = None,
+                                    settings: Optional[tuple] = None) -> list[str]:
+        # settings is the row statement_fast_load_settings read before fast load, FULL when it could not be read
+        synchronous = "FULL" if not settings else int(settings[0])
+        return [f"PRAGMA {database}.synchronous = {synchronous};"]
+
+    def statement_select_checksum(self, database: str, alt_table_name: Optional[str] = None,
+                                  predicate: Optional[str] = None) -> str:
+        row = " || '|' || ".join([f"COALESCE({self._checksum_column(column)}, '~')" for column in self.table_columns])
+        where = "" if predicate is None else f" WHERE {predicate}"
+        checksum = self._checksum_row(f"{row} || '|'")
+        return f"SELECT COUNT(*), SUM({checksum}) FROM {self.table_format(database, alt_table_name)}{where};"
+
+    def _checksum_column(self, column: Column) -> str:
+        datatype_name, column_name = column.column_datatype(), column.column_name
+        if datatype_name in ["real", "double", "float"]:
+            return f"sst_float({column_name})"
+        elif datatype_name in ["numeric", "decimal"]:
+            return f"printf('%.6f', {column_name})"
+        elif datatype_name == "date":
+            return f"substr({column_name}, 1, 10)"
+        elif datatype_name in ["datetime", "timestamp"]:
+            return f"substr(replace({column_name}, 'T', ' '), 1, 19)"
+        elif datatype_name == "time":
+            return f"substr({column_name}, 1, 8)"
+        elif datatype_name in ["blob", "binary", "varbinary"]:
+            return f"hex({column_name})"
+        elif datatype_name in ["char", "nchar"]:
+            return f"rtrim({column_name})"
+        else:
+            return f"CAST({column_name} AS TEXT)"
+
+    def _checksum_row(self, row: str) -> str:
+        return f"sst_checksum({row})"
+
+    @cached_statement
+    def statement_select_table_page(self, database: str, keys: list, page_size: int,
+                                    alt_table_name: Optional[str] = None, predicate: Optional[str] = None,
+                                    columns: Optional[list] = None, first_page: bool = False) -> str:
+        where = self._keyset_predicate(keys=keys, predicate=predicate, first_page=first_page)
+        order_by = ", ".join(keys)
+        select = f"SELECT {self._select_columns(columns)}"
+        return f"{select} FROM {self.table_format(database, alt_table_name)}{where} ORDER BY {order_by} LIMIT {page_size};"
+
+    def statement_select_sample_keys(self, database: str, keys: list, sample_size: int, fraction: float = 1.0,
+                                     alt_table_name: Optional[str] = None) -> str:
+        # a Bernoulli sample on the low 20 bits of RANDOM(), the scan stops at the limit and nothing is sorted
+        table_format = self.table_format(database, alt_table_name)
+        return f"SELECT {', '.join(keys)} FROM {table_format} " \
+               f"WHERE (RANDOM() & 1048575) < {round(fraction * 1048576)} LIMIT {sample_size};"
+
+    @cached_statement
+    def statement_upsert_table(self, database: str, keys: list, alt_table_name: Optional[str] = None) -> str:
+        columns = [column.column_name for column in self.table_columns]
+        update = ", ".join([f"{column} = excluded.{column}" for column in columns if column not in keys])
+        action = "DO NOTHING" if update == "" else f"DO UPDATE SET {update}"
+        statement = self.statement_insert_table(database, alt_table_name)
+        return f"{statement[0:-1]} ON CONFLICT ({', '.join(keys)}) {action};"
+
 
 @dataclass(kw_only=True, frozen=True)
 class Column:
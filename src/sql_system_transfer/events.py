@@ -0,0 +1,84 @@
+from __future__ import annotations
+from dataclasses import asdict, dataclass, field
+from json import dumps
+from logging import getLogger, DEBUG, Logger
+from threading import Lock
+from time import time
+from typing import Any, Callable, Optional, TextIO
+
+
+# connect and catalog fire on the Engine that connects, the rest on the Engine that runs the transfer
+PHASES = ("connect", "catalog", "drop", "create", "first_row", "fetch", "write", "commit")
+# state changes: a table's catalog row estimate before the transfer starts, a worker starts or stops, takes a task from
+# the queue, retries a batch, fails a task or a primary key, index or foreign key, and the last task of a table finishes
+# with the table's rows and seconds
+STATES = ("estimate", "worker_start", "worker_stop", "task", "retry", "error", "table")
+
+
+@dataclass(kw_only=True, frozen=True)
+class TransferEvent:
+    phase: str
+    seconds: float
+    database: str
+    table_name: Optional[str] = field(default=None)
+    partition: Optional[int] = field(default=None)
+    rows: int = field(default=0)
+    bytes: Optional[int] = field(default=None)
+    queued: Optional[int] = field(default=None)
+    timestamp: float = field(default_factory=time)
+
+    def event_dict(self) -> dict:
+        return asdict(self)
+
+    def event_format(self) -> str:
+        table = "" if self.table_name is None else f" {self.table_name}"
+        partition = "" if self.partition is None else f" [{self.partition + 1}]"
+        rows = "" if not self.rows else f" - {self.rows:,} rows"
+        return f"{self.phase}{table}{partition} {self.seconds * 1000:.1f} ms{rows}"
+
+
+Hook = Callable[[TransferEvent], None]
+
+
+class LoggingSink:
+    """Hook that logs every event, at DEBUG by default as fetch and write fire once per batch."""
+
+    def __init__(self, logger: Optional[Logger] = None, level: int = DEBUG) -> None:
+        self.logger = getLogger("sql_system_transfer") if logger is None else logger
+        self.level = level
+
+    def __call__(self, event: TransferEvent) -> None:
+        self.logger.log(self.level, event.event_format())
+
+
+class JsonLinesSink:
+    """
+    Hook that appends every event to a file as one JSON object per line.
+
+    The file is opened on the first event and kept open until close, or the end of a with block; it is line buffered so
+    that every event is in the file as soon as it fires.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: Optional[TextIO] = None
+        self._lock = Lock()
+
+    def __enter__(self) -> JsonLinesSink:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __call__(self, event: TransferEvent) -> None:
+        line = dumps(event.event_dict(), default=str)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", buffering=1)
+            self._file.write(f"{line}\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
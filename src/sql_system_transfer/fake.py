@@ -0,0 +1,256 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from re import compile
+from threading import Lock
+from time import sleep
+from typing import Any, Iterator, Optional, Protocol
+from sql_system_transfer.system import SQLSystem
+
+
+# large text column of each system, as the catalog reports it: datatype name and character size
+FAKE_LOB_DATATYPES = {
+    SQLSystem.MSSQL: ("varchar", -1),
+    SQLSystem.MYSQL: ("longtext", 4294967295),
+    SQLSystem.SQLITE: ("text", None),
+}
+# every generated table has an integer key column, the rest of the row width is spread over the text columns
+FAKE_KEY_COLUMN = "id"
+FAKE_KEY_BYTES = 4
+
+_TABLE_NAME = compile(r"(?:FROM|INTO|TABLE(?: IF EXISTS)?)\s+([^\s(;]+)")
+_KEY_FILTER = compile(r"\b(\w+)\s*(>=|<=|>|<|=)\s*\?")
+_PAGE_SIZE = compile(r"TOP \((\d+)\)|LIMIT (\d+)")
+
+
+class FakeEngine(Protocol):
+    # the part of the Engine a FakeBackend connection reads
+    system: SQLSystem
+    database: str
+    autocommit: bool
+    statements: Any
+
+
+@dataclass(kw_only=True, frozen=True)
+class FakeTable:
+    table: str
+    row_count: int = field(default=1000)
+    row_width: int = field(default=100)
+    columns: int = field(default=4)
+    lob: bool = field(default=False)
+
+    def fake_column_sizes(self) -> list[int]:
+        width = max(self.columns, self.row_width - FAKE_KEY_BYTES)
+        return [width // self.columns + (1 if index < width % self.columns else 0) for index in range(self.columns)]
+
+    def fake_payload(self) -> tuple:
+        return tuple(["x" * size for size in self.fake_column_sizes()])
+
+    def fake_data_bytes(self) -> int:
+        return self.row_count * (FAKE_KEY_BYTES + sum(self.fake_column_sizes()))
+
+
+@dataclass(kw_only=True)
+class FakeBackend:
+    """
+    In-process stand-in for a database server, passed to Engine as the connection_factory.
+
+    It serves tables of generated rows, an integer key column and text columns at a given row width, and answers the
+    catalog queries of the Engine's system.  Every execute, executemany, fetchone, fetchmany, fetchall, commit and
+    rollback is one round trip and sleeps for latency seconds.  Writes are recorded per table, the rows themselves only with keep_rows.
+    """
+    tables: list = field(default_factory=list)
+    latency: float = field(default=0.0)
+    keep_rows: bool = field(default=False)
+    round_trips: int = field(init=False, default=0)
+    connections: int = field(init=False, default=0)
+    rows_written: dict = field(init=False, default_factory=dict)
+    rows: dict = field(init=False, default_factory=dict)
+    statements: list = field(init=False, default_factory=list)
+    _created: set = field(init=False, repr=False, default_factory=set)
+    _lock: Lock = field(init=False, repr=False, default_factory=Lock)
+
+    def __call__(self, engine: FakeEngine) -> FakeConnection:
+        with self._lock:
+            self.connections += 1
+        return FakeConnection(backend=self, engine=engine)
+
+    def fake_table(self, table: str) -> Optional[FakeTable]:
+        return next((fake_table for fake_table in self.tables if fake_table.table == table), None)
+
+    def fake_round_trip(self) -> None:
+        with self._lock:
+            self.round_trips += 1
+        if self.latency > 0:
+            sleep(self.latency)
+
+    def fake_execute(self, statement: str) -> None:
+        # DDL and session statements, CREATE TABLE makes the table exist for the target's table_exists check
+        table = fake_table_name(statement)
+        with self._lock:
+            self.statements.append(statement)
+            if statement.startswith("CREATE TABLE"):
+                self._created.add(table)
+            elif statement.startswith("DROP TABLE"):
+                self._created.discard(table)
+
+    def fake_write(self, statement: str, rows: list) -> None:
+        table = fake_table_name(statement)
+        with self._lock:
+            self.rows_written[table] = self.rows_written.get(table, 0) + len(rows)
+            if self.keep_rows:
+                self.rows.setdefault(table, []).extend([tuple(row) for row in rows])
+
+    def fake_exists(self, table: str) -> bool:
+        return table in self._created or self.fake_table(table) is not None
+
+    def fake_reset(self) -> None:
+        with self._lock:
+            self.round_trips, self.connections = 0, 0
+            self.rows_written, self.rows, self.statements = {}, {}, []
+
+
+def fake_tables(count: int, prefix: str = "FakeTable", **kwargs: Any) -> list[FakeTable]:
+    return [FakeTable(table=f"{prefix}{index}", **kwargs) for index in range(count)]
+
+
+def fake_table_name(statement: str) -> Optional[str]:
+    # the last part of the first table reference, without [], `` or "" quoting
+    match = _TABLE_NAME.search(statement)
+    if match is None:
+        return None
+    return match.group(1).split(".")[-1].strip('[]`"')
+
+
+class FakeConnection:
+    """Connection to a FakeBackend with the part of the pyodbc Connection interface the Engine uses."""
+
+    def __init__(self, backend: FakeBackend, engine: FakeEngine) -> None:
+        self.backend = backend
+        self.autocommit = engine.autocommit
+        self.system = engine.system
+        self.database = engine.database
+        self.statements = engine.statements
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def execute(self, statement: str, *parameters: Any) -> FakeCursor:
+        return self.cursor().execute(statement, *parameters)
+
+    def commit(self) -> None:
+        self.backend.fake_round_trip()
+
+    def rollback(self) -> None:
+        self.backend.fake_round_trip()
+
+    def close(self) -> None:
+        pass
+
+
+class FakeCursor:
+    """Cursor over a FakeBackend; SELECTs from a generated table return its rows in key order."""
+
+    def __init__(self, connection: FakeConnection) -> None:
+        self.connection = connection
+        self.fast_executemany = False
+        self.rowcount = -1
+        self._rows: Iterator[tuple] = iter([])
+
+    def execute(self, statement: str, *parameters: Any) -> FakeCursor:
+        backend = self.connection.backend
+        backend.fake_round_trip()
+        if len(parameters) == 1 and isinstance(parameters[0], (list, tuple)):
+            parameters = tuple(parameters[0])
+        catalog = self._catalog_rows(statement, parameters)
+        if catalog is not None:
+            self._rows = iter(catalog)
+        elif statement.startswith("SELECT"):
+            self._rows = self._select_rows(statement, parameters)
+        else:
+            backend.fake_execute(statement)
+            self._rows = iter([])
+        return self
+
+    def executemany(self, statement: str, rows: list) -> None:
+        self.connection.backend.fake_round_trip()
+        self.connection.backend.fake_write(statement, rows)
+        self.rowcount = len(rows)
+
+    def fetchone(self) -> Optional[tuple]:
+        self.connection.backend.fake_round_trip()
+        return next(self._rows, None)
+
+    def fetchmany(self, size: int = 1) -> list:
+        self.connection.backend.fake_round_trip()
+        return [row for _, row in zip(range(size), self._rows)]
+
+    def fetchall(self) -> list:
+        self.connection.backend.fake_round_trip()
+        return list(self._rows)
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def rollback(self) -> None:
+        self.connection.rollback()
+
+    def close(self) -> None:
+        self._rows = iter([])
+
+    def _catalog_rows(self, statement: str, parameters: tuple) -> Optional[list]:
+        connection, backend = self.connection, self.connection.backend
+        statements, database = connection.statements, connection.database
+        schema = "dbo" if connection.system == SQLSystem.MSSQL else ""
+        if statement == statements.statement_information_schema_tables(database=database):
+            return [(schema, table.table, "BASE TABLE") for table in backend.tables]
+        elif statement == statements.statement_table_statistics(database=database):
+            return [(schema, table.table, table.row_count, table.fake_data_bytes(), 0) for table in backend.tables]
+        elif statement == statements.statement_foreign_keys(database=database):
+            return []
+        elif statement == statements.statement_indexes(database=database):
+            return [(schema, table.table, "PRIMARY", "PRIMARY KEY", FAKE_KEY_COLUMN) for table in backend.tables]
+        elif statement == statements.statement_information_schema_columns(database=database):
+            table = next((backend.fake_table(parameter) for parameter in parameters if backend.fake_table(parameter)), None)
+            return [] if table is None else self._column_rows(table)
+        elif statement == statements.statement_table_exists(database=database):
+            return [(int(any([isinstance(parameter, str) and backend.fake_exists(parameter)
+                              for parameter in parameters])),)]
+        elif statement == statements.statement_recovery_model(database=database):
+            return [("SIMPLE",)]
+        return None
+
+    def _column_rows(self, table: FakeTable) -> list:
+        lob_name, lob_size = FAKE_LOB_DATATYPES[self.connection.system]
+        rows: list[tuple] = [(FAKE_KEY_COLUMN, "NO", "int", None, None, 10, 0, None)]
+        for index, size in enumerate(table.fake_column_sizes()):
+            datatype_name, character_size = (lob_name, lob_size) if table.lob else ("varchar", size)
+            rows.append((f"c{index}", "YES", datatype_name, character_size, None, None, None, None))
+        return rows
+
+    def _select_rows(self, statement: str, parameters: tuple) -> Iterator[tuple]:
+        table_name = fake_table_name(statement)
+        table = None if table_name is None else self.connection.backend.fake_table(table_name)
+        if table is None:
+            return iter([(None, None)] if statement.startswith("SELECT MIN(") else [(None,)])
+        # only the key column filters are applied, e.g. the partition ranges and the keyset pages
+        lower, upper = 1, table.row_count
+        for (column, operator), parameter in zip(_KEY_FILTER.findall(statement), parameters):
+            if column != FAKE_KEY_COLUMN or not isinstance(parameter, int):
+                continue
+            if operator in [">=", "="]:
+                lower = max(lower, parameter)
+            if operator == ">":
+                lower = max(lower, parameter + 1)
+            if operator in ["<=", "="]:
+                upper = min(upper, parameter)
+            if operator == "<":
+                upper = min(upper, parameter - 1)
+        if statement.startswith("SELECT MIN("):
+            return iter([(lower, upper) if lower <= upper else (None, None)])
+        elif statement.startswith("SELECT MAX("):
+            return iter([(upper if lower <= upper else None,)])
+        page = _PAGE_SIZE.search(statement)
+        if page is not None:
+            upper = min(upper, lower + int(page.group(1) or page.group(2)) - 1)
+        payload = table.fake_payload()
+        return ((key, *payload) for key in range(lower, upper + 1))
@@ -0,0 +1,17 @@
+from __future__ import annotations
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    """Stands in for a module until its first attribute is read, then imports it and takes on its attributes."""
+
+    def __getattr__(self, attribute: str) -> Any:
+        module = import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attribute)
+
+
+def lazy_import(name: str) -> ModuleType:
+    return LazyModule(name)
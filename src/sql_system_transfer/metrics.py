@@ -0,0 +1,139 @@
+from __future__ import annotations
+from bisect import bisect_left
+from os import chmod, fdopen, path, remove, replace
+from tempfile import mkstemp
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, Optional, TYPE_CHECKING
+from sql_system_transfer.events import TransferEvent
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+
+PREFIX = "sql_system_transfer"
+# batch latency buckets in seconds, from a local round trip to a stalled network write
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BATCH_PHASES = ("fetch", "write", "commit")
+
+
+class PrometheusMetrics:
+    """
+    Hook that keeps Prometheus metrics of the transfers it is given, for an Engine's hooks.
+
+    Rows, bytes, retries and errors are counted per table, fetch, write and commit latencies go into histograms, and
+    the queue depth and the number of active workers are gauges.  The metrics are read from metrics_text(), served on
+    a local HTTP endpoint with metrics_serve(), or written to a node_exporter textfile collector file every interval
+    seconds when textfile is given.
+    """
+
+    def __init__(self, textfile: Optional[str] = None, interval: float = 15.0) -> None:
+        self.textfile = textfile
+        self.interval = interval
+        self.counters: dict = {}
+        self.gauges: dict = {"queue_depth": 0, "active_workers": 0}
+        self.histograms: dict = {phase: ([0] * (len(LATENCY_BUCKETS) + 1), [0.0]) for phase in BATCH_PHASES}
+        self._written = monotonic()
+        self._lock = Lock()
+        self._write_lock = Lock()
+
+    def __call__(self, event: TransferEvent) -> None:
+        with self._lock:
+            if event.phase in BATCH_PHASES:
+                buckets, total = self.histograms[event.phase]
+                buckets[bisect_left(LATENCY_BUCKETS, event.seconds)] += 1
+                total[0] += event.seconds
+                if event.phase == "fetch":
+                    self._count("rows_read_total", event.table_name, event.rows)
+                elif event.phase == "write":
+                    self._count("rows_written_total", event.table_name, event.rows)
+                    self._count("bytes_written_total", event.table_name, event.bytes or 0)
+            elif event.phase == "retry":
+                self._count("retries_total", event.table_name, 1)
+            elif event.phase == "error":
+                self._count("errors_total", event.table_name, 1)
+            elif event.phase == "task":
+                self.gauges["queue_depth"] = event.queued or 0
+            elif event.phase == "worker_start":
+                self.gauges["active_workers"] += 1
+            elif event.phase == "worker_stop":
+                self.gauges["active_workers"] -= 1
+            write = self.textfile is not None and monotonic() - self._written >= self.interval
+        if write or (self.textfile is not None and event.phase == "worker_stop"):
+            self.metrics_write()
+
+    def _count(self, name: str, table_name: Optional[str], value: int) -> None:
+        key = (name, table_name)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def metrics_text(self) -> str:
+        with self._lock:
+            counters, gauges = dict(self.counters), dict(self.gauges)
+            histograms = {phase: ([*buckets], total[0]) for phase, (buckets, total) in self.histograms.items()}
+        lines = []
+        for name in sorted({name for name, _ in counters}):
+            lines.append(f"# TYPE {PREFIX}_{name} counter")
+            for (counter, table_name), value in sorted(counters.items(), key=lambda item: str(item[0])):
+                if counter == name:
+                    lines.append(f'{PREFIX}_{name}{{table="{metrics_label(table_name)}"}} {value}')
+        for name, value in gauges.items():
+            lines.append(f"# TYPE {PREFIX}_{name} gauge")
+            lines.append(f"{PREFIX}_{name} {value}")
+        lines.append(f"# TYPE {PREFIX}_batch_seconds histogram")
+        for phase, (buckets, total) in histograms.items():
+            cumulative = 0
+            for bound, count in zip([*LATENCY_BUCKETS, "+Inf"], buckets):
+                cumulative += count
+                lines.append(f'{PREFIX}_batch_seconds_bucket{{phase="{phase}",le="{bound}"}} {cumulative}')
+            lines.append(f'{PREFIX}_batch_seconds_sum{{phase="{phase}"}} {total}')
+            lines.append(f'{PREFIX}_batch_seconds_count{{phase="{phase}"}} {cumulative}')
+        return "\n".join(lines) + "\n"
+
+    def metrics_write(self) -> None:
+        # written to a temporary file next to the target and renamed, so that the collector never reads a partial file;
+        # workers that stop together write one at a time, each to its own temporary file
+        if self.textfile is None:
+            return
+        with self._lock:
+            self._written = monotonic()
+        with self._write_lock:
+            directory, name = path.split(path.abspath(self.textfile))
+            descriptor, temporary = mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+            try:
+                with fdopen(descriptor, "w") as file:
+                    file.write(self.metrics_text())
+                # mkstemp makes the file readable by its owner only, the collector can run as another user
+                chmod(temporary, 0o644)
+                replace(temporary, self.textfile)
+            except BaseException:
+                remove(temporary)
+                raise
+
+    def metrics_serve(self, port: int = 9464, address: str = "127.0.0.1") -> ThreadingHTTPServer:
+        # the server runs on a daemon thread until shutdown() is called on it
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self) -> None:
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.metrics_text().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((address, port), Handler)
+        Thread(target=server.serve_forever, name="sql_system_transfer_metrics", daemon=True).start()
+        return server
+
+
+def metrics_label(value: Optional[str]) -> str:
+    return "" if value is None else value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,123 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Optional
+from sql_system_transfer.scheduler import TransferTask, schedule_tasks
+
+DEFAULT_ROWS_PER_SECOND = 10000
+
+
+@dataclass(kw_only=True, frozen=True)
+class TablePlan:
+    table_name: str
+    new_table_name: str
+    write_mode: str
+    statements: list = field(default_factory=list, repr=False)
+    index_statements: list = field(default_factory=list, repr=False)
+    read_strategy: str = field(default="")
+    write_strategy: str = field(default="")
+    partitions: int = field(default=1)
+    rows: Optional[int] = field(default=None)
+    data_bytes: Optional[int] = field(default=None)
+    estimated_seconds: float = field(default=0.0)
+
+    def plan_format(self) -> str:
+        rows = "unknown" if self.rows is None else f"{self.rows:,}"
+        data_bytes = "unknown" if self.data_bytes is None else f"{self.data_bytes:,}"
+        lines = [
+            f"{self.table_name} -> {self.new_table_name} ({self.write_mode})",
+            f"    read: {self.read_strategy}",
+            f"    write: {self.write_strategy}",
+            f"    partitions: {self.partitions}, rows: {rows}, bytes: {data_bytes}, "
+            f"estimate: {self.estimated_seconds:.1f}s",
+            *[f"    {statement.strip()}" for statement in [*self.statements, *self.index_statements]],
+        ]
+        return "\n".join(lines)
+
+
+@dataclass(kw_only=True, frozen=True)
+class TransferPlan:
+    tables: list = field(default_factory=list)
+    skipped: dict = field(default_factory=dict)
+    workers: int = field(default=1)
+    rows_per_second: float = field(default=DEFAULT_ROWS_PER_SECOND)
+    estimated_seconds: float = field(default=0.0)
+
+    def plan_rows(self) -> int:
+        return sum([plan.rows for plan in self.tables if plan.rows is not None])
+
+    def plan_data_bytes(self) -> int:
+        return sum([plan.data_bytes for plan in self.tables if plan.data_bytes is not None])
+
+    def plan_format(self) -> str:
+        lines = [
+            *[plan.plan_format() for plan in self.tables],
+            *[f"{table_name} skipped - {reason}" for table_name, reason in self.skipped.items()],
+            f"{len(self.tables)} tables, rows: {self.plan_rows():,}, bytes: {self.plan_data_bytes():,}, "
+            f"workers: {self.workers}, estimate: {self.estimated_seconds:.1f}s "
+            f"at {self.rows_per_second:,.0f} rows/s",
+        ]
+        return "\n".join(lines)
+
+
+def task_rows(task: TransferTask) -> int:
+    rows = task.old_table.table_rows
+    return 0 if rows is None else int(rows) // task.partitions
+
+
+def task_seconds(task: TransferTask, rows_per_second: float = DEFAULT_ROWS_PER_SECOND) -> float:
+    return task_rows(task) / rows_per_second if rows_per_second > 0 else 0.0
+
+
+def plan_makespan(tasks: list[TransferTask], workers: int, rows_per_second: float = DEFAULT_ROWS_PER_SECOND) -> float:
+    schedule = schedule_tasks(tasks=tasks, workers=workers)
+    return max(
+        [sum([task_seconds(task, rows_per_second) for task in worker]) for worker in schedule], default=0.0
+    )
+
+
+def read_strategy(task: TransferTask, page_size: Optional[int] = None, batch_size: int = 1000,
+                  predicate: Optional[str] = None, watermark: Optional[str] = None) -> str:
+    if task.keys and page_size is not None:
+        strategy = f"keyset pages of {page_size} on {', '.join(task.keys)}"
+    else:
+        strategy = f"streamed select, fetch {batch_size}"
+    if task.partitions > 1 and task.keys:
+        strategy = f"{strategy}, {task.partitions} ranges on {task.keys[0]}"
+    if predicate is not None:
+        strategy = f"{strategy}, where {predicate}"
+    if watermark is not None and not task.created:
+        strategy = f"{strategy}, past target MAX({watermark})"
+    return strategy
+
+
+def write_strategy(task: TransferTask, batch_size: int = 1000, fast_load: bool = False) -> str:
+    if task.write_mode == "upsert":
+        strategy = f"upsert on {', '.join([] if task.keys is None else task.keys)}"
+    else:
+        strategy = "insert"
+    strategy = f"{strategy}, batches of {batch_size}"
+    if fast_load:
+        strategy = f"{strategy}, fast load"
+    return strategy
+
+
+def table_plan(tasks: list[TransferTask], new_table_name: str, statements: list, index_statements: list,
+               predicate: Optional[str] = None, watermark: Optional[str] = None, page_size: Optional[int] = None,
+               batch_size: int = 1000, fast_load: bool = False,
+               rows_per_second: float = DEFAULT_ROWS_PER_SECOND) -> TablePlan:
+    task = tasks[0]
+    return TablePlan(
+        table_name=task.table_name,
+        new_table_name=new_table_name,
+        write_mode=task.write_mode,
+        statements=statements,
+        index_statements=index_statements,
+        read_strategy=read_strategy(
+            task=task, page_size=page_size, batch_size=batch_size, predicate=predicate, watermark=watermark
+        ),
+        write_strategy=write_strategy(task=task, batch_size=batch_size, fast_load=fast_load),
+        partitions=task.partitions,
+        rows=task.old_table.table_rows,
+        data_bytes=task.old_table.table_data_bytes,
+        estimated_seconds=sum([task_seconds(task, rows_per_second) for task in tasks]),
+    )
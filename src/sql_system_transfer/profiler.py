@@ -0,0 +1,99 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from cProfile import Profile
+from os import makedirs, path
+from pstats import Stats
+from re import sub
+from typing import Iterator, Optional
+import tracemalloc
+
+
+# allocations of the profiler itself and of imports made during the transfer are left out of the reports
+TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+class TableProfiler:
+    """
+    Profiles the transfer of each table with cProfile, and with tracemalloc when memory is set.
+
+    The tasks of a table, one per partition, are profiled one at a time and their profiles are merged, so
+    profiler_write leaves one pstats file per table in directory.  With memory, the report has the peak traced memory
+    and the top allocation sites at the highest traced memory that profiler_batch saw during each task, i.e. the
+    batches behind the peak rather than what is left at the end.
+    """
+
+    def __init__(self, directory: str = "profiles", memory: bool = False, top: int = 25) -> None:
+        self.directory = directory
+        self.memory = memory
+        self.top = top
+        self.profiles: dict = {}
+        self.allocations: dict = {}
+        self.peaks: dict = {}
+        self._tracing = False
+        self._highest = 0
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+
+    @contextmanager
+    def profiler_table(self, table_name: str) -> Iterator[None]:
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        if self.memory:
+            tracemalloc.reset_peak()
+            before = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+            self._highest, self._snapshot = 0, None
+        profile = Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self.profiles.setdefault(table_name, []).append(profile)
+            if self.memory:
+                self.peaks[table_name] = max(self.peaks.get(table_name, 0), tracemalloc.get_traced_memory()[1])
+                after = self._snapshot or tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+                self._snapshot = None
+                allocations = self.allocations.setdefault(table_name, {})
+                for statistic in after.compare_to(before, "lineno"):
+                    size, count = allocations.get(str(statistic.traceback), (0, 0))
+                    allocations[str(statistic.traceback)] = (size + statistic.size_diff, count + statistic.count_diff)
+
+    def profiler_batch(self) -> None:
+        # called after each batch is written, while its rows are still held; a snapshot is only taken when the traced
+        # memory is higher than at every earlier batch of the task
+        if not self.memory or not tracemalloc.is_tracing():
+            return
+        current = tracemalloc.get_traced_memory()[0]
+        if current > self._highest:
+            self._highest, self._snapshot = current, tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+
+    def profiler_write(self) -> list[str]:
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+        makedirs(self.directory, exist_ok=True)
+        files = []
+        for table_name, profiles in self.profiles.items():
+            file_name = path.join(self.directory, profiler_file_name(table_name))
+            Stats(*profiles).dump_stats(f"{file_name}.pstats")
+            files.append(f"{file_name}.pstats")
+            if table_name in self.allocations:
+                with open(f"{file_name}.allocations.txt", "w") as file:
+                    file.write(self.profiler_format(table_name))
+                files.append(f"{file_name}.allocations.txt")
+        return files
+
+    def profiler_format(self, table_name: str) -> str:
+        allocations = sorted(self.allocations[table_name].items(), key=lambda item: abs(item[1][0]), reverse=True)
+        lines = [f"{table_name} - peak {self.peaks[table_name] / 1024:,.1f} KiB traced", "", "size KiB  blocks  line"]
+        for line, (size, count) in allocations[:self.top]:
+            lines.append(f"{size / 1024:>8,.1f}  {count:>6,}  {line}")
+        return "\n".join(lines) + "\n"
+
+
+def profiler_file_name(table_name: str) -> str:
+    return sub(r"[^\w.-]", "_", table_name)
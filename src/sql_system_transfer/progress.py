@@ -0,0 +1,118 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from datetime import timedelta
+from threading import Lock
+from typing import Optional, TextIO
+import sys
+from sql_system_transfer.events import TransferEvent
+
+
+@dataclass(kw_only=True)
+class TableProgress:
+    table_name: str
+    rows_total: Optional[int] = field(default=None)
+    rows_done: int = field(default=0)
+    rows_per_second: float = field(default=0.0)
+    started: Optional[float] = field(default=None)
+    updated: Optional[float] = field(default=None)
+    _ticked: tuple = field(init=False, repr=False, default=(0, None))
+
+    def progress_start(self, timestamp: float) -> None:
+        if self.started is None:
+            self.started, self._ticked = timestamp, (self.rows_done, timestamp)
+
+    def progress_tick(self, timestamp: float, smoothing: float) -> None:
+        # the current rate is the rate since the last tick, smoothed exponentially so that one slow batch moves the ETA
+        # only a little
+        rows, ticked = self._ticked
+        if ticked is None or timestamp <= ticked:
+            return
+        rate = (self.rows_done - rows) / (timestamp - ticked)
+        first = rows == 0 and self.rows_per_second == 0.0
+        self.rows_per_second = rate if first else smoothing * rate + (1 - smoothing) * self.rows_per_second
+        self._ticked = (self.rows_done, timestamp)
+
+    def progress_percent(self) -> Optional[float]:
+        return min(100.0, 100 * self.rows_done / self.rows_total) if self.rows_total else None
+
+    def progress_average(self) -> float:
+        if self.started is None or self.updated is None or self.updated <= self.started:
+            return 0.0
+        return self.rows_done / (self.updated - self.started)
+
+    def progress_eta(self) -> Optional[float]:
+        if not self.rows_total or self.rows_per_second <= 0:
+            return None
+        return max(self.rows_total - self.rows_done, 0) / self.rows_per_second
+
+    def progress_format(self) -> str:
+        percent, eta = self.progress_percent(), self.progress_eta()
+        total = "" if percent is None else f" of {self.rows_total:,}"
+        done = "" if percent is None else f" ({percent:.1f}%)"
+        remaining = "" if eta is None else f", ETA {timedelta(seconds=round(eta))}"
+        return f"{self.table_name} - {self.rows_done:,}{total} rows{done}, {self.rows_per_second:,.0f} rows/s now, " \
+               f"{self.progress_average():,.0f} rows/s average{remaining}"
+
+
+class TransferProgress:
+    """
+    Hook that prints the progress of each table and of the whole run every interval seconds.
+
+    Rows done are counted from the write events, once per batch, against the catalog row estimates the engine announces
+    before the transfer starts; tables without an estimate count toward the rows done only.  The ETA divides the rows
+    left by the current rate, smoothed over the ticks.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, interval: float = 5.0, smoothing: float = 0.3) -> None:
+        self.stream = stream
+        self.interval = interval
+        self.smoothing = smoothing
+        self.tables: dict[str, TableProgress] = {}
+        self.total = TableProgress(table_name="total")
+        self._active: dict[str, TableProgress] = {}
+        self._printed: Optional[float] = None
+        self._lock = Lock()
+
+    def progress_estimate(self, table_name: str, rows: Optional[int]) -> None:
+        with self._lock:
+            self._progress_estimate(table_name=table_name, rows=rows)
+
+    def _progress_estimate(self, table_name: str, rows: Optional[int]) -> None:
+        self._progress_table(table_name).rows_total = rows or None
+        self.total.rows_total = sum([table.rows_total or 0 for table in self.tables.values()]) or None
+
+    def _progress_table(self, table_name: str) -> TableProgress:
+        return self.tables.setdefault(table_name, TableProgress(table_name=table_name))
+
+    def __call__(self, event: TransferEvent) -> None:
+        lines = []
+        table_name = event.table_name
+        with self._lock:
+            # estimate, task and write events are a table's, those without a table name are left out
+            if event.phase == "estimate" and table_name is not None:
+                self._progress_estimate(table_name=table_name, rows=event.rows)
+            elif event.phase == "task" and table_name is not None:
+                self._progress_table(table_name).progress_start(event.timestamp)
+                self.total.progress_start(event.timestamp)
+                self._printed = event.timestamp if self._printed is None else self._printed
+            elif event.phase == "write" and table_name is not None:
+                table = self._progress_table(table_name)
+                for progress in (table, self.total):
+                    progress.rows_done += event.rows
+                    progress.updated = event.timestamp
+                self._active[table_name] = table
+            if self._active and (event.phase == "worker_stop" or event.phase == "write"
+                                 and event.timestamp - (self._printed or 0.0) >= self.interval):
+                lines = self._progress_lines(event.timestamp)
+        if lines:
+            print("\n".join(lines), file=sys.stderr if self.stream is None else self.stream, flush=True)
+
+    def _progress_lines(self, timestamp: float) -> list[str]:
+        tables, self._active, self._printed = [*self._active.values(), self.total], {}, timestamp
+        for table in tables:
+            table.progress_tick(timestamp=timestamp, smoothing=self.smoothing)
+        return [table.progress_format() for table in tables]
+
+    def progress_format(self) -> str:
+        with self._lock:
+            return "\n".join([table.progress_format() for table in [*self.tables.values(), self.total]])
@@ -0,0 +1,137 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from json import dumps
+from threading import Lock
+from typing import Optional
+
+
+@dataclass(kw_only=True)
+class TableReport:
+    table_name: str
+    status: str = field(default="transferred")
+    reason: Optional[str] = field(default=None)
+    rows_read: int = field(default=0)
+    rows_written: int = field(default=0)
+    bytes: Optional[int] = field(default=None)
+    seconds: float = field(default=0.0)
+    retries: int = field(default=0)
+    partitions: int = field(default=0)
+
+    def report_rows_per_second(self) -> float:
+        return self.rows_written / self.seconds if self.seconds > 0 else 0.0
+
+    def report_dict(self) -> dict:
+        return {
+            "table_name": self.table_name,
+            "status": self.status,
+            "reason": self.reason,
+            "rows_read": self.rows_read,
+            "rows_written": self.rows_written,
+            "bytes": self.bytes,
+            "seconds": self.seconds,
+            "rows_per_second": self.report_rows_per_second(),
+            "retries": self.retries,
+            "partitions": self.partitions,
+        }
+
+    def report_format(self) -> str:
+        if self.status in ["skipped", "failed"]:
+            return f"{self.table_name} {self.status} - {self.reason}"
+        retries = "" if not self.retries else f", {self.retries} retries"
+        reason = "" if self.reason is None else f" - {self.reason}"
+        return f"{self.table_name} {self.status} - {self.rows_written:,} rows in {self.seconds:.1f}s " \
+               f"({self.report_rows_per_second():,.0f} rows/s{retries}){reason}"
+
+
+@dataclass(kw_only=True)
+class TransferReport:
+    tables: dict[str, TableReport] = field(default_factory=dict)
+    seconds: float = field(default=0.0)
+    _spans: dict[str, tuple[float, float]] = field(init=False, repr=False, default_factory=dict)
+    _tasks: dict[str, int] = field(init=False, repr=False, default_factory=dict)
+    _lock: Lock = field(init=False, repr=False, default_factory=Lock)
+
+    def report_table(self, table_name: str) -> TableReport:
+        with self._lock:
+            return self.tables.setdefault(table_name, TableReport(table_name=table_name))
+
+    def report_expect(self, table_name: str, tasks: int) -> None:
+        self.report_table(table_name)
+        with self._lock:
+            self._tasks[table_name] = tasks
+
+    def report_skip(self, table_name: str, reason: str) -> None:
+        with self._lock:
+            self.tables[table_name] = TableReport(table_name=table_name, status="skipped", reason=reason)
+
+    def report_fail(self, table_name: str, reason: str) -> None:
+        # the first error of a table is its reason, the partitions that fail after it are the same failure
+        table = self.report_table(table_name)
+        with self._lock:
+            if table.status != "failed":
+                table.status, table.reason = "failed", reason
+
+    def report_warn(self, table_name: str, reason: str) -> None:
+        # a transferred table keeps its status, what it is missing, e.g. an index, goes into its reason
+        table = self.report_table(table_name)
+        with self._lock:
+            table.reason = reason if table.reason is None else f"{table.reason}; {reason}"
+
+    def report_task(self, table_name: str, started: float, finished: float, rows_read: int = 0,
+                    rows_written: int = 0, bytes: Optional[int] = None) -> Optional[TableReport]:
+        # partitions of a table run in parallel, so a table's time runs from its first start to its last finish; the
+        # table is returned once its last expected task is in
+        table = self.report_table(table_name)
+        with self._lock:
+            first, last = self._spans.get(table_name, (started, finished))
+            self._spans[table_name] = (min(first, started), max(last, finished))
+            table.seconds = self._spans[table_name][1] - self._spans[table_name][0]
+            table.rows_read += rows_read
+            table.rows_written += rows_written
+            table.bytes = bytes if table.bytes is None else table.bytes + (bytes or 0)
+            table.partitions += 1
+            return table if table.partitions == self._tasks.get(table_name) else None
+
+    def report_retry(self, table_name: str) -> None:
+        table = self.report_table(table_name)
+        with self._lock:
+            table.retries += 1
+
+    def report_transferred(self) -> list[TableReport]:
+        return [table for table in self.tables.values() if table.status == "transferred"]
+
+    def report_skipped(self) -> list[TableReport]:
+        return [table for table in self.tables.values() if table.status == "skipped"]
+
+    def report_failed(self) -> list[TableReport]:
+        return [table for table in self.tables.values() if table.status == "failed"]
+
+    def report_unfinished(self) -> list[TableReport]:
+        return [table for table_name, table in self.tables.items() if table.partitions < self._tasks.get(table_name, 0)]
+
+    def report_rows_written(self) -> int:
+        return sum([table.rows_written for table in self.tables.values()])
+
+    def report_rows_per_second(self) -> float:
+        return self.report_rows_written() / self.seconds if self.seconds > 0 else 0.0
+
+    def report_dict(self) -> dict:
+        return {
+            "seconds": self.seconds,
+            "rows_written": self.report_rows_written(),
+            "rows_per_second": self.report_rows_per_second(),
+            "tables": [table.report_dict() for table in self.tables.values()],
+        }
+
+    def report_json(self, indent: Optional[int] = 2) -> str:
+        return dumps(self.report_dict(), indent=indent)
+
+    def report_format(self) -> str:
+        return "\n".join([table.report_format() for table in self.tables.values()])
+
+
+def report_merge(reports: list[TransferReport]) -> TransferReport:
+    merged = TransferReport(seconds=sum([report.seconds for report in reports]))
+    for report in reports:
+        merged.tables.update(report.tables)
+    return merged
@@ -0,0 +1,41 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from random import Random
+from typing import Optional
+
+
+# SQLSTATEs raised by the SQL Server and MySQL ODBC drivers for deadlocks, timeouts and dropped connections
+TRANSIENT_SQLSTATES = frozenset(["40001", "HYT00", "HYT01", "08S01", "08001", "08007"])
+CONNECTION_SQLSTATES = frozenset(["08S01", "08001", "08007"])
+# MySQL reports lock wait timeouts and lost connections under the generic HY000 with the native error in the message
+TRANSIENT_NATIVE_ERRORS = ("(1205)", "(1213)", "(2006)", "(2013)")
+CONNECTION_NATIVE_ERRORS = ("(2006)", "(2013)")
+
+
+@dataclass(kw_only=True, frozen=True)
+class RetryPolicy:
+    retries: int = field(default=5)
+    base_delay: float = field(default=0.5)
+    max_delay: float = field(default=30.0)
+
+    def retry_delay(self, attempt: int, rng: Optional[Random] = None) -> float:
+        rng = Random() if rng is None else rng
+        return rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+def error_sqlstate(error: Exception) -> Optional[str]:
+    return error.args[0] if error.args and isinstance(error.args[0], str) else None
+
+
+def error_message(error: Exception) -> str:
+    return str(error.args[1]) if len(error.args) > 1 else ""
+
+
+def error_transient(error: Exception) -> bool:
+    return error_sqlstate(error) in TRANSIENT_SQLSTATES \
+        or any([native in error_message(error) for native in TRANSIENT_NATIVE_ERRORS])
+
+
+def error_connection(error: Exception) -> bool:
+    return error_sqlstate(error) in CONNECTION_SQLSTATES \
+        or any([native in error_message(error) for native in CONNECTION_NATIVE_ERRORS])
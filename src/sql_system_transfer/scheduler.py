@@ -0,0 +1,97 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from heapq import heapify, heappop, heappush
+from math import ceil
+from typing import Optional, Protocol
+
+
+# row width assumed for tables whose catalog has a row count but no data size, e.g. a few numeric and short text columns
+DEFAULT_ROW_BYTES = 100
+
+
+class CatalogTable(Protocol):
+    table_rows: Optional[int]
+    table_data_bytes: Optional[int]
+
+
+@dataclass(kw_only=True, frozen=True)
+class TransferTask:
+    table_name: str
+    old_table: CatalogTable
+    new_table: CatalogTable
+    write_mode: str = field(default="replace")
+    keys: Optional[list] = field(default=None)
+    columns: Optional[list] = field(default=None)
+    predicate: Optional[str] = field(default=None)
+    parameters: tuple = field(default=())
+    cost: int = field(default=0)
+    partition: Optional[int] = field(default=None)
+    partitions: int = field(default=1)
+    created: bool = field(default=False)
+
+    def task_name(self) -> str:
+        if self.partition is None:
+            return self.table_name
+        return f"{self.table_name} [{self.partition + 1}/{self.partitions}]"
+
+
+def table_cost(table: CatalogTable) -> int:
+    # in bytes, so that tables with and without a data size are ordered and split on the same scale
+    if table.table_data_bytes:
+        return int(table.table_data_bytes)
+    elif table.table_rows:
+        return int(table.table_rows) * DEFAULT_ROW_BYTES
+    else:
+        return 0
+
+
+def table_partition_count(cost: int, split_threshold: Optional[int] = None) -> int:
+    if split_threshold is None or split_threshold <= 0 or cost <= split_threshold:
+        return 1
+    return ceil(cost / split_threshold)
+
+
+def partition_ranges(lower: int, upper: int, partitions: int) -> list[tuple[Optional[int], Optional[int]]]:
+    partitions = max(1, min(partitions, upper - lower + 1))
+    bounds = [lower + (upper - lower + 1) * index // partitions for index in range(partitions + 1)]
+    ranges: list[tuple[Optional[int], Optional[int]]] = [
+        (bounds[index], bounds[index + 1]) for index in range(partitions)
+    ]
+    ranges[0] = (None, ranges[0][1])
+    ranges[-1] = (ranges[-1][0], None)
+    return ranges
+
+
+def schedule_order(tasks: list[TransferTask]) -> list[TransferTask]:
+    return sorted(tasks, key=lambda task: task.cost, reverse=True)
+
+
+def schedule_tasks(tasks: list[TransferTask], workers: int) -> list[list[TransferTask]]:
+    workers = max(1, workers)
+    schedule: list[list[TransferTask]] = [[] for _ in range(workers)]
+    loads: list[tuple[int, int]] = [(0, worker) for worker in range(workers)]
+    heapify(loads)
+    for task in schedule_order(tasks):
+        load, worker = heappop(loads)
+        schedule[worker].append(task)
+        heappush(loads, (load + task.cost, worker))
+    return schedule
+
+
+def schedule_makespan(schedule: list[list[TransferTask]]) -> int:
+    return max([sum([task.cost for task in worker]) for worker in schedule], default=0)
+
+
+def schedule_waves(dependencies: dict[str, set[str]]) -> list[list[str]]:
+    remaining = {table: set(references) & set(dependencies) for table, references in dependencies.items()}
+    waves: list[list[str]] = []
+    while remaining:
+        wave = sorted([table for table, references in remaining.items() if not references])
+        if not wave:
+            waves.append(sorted(remaining))
+            break
+        waves.append(wave)
+        remaining = {
+            table: references - set(wave) for table, references in remaining.items() if table not in wave
+        }
+    return waves
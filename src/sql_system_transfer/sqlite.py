@@ -0,0 +1,173 @@
+from __future__ import annotations
+from datetime import date, datetime, time
+from decimal import Decimal
+from hashlib import md5
+from math import floor, log10
+from typing import Any, Callable, Iterable, Optional
+from uuid import UUID
+import sqlite3
+
+# values the ODBC drivers return that sqlite3 cannot bind, stored as text the way SQLite date functions expect;
+# converted by SQLiteCursor, sqlite3.register_adapter would change every sqlite3 connection of the process
+SQLITE_PARAMETERS: dict[type, Callable[[Any], str]] = {
+    Decimal: str,
+    UUID: str,
+    datetime: lambda value: value.isoformat(" "),
+    date: lambda value: value.isoformat(),
+    time: lambda value: value.isoformat(),
+}
+
+
+class SQLiteError(Exception):
+    # args are (sqlstate, message) like a pyodbc.Error, so the retry policy reads the SQLSTATE the same way, and the
+    # SQLite backend does not need the ODBC driver manager installed
+    pass
+
+
+def sqlite_checksum(row: Optional[str]) -> Optional[int]:
+    # the first 4 bytes of the MD5 as an unsigned integer, the same row hash as on SQL Server and MySQL
+    return None if row is None else int.from_bytes(md5(row.encode()).digest()[0:4], "big")
+
+
+def sqlite_float(value: Optional[float]) -> Optional[str]:
+    # the float checksum text of SQL Server and MySQL: the mantissa rounded to 12 decimals and the exponent
+    if value is None:
+        return None
+    elif value == 0:
+        return "0"
+    exponent = floor(log10(abs(value)))
+    return f"{round(value / 10.0 ** exponent, 12):.12f}E{exponent}"
+
+
+def sqlite_parameters(parameters: Iterable) -> tuple:
+    # matched on the exact type as sqlite3 adapters are, so that the ints and strings of most rows take one lookup
+    return tuple([
+        value if (adapter := SQLITE_PARAMETERS.get(type(value))) is None else adapter(value) for value in parameters
+    ])
+
+
+def sqlite_error(error: sqlite3.Error) -> SQLiteError:
+    message = str(error)
+    if isinstance(error, sqlite3.IntegrityError):
+        sqlstate = "23000"
+    elif "locked" in message or "busy" in message:
+        sqlstate = "HYT00"
+    elif "no such table" in message:
+        sqlstate = "42S02"
+    else:
+        sqlstate = "HY000"
+    return SQLiteError(sqlstate, f"[{sqlstate}] [SQLite] {message}")
+
+
+def sqlite_connect(database: str, autocommit: bool = True, timeout: float = 30.0) -> SQLiteConnection:
+    try:
+        return SQLiteConnection(
+            sqlite3.connect(database, timeout=timeout, isolation_level=None if autocommit else "DEFERRED",
+                            check_same_thread=False)
+        )
+    except sqlite3.Error as error:
+        raise sqlite_error(error) from error
+
+
+class SQLiteConnection:
+    """sqlite3 connection with the part of the pyodbc Connection interface the Engine uses."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+        self._connection.create_function("sst_checksum", 1, sqlite_checksum, deterministic=True)
+        self._connection.create_function("sst_float", 1, sqlite_float, deterministic=True)
+
+    @property
+    def autocommit(self) -> bool:
+        return self._connection.isolation_level is None
+
+    @autocommit.setter
+    def autocommit(self, autocommit: bool) -> None:
+        # sqlite3 commits an open transaction when the isolation level goes back to None
+        self._connection.isolation_level = None if autocommit else "DEFERRED"
+
+    def cursor(self) -> SQLiteCursor:
+        return SQLiteCursor(self)
+
+    def execute(self, statement: str, *parameters: Any) -> SQLiteCursor:
+        return self.cursor().execute(statement, *parameters)
+
+    def commit(self) -> None:
+        self._connection.commit()
+
+    def rollback(self) -> None:
+        self._connection.rollback()
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class SQLiteCursor:
+    """sqlite3 cursor that takes pyodbc style parameters and raises SQLiteError with an SQLSTATE."""
+
+    def __init__(self, connection: SQLiteConnection) -> None:
+        self.connection = connection
+        self.fast_executemany = False
+        self._cursor = connection._connection.cursor()
+
+    @property
+    def description(self) -> Any:
+        return self._cursor.description
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    def execute(self, statement: str, *parameters: Any) -> SQLiteCursor:
+        if len(parameters) == 1 and isinstance(parameters[0], (list, tuple)):
+            parameters = tuple(parameters[0])
+        try:
+            self._cursor.execute(statement, sqlite_parameters(parameters))
+        except sqlite3.Error as error:
+            raise sqlite_error(error) from error
+        return self
+
+    def executemany(self, statement: str, rows: Iterable) -> None:
+        rows = (sqlite_parameters(row) for row in rows)
+        try:
+            if self.connection.autocommit:
+                # one executemany is one statement as on an ODBC connection, not a transaction and a sync per row
+                self._cursor.execute("BEGIN")
+                try:
+                    self._cursor.executemany(statement, rows)
+                except sqlite3.Error:
+                    self._cursor.execute("ROLLBACK")
+                    raise
+                self._cursor.execute("COMMIT")
+            else:
+                self._cursor.executemany(statement, rows)
+        except sqlite3.Error as error:
+            raise sqlite_error(error) from error
+
+    def fetchone(self) -> Optional[tuple]:
+        try:
+            row: Optional[tuple] = self._cursor.fetchone()
+            return row
+        except sqlite3.Error as error:
+            raise sqlite_error(error) from error
+
+    def fetchmany(self, size: Optional[int] = None) -> list:
+        try:
+            return self._cursor.fetchmany(self._cursor.arraysize if size is None else size)
+        except sqlite3.Error as error:
+            raise sqlite_error(error) from error
+
+    def fetchall(self) -> list:
+        try:
+            return self._cursor.fetchall()
+        except sqlite3.Error as error:
+            raise sqlite_error(error) from error
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def rollback(self) -> None:
+        self.connection.rollback()
+
+    def close(self) -> None:
+        self._cursor.close()
@@ -6,21 +6,62 @@ from textwrap import dedent
 class Statements(ABC):
 
     @abstractmethod
-    def statement_information_schema_columns(self, database: str, table: str, schema: Optional[str] = None) -> str:
+    def statement_information_schema_columns(self, database: str) -> str:
+        pass
+
+    @abstractmethod
+    def parameters_information_schema_columns(self, database: str, table: str, schema: Optional[str] = None) -> tuple:
         pass
 
     @abstractmethod
     def statement_information_schema_tables(self, database: str) -> str:
         pass
 
+    def parameters_information_schema_tables(self, database: str) -> tuple:
+        return ()
+
+    @abstractmethod
+    def statement_table_exists(self, database: str) -> str:
+        pass
+
+    @abstractmethod
+    def parameters_table_exists(self, database: str, table: str, table_type: str, schema: Optional[str] = None) -> tuple:
+        pass
+
     @abstractmethod
-    def statement_table_exists(self, database: str, table: str, table_type: str, schema: Optional[str] = None) -> str:
+    def statement_table_statistics(self, database: str) -> str:
         pass
 
+    def parameters_table_statistics(self, database: str) -> tuple:
+        return ()
+
+    @abstractmethod
+    def statement_foreign_keys(self, database: str) -> str:
+        pass
+
+    def parameters_foreign_keys(self, database: str) -> tuple:
+        return ()
+
+    @abstractmethod
+    def statement_indexes(self, database: str) -> str:
+        pass
+
+    def parameters_indexes(self, database: str) -> tuple:
+        return ()
+
+    def statement_recovery_model(self, database: str) -> Optional[str]:
+        return None
+
+    def parameters_recovery_model(self, database: str) -> tuple:
+        return ()
+
+    def statement_set_recovery_model(self, database: str, recovery_model: str) -> Optional[str]:
+        return None
+
 
 class MsSQLStatements(Statements):
 
-    def statement_information_schema_columns(self, database: str, table: str, schema: Optional[str] = None) -> str:
+    def statement_information_schema_columns(self, database: str) -> str:
         statement = f"""
             SELECT COLUMN_NAME 
                 ,IS_NULLABLE
@@ -31,12 +72,15 @@ class MsSQLStatements(Statements):
                 ,NUMERIC_SCALE
                 ,DATETIME_PRECISION  
             FROM {database}.INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = '{schema}'
-            AND TABLE_NAME = '{table}'
+            WHERE TABLE_SCHEMA = ?
+            AND TABLE_NAME = ?
             ORDER BY ORDINAL_POSITION;
         """
         return dedent(statement)
 
+    def parameters_information_schema_columns(self, database: str, table: str, schema: Optional[str] = None) -> tuple:
+        return "dbo" if schema is None else schema, table
+
     def statement_information_schema_tables(self, database: str) -> str:
         statement = f"""
             SELECT TABLE_SCHEMA, 
@@ -46,20 +90,89 @@ class MsSQLStatements(Statements):
         """
         return dedent(statement)
 
-    def statement_table_exists(self, database: str, table: str, table_type: str, schema: Optional[str] = None) -> str:
+    def statement_table_exists(self, database: str) -> str:
         statement = f"""
             SELECT count(*) as Cnt
             FROM {database}.INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_NAME = '{table}'
-            AND TABLE_TYPE = '{table_type}';
+            WHERE TABLE_SCHEMA = ?
+            AND TABLE_NAME = ?
+            AND TABLE_TYPE = ?;
         """
         return dedent(statement)
 
+    def parameters_table_exists(self, database: str, table: str, table_type: str, schema: Optional[str] = None) -> tuple:
+        return "dbo" if schema is None else schema, table, table_type
 
-class MySQLStatements(Statements):
+    def statement_table_statistics(self, database: str) -> str:
+        statement = f"""
+            SELECT s.name AS TABLE_SCHEMA
+                ,t.name AS TABLE_NAME
+                ,SUM(CASE WHEN ps.index_id IN (0, 1) THEN ps.row_count ELSE 0 END) AS TABLE_ROWS
+                ,SUM(CASE WHEN ps.index_id IN (0, 1) THEN ps.used_page_count ELSE 0 END) * 8192 AS DATA_LENGTH
+                ,SUM(CASE WHEN ps.index_id > 1 THEN ps.used_page_count ELSE 0 END) * 8192 AS INDEX_LENGTH
+            FROM {database}.sys.dm_db_partition_stats ps
+            JOIN {database}.sys.tables t ON t.object_id = ps.object_id
+            JOIN {database}.sys.schemas s ON s.schema_id = t.schema_id
+            GROUP BY s.name, t.name;
+        """
+        return dedent(statement)
 
-    def statement_information_schema_columns(self, database: str, table: str, schema: Optional[str] = None) -> str:
+    def statement_foreign_keys(self, database: str) -> str:
         statement = f"""
+            SELECT rc.CONSTRAINT_NAME
+                ,kcu.TABLE_SCHEMA
+                ,kcu.TABLE_NAME
+                ,kcu.COLUMN_NAME
+                ,ref.TABLE_SCHEMA
+                ,ref.TABLE_NAME
+                ,ref.COLUMN_NAME
+            FROM {database}.INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
+            JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+                ON kcu.CONSTRAINT_SCHEMA = rc.CONSTRAINT_SCHEMA
+                AND kcu.CONSTRAINT_NAME = rc.CONSTRAINT_NAME
+            JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE ref
+                ON ref.CONSTRAINT_SCHEMA = rc.UNIQUE_CONSTRAINT_SCHEMA
+                AND ref.CONSTRAINT_NAME = rc.UNIQUE_CONSTRAINT_NAME
+                AND ref.ORDINAL_POSITION = kcu.ORDINAL_POSITION
+            ORDER BY kcu.TABLE_SCHEMA, kcu.TABLE_NAME, rc.CONSTRAINT_NAME, kcu.ORDINAL_POSITION;
+        """
+        return dedent(statement)
+
+    def statement_indexes(self, database: str) -> str:
+        statement = f"""
+            SELECT s.name AS TABLE_SCHEMA
+                ,t.name AS TABLE_NAME
+                ,i.name AS INDEX_NAME
+                ,CASE WHEN i.is_primary_key = 1 THEN 'PRIMARY KEY'
+                    WHEN i.is_unique = 1 THEN 'UNIQUE'
+                    ELSE 'INDEX' END AS INDEX_TYPE
+                ,c.name AS COLUMN_NAME
+            FROM {database}.sys.indexes i
+            JOIN {database}.sys.index_columns ic ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+            JOIN {database}.sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+            JOIN {database}.sys.tables t ON t.object_id = i.object_id
+            JOIN {database}.sys.schemas s ON s.schema_id = t.schema_id
+            WHERE i.type IN (1, 2)
+            AND i.is_hypothetical = 0
+            AND ic.is_included_column = 0
+            ORDER BY s.name, t.name, i.name, ic.key_ordinal;
+        """
+        return dedent(statement)
+
+    def statement_recovery_model(self, database: str) -> Optional[str]:
+        return "SELECT recovery_model_desc FROM sys.databases WHERE name = ?;"
+
+    def parameters_recovery_model(self, database: str) -> tuple:
+        return database,
+
+    def statement_set_recovery_model(self, database: str, recovery_model: str) -> Optional[str]:
+        return f"ALTER DATABASE {database} SET RECOVERY {recovery_model};"
+
+
+class MySQLStatements(Statements):
+
+    def statement_information_schema_columns(self, database: str) -> str:
+        statement = """
             SELECT COLUMN_NAME 
                 ,IS_NULLABLE
                 ,DATA_TYPE
@@ -69,28 +182,209 @@ class MySQLStatements(Statements):
                 ,NUMERIC_SCALE
                 ,DATETIME_PRECISION  
             FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = '{database}'
-            AND TABLE_NAME = '{table}'
+            WHERE TABLE_SCHEMA = ?
+            AND TABLE_NAME = ?
             ORDER BY ORDINAL_POSITION;
         """
         return dedent(statement)
 
+    def parameters_information_schema_columns(self, database: str, table: str, schema: Optional[str] = None) -> tuple:
+        return database, table
+
     def statement_information_schema_tables(self, database: str) -> str:
-        statement = f"""
+        statement = """
             SELECT '', 
                 TABLE_NAME, 
                 TABLE_TYPE
             FROM INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_SCHEMA = '{database}';
+            WHERE TABLE_SCHEMA = ?;
         """
         return dedent(statement)
 
-    def statement_table_exists(self, database: str, table: str, table_type: str, schema: Optional[str] = None) -> str:
-        statement = f"""
+    def parameters_information_schema_tables(self, database: str) -> tuple:
+        return database,
+
+    def statement_table_exists(self, database: str) -> str:
+        statement = """
             SELECT count(*) as Cnt
             FROM INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_SCHEMA = '{database}'
-            AND TABLE_NAME = '{table}'
-            AND TABLE_TYPE = '{table_type}';
+            WHERE TABLE_SCHEMA = ?
+            AND TABLE_NAME = ?
+            AND TABLE_TYPE = ?;
         """
         return dedent(statement)
+
+    def parameters_table_exists(self, database: str, table: str, table_type: str, schema: Optional[str] = None) -> tuple:
+        return database, table, table_type
+
+    def statement_table_statistics(self, database: str) -> str:
+        statement = """
+            SELECT '',
+                TABLE_NAME,
+                TABLE_ROWS,
+                DATA_LENGTH,
+                INDEX_LENGTH
+            FROM INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA = ?
+            AND TABLE_TYPE = 'BASE TABLE';
+        """
+        return dedent(statement)
+
+    def parameters_table_statistics(self, database: str) -> tuple:
+        return database,
+
+    def statement_foreign_keys(self, database: str) -> str:
+        statement = """
+            SELECT rc.CONSTRAINT_NAME,
+                '',
+                kcu.TABLE_NAME,
+                kcu.COLUMN_NAME,
+                '',
+                kcu.REFERENCED_TABLE_NAME,
+                kcu.REFERENCED_COLUMN_NAME
+            FROM INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
+            JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+                ON kcu.CONSTRAINT_SCHEMA = rc.CONSTRAINT_SCHEMA
+                AND kcu.CONSTRAINT_NAME = rc.CONSTRAINT_NAME
+                AND kcu.TABLE_NAME = rc.TABLE_NAME
+            WHERE rc.CONSTRAINT_SCHEMA = ?
+            ORDER BY kcu.TABLE_NAME, rc.CONSTRAINT_NAME, kcu.ORDINAL_POSITION;
+        """
+        return dedent(statement)
+
+    def parameters_foreign_keys(self, database: str) -> tuple:
+        return database,
+
+    def statement_indexes(self, database: str) -> str:
+        statement = """
+            SELECT '',
+                TABLE_NAME,
+                INDEX_NAME,
+                CASE WHEN INDEX_NAME = 'PRIMARY' THEN 'PRIMARY KEY'
+                    WHEN NON_UNIQUE = 0 THEN 'UNIQUE'
+                    ELSE 'INDEX' END,
+                COLUMN_NAME
+            FROM INFORMATION_SCHEMA.STATISTICS
+            WHERE TABLE_SCHEMA = ?
+            ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX;
+        """
+        return dedent(statement)
+
+    def parameters_indexes(self, database: str) -> tuple:
+        return database,
+
+
+class SQLiteStatements(Statements):
+
+    def statement_information_schema_columns(self, database: str) -> str:
+        # the declared type is split into its name and the numbers in brackets, e.g. decimal(19, 4) or varchar(50)
+        statement = """
+            SELECT name
+                ,CASE WHEN "notnull" = 1 OR pk > 0 THEN 'NO' ELSE 'YES' END
+                ,lower(trim(CASE WHEN instr(type, '(') > 0 THEN substr(type, 1, instr(type, '(') - 1) ELSE type END))
+                ,CASE WHEN instr(type, '(') > 0 THEN CAST(substr(type, instr(type, '(') + 1) AS INTEGER) END
+                ,NULL
+                ,CASE WHEN instr(type, '(') > 0 THEN CAST(substr(type, instr(type, '(') + 1) AS INTEGER) END
+                ,CASE WHEN instr(type, ',') > 0 THEN CAST(trim(substr(type, instr(type, ',') + 1)) AS INTEGER) END
+                ,CASE WHEN instr(type, '(') > 0 THEN CAST(substr(type, instr(type, '(') + 1) AS INTEGER) END
+            FROM pragma_table_info(?, ?)
+            ORDER BY cid;
+        """
+        return dedent(statement)
+
+    def parameters_information_schema_columns(self, database: str, table: str, schema: Optional[str] = None) -> tuple:
+        return table, database
+
+    def statement_information_schema_tables(self, database: str) -> str:
+        statement = f"""
+            SELECT '',
+                name,
+                CASE WHEN type = 'table' THEN 'BASE TABLE' ELSE 'VIEW' END
+            FROM {database}.sqlite_master
+            WHERE type IN ('table', 'view')
+            AND name NOT LIKE 'sqlite_%';
+        """
+        return dedent(statement)
+
+    def statement_table_exists(self, database: str) -> str:
+        statement = f"""
+            SELECT count(*) as Cnt
+            FROM {database}.sqlite_master
+            WHERE name = ?
+            AND CASE WHEN type = 'table' THEN 'BASE TABLE' ELSE 'VIEW' END = ?;
+        """
+        return dedent(statement)
+
+    def parameters_table_exists(self, database: str, table: str, table_type: str, schema: Optional[str] = None) -> tuple:
+        return table, table_type
+
+    def statement_table_statistics(self, database: str) -> str:
+        # SQLite keeps no row or page counts without ANALYZE and the optional dbstat table, so none are reported
+        statement = f"""
+            SELECT '',
+                name,
+                NULL,
+                NULL,
+                NULL
+            FROM {database}.sqlite_master
+            WHERE type = 'table'
+            AND name NOT LIKE 'sqlite_%';
+        """
+        return dedent(statement)
+
+    def statement_foreign_keys(self, database: str) -> str:
+        statement = f"""
+            SELECT 'FK_' || m.name || '_' || fk.id,
+                '',
+                m.name,
+                fk."from",
+                '',
+                fk."table",
+                fk."to"
+            FROM {database}.sqlite_master m
+            JOIN pragma_foreign_key_list(m.name, ?) fk
+            WHERE m.type = 'table'
+            ORDER BY m.name, fk.id, fk.seq;
+        """
+        return dedent(statement)
+
+    def parameters_foreign_keys(self, database: str) -> tuple:
+        return database,
+
+    def statement_indexes(self, database: str) -> str:
+        # a rowid primary key (INTEGER PRIMARY KEY) has no index of its own and is read from the columns instead
+        statement = f"""
+            SELECT '',
+                m.name,
+                CASE WHEN il.origin = 'pk' THEN 'PRIMARY'
+                    WHEN il.origin = 'u' THEN 'UQ_' || m.name || '_' || il.seq
+                    ELSE il.name END,
+                CASE WHEN il.origin = 'pk' THEN 'PRIMARY KEY'
+                    WHEN il."unique" = 1 THEN 'UNIQUE'
+                    ELSE 'INDEX' END,
+                ii.name,
+                ii.seqno
+            FROM {database}.sqlite_master m
+            JOIN pragma_index_list(m.name, ?) il
+            JOIN pragma_index_info(il.name, ?) ii
+            WHERE m.type = 'table'
+            AND il.partial = 0
+            AND ii.name IS NOT NULL
+            UNION ALL
+            SELECT '',
+                m.name,
+                'PRIMARY',
+                'PRIMARY KEY',
+                ti.name,
+                ti.pk
+            FROM {database}.sqlite_master m
+            JOIN pragma_table_info(m.name, ?) ti
+            WHERE m.type = 'table'
+            AND ti.pk > 0
+            AND NOT EXISTS (SELECT 1 FROM pragma_index_list(m.name, ?) WHERE origin = 'pk')
+            ORDER BY 2, 3, 6;
+        """
+        return dedent(statement)
+
+    def parameters_indexes(self, database: str) -> tuple:
+        return database, database, database, database
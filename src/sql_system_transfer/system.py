@@ -12,12 +12,20 @@ class SQLSystem(Enum):
     MSSQL: ClassVar[Dict[str, str]] = frozendict({
         "id": "MsSQL",
         "name": "Microsoft SQL Server",
-        "driver": "{ODBC Driver 17 for SQL Server}"
+        "driver": "{ODBC Driver 17 for SQL Server}",
+        "fast_executemany": True
     })
     MYSQL: ClassVar[Dict[str, str]] = frozendict({
         "id": "MySQL",
         "name": "MySQL",
-        "driver": "{MySQL ODBC 8.0 Unicode Driver}"
+        "driver": "{MySQL ODBC 8.0 Unicode Driver}",
+        "fast_executemany": False
+    })
+    SQLITE: ClassVar[Dict[str, str]] = frozendict({
+        "id": "SQLite",
+        "name": "SQLite",
+        "driver": None,
+        "fast_executemany": False
     })
 
     def system_abbreviation(self) -> str:
@@ -32,6 +40,10 @@ class SQLSystem(Enum):
         driver = self.value.get("driver")
         return driver  # type: ignore
 
+    def system_fast_executemany(self) -> bool:
+        fast_executemany = self.value.get("fast_executemany")
+        return fast_executemany  # type: ignore
+
     def __str__(self) -> str:
         system_name = self.value.get("name")
         return f"{system_name}"
@@ -0,0 +1,163 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from decimal import Decimal
+from math import sqrt
+from statistics import NormalDist
+from typing import Any, Optional
+from uuid import UUID
+
+
+MAX_MISMATCH_KEYS = 100
+# a mismatched chunk is halved on its key until either side holds at most this many rows, then compared by row
+VERIFY_LEAF_ROWS = 1000
+SAMPLE_BATCH_SIZE = 500
+
+
+@dataclass(kw_only=True, frozen=True)
+class ChunkVerification:
+    table_name: str
+    partition: Optional[int] = field(default=None)
+    source_rows: int = field(default=0)
+    target_rows: int = field(default=0)
+    matched: bool = field(default=True)
+    missing_keys: list = field(default_factory=list)
+    extra_keys: list = field(default_factory=list)
+    changed_keys: list = field(default_factory=list)
+
+
+@dataclass(kw_only=True, frozen=True)
+class TableVerification:
+    table_name: str
+    chunks: list = field(default_factory=list, repr=False)
+
+    def verification_source_rows(self) -> int:
+        return sum([chunk.source_rows for chunk in self.chunks])
+
+    def verification_target_rows(self) -> int:
+        return sum([chunk.target_rows for chunk in self.chunks])
+
+    def verification_mismatched_chunks(self) -> int:
+        return len([chunk for chunk in self.chunks if not chunk.matched])
+
+    def verification_missing_keys(self) -> list:
+        return [key for chunk in self.chunks for key in chunk.missing_keys][0:MAX_MISMATCH_KEYS]
+
+    def verification_extra_keys(self) -> list:
+        return [key for chunk in self.chunks for key in chunk.extra_keys][0:MAX_MISMATCH_KEYS]
+
+    def verification_changed_keys(self) -> list:
+        return [key for chunk in self.chunks for key in chunk.changed_keys][0:MAX_MISMATCH_KEYS]
+
+    def verification_passed(self) -> bool:
+        return all([
+            not chunk.missing_keys and not chunk.extra_keys and not chunk.changed_keys
+            and chunk.source_rows == chunk.target_rows
+            for chunk in self.chunks
+        ])
+
+    def verification_format(self) -> str:
+        status = "passed" if self.verification_passed() else "FAILED"
+        return f"{self.table_name} {status} - rows: {self.verification_source_rows():,} source, " \
+               f"{self.verification_target_rows():,} target, chunks: {len(self.chunks)}, " \
+               f"mismatched: {self.verification_mismatched_chunks()}, " \
+               f"missing: {len(self.verification_missing_keys())}, extra: {len(self.verification_extra_keys())}, " \
+               f"changed: {len(self.verification_changed_keys())}"
+
+
+@dataclass(kw_only=True, frozen=True)
+class SampleVerification:
+    table_name: str
+    samples: int = field(default=0)
+    missing_keys: list = field(default_factory=list)
+    changed_keys: list = field(default_factory=list)
+    confidence: float = field(default=0.95)
+
+    def verification_mismatches(self) -> int:
+        return len(self.missing_keys) + len(self.changed_keys)
+
+    def verification_mismatch_rate(self) -> float:
+        return self.verification_mismatches() / self.samples if self.samples else 0.0
+
+    def verification_upper_bound(self) -> float:
+        return wilson_upper_bound(mismatches=self.verification_mismatches(), samples=self.samples,
+                                  confidence=self.confidence)
+
+    def verification_passed(self) -> bool:
+        return self.verification_mismatches() == 0
+
+    def verification_format(self) -> str:
+        status = "passed" if self.verification_passed() else "FAILED"
+        return f"{self.table_name} {status} - samples: {self.samples:,}, missing: {len(self.missing_keys)}, " \
+               f"changed: {len(self.changed_keys)}, mismatch rate: {self.verification_mismatch_rate():.4%} " \
+               f"(<= {self.verification_upper_bound():.4%} at {self.confidence:.0%})"
+
+
+def wilson_upper_bound(mismatches: int, samples: int, confidence: float = 0.95) -> float:
+    if samples == 0:
+        return 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    rate = mismatches / samples
+    center = rate + z ** 2 / (2 * samples)
+    margin = z * sqrt(rate * (1 - rate) / samples + z ** 2 / (4 * samples ** 2))
+    return min(1.0, (center + margin) / (1 + z ** 2 / samples))
+
+
+def sample_batches(keys: list, key_count: int) -> list[list]:
+    batch_size = max(1, SAMPLE_BATCH_SIZE // max(1, key_count))
+    return [keys[start:start + batch_size] for start in range(0, len(keys), batch_size)]
+
+
+def verify_value(value: Any, datatype_name: Optional[str] = None) -> Any:
+    if value is None:
+        return None
+    elif datatype_name == "uniqueidentifier" and isinstance(value, str):
+        return UUID(value).hex.upper()
+    elif isinstance(value, bool):
+        return int(value)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex().upper()
+    elif isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    elif isinstance(value, date):
+        return value.isoformat()
+    elif isinstance(value, time):
+        return value.strftime("%H:%M:%S")
+    elif isinstance(value, (float, Decimal)):
+        return round(float(value), 6)
+    elif isinstance(value, str):
+        return value.rstrip(" ")
+    else:
+        return value
+
+
+def verify_parameter(value: Any, datatype_name: Optional[str] = None, new_datatype_name: Optional[str] = None) -> Any:
+    # a source key value as a target parameter: a uniqueidentifier read as text is stored as its 16 bytes
+    if datatype_name == "uniqueidentifier" and isinstance(value, str) and new_datatype_name in ["binary", "varbinary"]:
+        return UUID(value).bytes
+    return value
+
+
+def verify_row(row: Any, datatype_names: Optional[list] = None) -> tuple:
+    datatype_names = [None] * len(row) if datatype_names is None else datatype_names
+    return tuple([verify_value(value, datatype_name) for value, datatype_name in zip(row, datatype_names)])
+
+
+def verify_checksum(result: Any) -> tuple[int, int]:
+    rows, checksum = (0, None) if result is None else result
+    return int(rows or 0), int(checksum or 0)
+
+
+def verify_rows(old_rows: list, new_rows: list, key_index: Optional[list] = None,
+                datatype_names: Optional[list] = None, limit: Optional[int] = MAX_MISMATCH_KEYS) -> tuple[list, list, list]:
+    def row_key(row: tuple) -> tuple:
+        return row if not key_index else tuple([row[index] for index in key_index])
+
+    old_rows_by_key = {row_key(row): row for row in [verify_row(row, datatype_names) for row in old_rows]}
+    new_rows_by_key = {row_key(row): row for row in [verify_row(row) for row in new_rows]}
+    missing_keys = [key for key in old_rows_by_key if key not in new_rows_by_key]
+    extra_keys = [key for key in new_rows_by_key if key not in old_rows_by_key]
+    changed_keys = [
+        key for key, row in old_rows_by_key.items() if key in new_rows_by_key and new_rows_by_key[key] != row
+    ]
+    return missing_keys[0:limit], extra_keys[0:limit], changed_keys[0:limit]
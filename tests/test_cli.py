@@ -0,0 +1,214 @@
+import pytest
+from json import load
+from unittest.mock import MagicMock, patch
+from sql_system_transfer.cli import CopyState, cli_parser, cli_profile, cli_tables, cli_state_load, cli_state_save, main, \
+    SQLProfileError, SQLStateError, EXIT_SUCCESS, EXIT_TRANSFER_FAILED, EXIT_USAGE, EXIT_VERIFY_FAILED, EXIT_CONNECTION_FAILED
+from sql_system_transfer.engine import MsSQLTable
+from sql_system_transfer.events import TransferEvent
+from sql_system_transfer.progress import TransferProgress
+from sql_system_transfer.report import TableReport, TransferReport
+from sql_system_transfer.sqlite import SQLiteError
+from sql_system_transfer.system import SQLSystem
+
+
+profiles = """
+[warehouse]
+system = mssql
+server = localhost
+database = AdventureWorksDW
+trusted_connection = yes
+
+[mart]
+system = mysql
+server = localhost
+database = mart
+uid = loader
+pwd = secret
+
+[broken]
+system = oracle
+server = localhost
+database = mart
+"""
+
+table_columns = [
+    {'column_name': 'AccountKey', 'nullable': 'NO', 'datatype_name': 'int', 'character_size': None,
+     'character_set': None, 'numeric_precision': 10, 'numeric_scale': 0, 'datetime_precision': None},
+]
+
+
+@pytest.fixture()
+def profiles_path(tmp_path):
+    profiles_path = tmp_path / "profiles.ini"
+    profiles_path.write_text(profiles)
+    return str(profiles_path)
+
+
+@pytest.fixture()
+def source():
+    source = MagicMock(database="AdventureWorksDW")
+    source.database_object.database_tables = [
+        MsSQLTable(table=name, table_type=table_type, table_rows=rows, init_table_columns=table_columns)
+        for name, table_type, rows in [
+            ("DimAccount", "BASE TABLE", 100), ("DimCurrency", "BASE TABLE", 200),
+            ("FactSales", "BASE TABLE", 1000), ("vDimAccount", "VIEW", None),
+        ]
+    ]
+    source.hooks = ()
+
+    def transfer_tables(tables, **kwargs):
+        # the table events of the engine, fired to the hooks the CLI passed
+        for table in tables:
+            for hook in source.hooks:
+                hook(TransferEvent(phase="table", seconds=0.5, database="AdventureWorksDW", table_name=table, rows=10))
+        return TransferReport(
+            tables={table: TableReport(table_name=table, rows_written=10, seconds=0.5, partitions=1) for table in tables}
+        )
+
+    source.engine_transfer_tables.side_effect = transfer_tables
+    return source
+
+
+def cli_engines(*engines):
+    engines = iter(engines)
+
+    def engine(**kwargs):
+        engine = next(engines)
+        engine.hooks = kwargs.get("hooks", ())
+        return engine
+    return engine
+
+
+def test_cli_parser():
+    args = cli_parser().parse_args(["copy", "warehouse", "mart", "AdventureWorksDW.dbo.Dim*", "--workers", "4",
+                                    "--write-mode", "append", "--resume", "--verify", "sample"])
+    assert (args.command, args.source, args.target, args.tables) == ("copy", "warehouse", "mart", ["AdventureWorksDW.dbo.Dim*"])
+    assert (args.workers, args.batch_size, args.write_mode, args.resume, args.verify) == (4, 1000, "append", True, "sample")
+
+
+def test_cli_parser_raise_exception():
+    with pytest.raises(SystemExit) as error:
+        cli_parser().parse_args(["copy", "warehouse", "mart", "T", "--write-mode", "merge"])
+    assert error.value.code == EXIT_USAGE
+
+
+def test_cli_profile(profiles_path):
+    assert cli_profile(profiles_path, "mart") == {
+        "system": SQLSystem.MYSQL, "server": "localhost", "database": "mart", "uid": "loader", "pwd": "secret"
+    }
+
+
+@pytest.mark.parametrize("name", ["missing", "broken"])
+def test_cli_profile_raise_exception(profiles_path, name):
+    with pytest.raises(SQLProfileError):
+        cli_profile(profiles_path, name)
+
+
+def test_cli_tables():
+    table_names = ["Db.dbo.DimAccount", "Db.dbo.DimCurrency", "Db.dbo.FactSales"]
+    assert cli_tables(table_names=table_names, patterns=["Db.dbo.Dim*", "Db.dbo.DimAccount"]) == \
+        ["Db.dbo.DimAccount", "Db.dbo.DimCurrency"]
+    assert cli_tables(table_names=table_names, patterns=["Db.dbo.Fact*"]) == ["Db.dbo.FactSales"]
+
+
+def test_cli_state(tmp_path):
+    state = str(tmp_path / "state.json")
+    assert cli_state_load(state, source="warehouse", target="mart") == []
+    cli_state_save(state, "warehouse", "mart", ["Db.dbo.DimAccount"])
+    assert cli_state_load(state, source="warehouse", target="mart") == ["Db.dbo.DimAccount"]
+    assert [file.name for file in tmp_path.iterdir()] == ["state.json"]
+    with pytest.raises(SQLStateError, match="is of a copy from warehouse to mart, not from warehouse to lake"):
+        cli_state_load(state, source="warehouse", target="lake")
+
+
+def test_cli_state_invalid(tmp_path):
+    state = tmp_path / "state.json"
+    state.write_text('{"completed": ["Db.dbo.DimAccount"')
+    with pytest.raises(SQLStateError, match="could not be read"):
+        cli_state_load(str(state), source="warehouse", target="mart")
+
+
+def cli_report_load(report):
+    with open(report) as file:
+        return load(file)
+
+
+class TestCopy:
+
+    def copy(self, profiles_path, tmp_path, source, *args, target=None):
+        target = MagicMock() if target is None else target
+        with patch("sql_system_transfer.cli.Engine", side_effect=cli_engines(source, target)):
+            return main(["--profiles", profiles_path, "copy", "warehouse", "mart", *args,
+                         "--state", str(tmp_path / "state.json")])
+
+    def test_copy(self, profiles_path, tmp_path, source):
+        assert self.copy(profiles_path, tmp_path, source, "AdventureWorksDW.dbo.*", "--workers", "2") == EXIT_SUCCESS
+        calls = [call.kwargs for call in source.engine_transfer_tables.call_args_list]
+        assert [(call["tables"], call["workers"]) for call in calls] == [(
+            ["AdventureWorksDW.dbo.DimAccount", "AdventureWorksDW.dbo.DimCurrency", "AdventureWorksDW.dbo.FactSales"], 2
+        )]
+        assert cli_state_load(str(tmp_path / "state.json"), source="warehouse", target="mart") == [
+            "AdventureWorksDW.dbo.DimAccount", "AdventureWorksDW.dbo.DimCurrency", "AdventureWorksDW.dbo.FactSales"
+        ]
+
+    def test_copy_resume(self, profiles_path, tmp_path, source):
+        cli_state_save(str(tmp_path / "state.json"), "warehouse", "mart", ["AdventureWorksDW.dbo.FactSales"])
+        assert self.copy(profiles_path, tmp_path, source, "AdventureWorksDW.dbo.*", "--resume") == EXIT_SUCCESS
+        calls = [call.kwargs["tables"] for call in source.engine_transfer_tables.call_args_list]
+        assert calls == [["AdventureWorksDW.dbo.DimAccount", "AdventureWorksDW.dbo.DimCurrency"]]
+
+    @pytest.mark.parametrize(
+        "state, expected_result", [
+            ('{"source": "warehouse", "target": "lake", "completed": []}', "is of a copy from warehouse to lake"),
+            ('{"completed": [', "could not be read"),
+        ])
+    def test_copy_resume_invalid(self, profiles_path, tmp_path, source, capsys, state, expected_result):
+        (tmp_path / "state.json").write_text(state)
+        assert self.copy(profiles_path, tmp_path, source, "AdventureWorksDW.dbo.*", "--resume") == EXIT_USAGE
+        assert expected_result in capsys.readouterr().err
+        source.engine_transfer_tables.assert_not_called()
+
+    def test_copy_report(self, profiles_path, tmp_path, source, capsys):
+        report = str(tmp_path / "report.json")
+        assert self.copy(profiles_path, tmp_path, source, "AdventureWorksDW.dbo.Dim*", "--report", report) == EXIT_SUCCESS
+        assert [table["table_name"] for table in cli_report_load(report)["tables"]] == [
+            "AdventureWorksDW.dbo.DimAccount", "AdventureWorksDW.dbo.DimCurrency"
+        ]
+        lines = capsys.readouterr().out.splitlines()
+        assert [line.split(" (")[0] for line in lines[-2:]] == [
+            "[1/2] AdventureWorksDW.dbo.DimAccount - 10 rows in 0.5s",
+            "[2/2] AdventureWorksDW.dbo.DimCurrency - 10 rows in 0.5s",
+        ]
+
+    def test_copy_progress(self, profiles_path, tmp_path, source):
+        assert self.copy(profiles_path, tmp_path, source, "AdventureWorksDW.dbo.Dim*", "--progress") == EXIT_SUCCESS
+        assert [type(hook) for hook in source.hooks] == [TransferProgress, CopyState]
+
+    def test_copy_no_tables(self, profiles_path, tmp_path, source):
+        assert self.copy(profiles_path, tmp_path, source, "AdventureWorksDW.dbo.v*") == EXIT_USAGE
+
+    def test_copy_transfer_failed(self, profiles_path, tmp_path, source):
+        def transfer_tables(tables, **kwargs):
+            source.hooks[0](TransferEvent(phase="table", seconds=0.5, database="AdventureWorksDW",
+                                          table_name="AdventureWorksDW.dbo.DimAccount", rows=10))
+            raise SQLiteError("08S01", "link failure")
+
+        source.engine_transfer_tables.side_effect = transfer_tables
+        report = str(tmp_path / "report.json")
+        assert self.copy(profiles_path, tmp_path, source, "AdventureWorksDW.dbo.Dim*", "--report", report) == \
+            EXIT_TRANSFER_FAILED
+        assert cli_state_load(str(tmp_path / "state.json"), source="warehouse", target="mart") == [
+            "AdventureWorksDW.dbo.DimAccount"
+        ]
+        assert [(table["table_name"], table["status"]) for table in cli_report_load(report)["tables"]] == [
+            ("AdventureWorksDW.dbo.DimCurrency", "failed")
+        ]
+
+    def test_copy_verify_failed(self, profiles_path, tmp_path, source):
+        source.engine_sample_tables.return_value = [MagicMock(**{"verification_passed.return_value": False})]
+        assert self.copy(profiles_path, tmp_path, source, "AdventureWorksDW.dbo.Dim*", "--verify", "sample") == \
+            EXIT_VERIFY_FAILED
+
+    def test_copy_connection_failed(self, profiles_path, tmp_path):
+        with patch("sql_system_transfer.cli.Engine", side_effect=SQLiteError("08001", "unable to connect")):
+            assert main(["--profiles", profiles_path, "copy", "warehouse", "mart", "*"]) == EXIT_CONNECTION_FAILED
@@ -141,6 +141,48 @@ class TestMySQLDatatypeFactory:
         with pytest.raises(sql_dt.SQLDatatypeError):
             datatype = datatype_factory.create_datatype(datatype_name="invalid")
 
+class TestSQLiteDatatypeFactory:
+
+    @pytest.fixture()
+    def datatype_factory(self):
+        datatype_factory = sql_dt.SQLiteDatatypeFactory()
+        return datatype_factory
+
+    @pytest.mark.parametrize(
+        "datatype_name, expected_result", [
+            ('varchar', sql_dt.SQLiteText),
+            ('nvarchar', sql_dt.SQLiteText),
+            ('character', sql_dt.SQLiteText),
+            ('nchar', sql_dt.SQLiteText),
+            ('text', sql_dt.SQLiteText),
+            ('clob', sql_dt.SQLiteText),
+            ('blob', sql_dt.SQLiteBlob),
+            ('', sql_dt.SQLiteBlob),
+            ('binary', sql_dt.SQLiteBlob),
+            ('varbinary', sql_dt.SQLiteBlob),
+            ('integer', sql_dt.SQLiteInteger),
+            ('int', sql_dt.SQLiteInteger),
+            ('int8', sql_dt.SQLiteInteger),
+            ('tinyint', sql_dt.SQLiteInteger),
+            ('boolean', sql_dt.SQLiteInteger),
+            ('real', sql_dt.SQLiteReal),
+            ('double precision', sql_dt.SQLiteReal),
+            ('float', sql_dt.SQLiteReal),
+            ('numeric', sql_dt.SQLiteNumeric),
+            ('decimal', sql_dt.SQLiteNumeric),
+            ('date', sql_dt.SQLiteDatetime),
+            ('datetime', sql_dt.SQLiteDatetime),
+            ('timestamp', sql_dt.SQLiteDatetime),
+            ('time', sql_dt.SQLiteDatetime),
+        ])
+    def test_create_datatype(self, datatype_factory, datatype_name, expected_result):
+        datatype = datatype_factory.create_datatype(datatype_name)
+        assert isinstance(datatype, expected_result)
+
+    def test_create_datatype_raise_exception(self, datatype_factory):
+        with pytest.raises(sql_dt.SQLDatatypeError):
+            datatype = datatype_factory.create_datatype(datatype_name="invalid")
+
 class TestMsSQLVarchar:
 
     @pytest.fixture()
@@ -1649,4 +1691,85 @@ class TestMySQLYear:
 
     def test_datatype_name_property_getter(self, datatype):
         datatype_name = datatype.datatype_name
-        assert datatype_name == "year"
\ No newline at end of file
+        assert datatype_name == "year"
+
+
+class TestSQLiteDatatypes:
+
+    @pytest.mark.parametrize(
+        "datatype, expected_result", [
+            (sql_dt.SQLiteText("varchar", 50), "varchar(50)"),
+            (sql_dt.SQLiteText("text", 50), "text"),
+            (sql_dt.SQLiteText("nvarchar"), "nvarchar"),
+            (sql_dt.SQLiteBlob("binary", 16), "binary(16)"),
+            (sql_dt.SQLiteBlob("blob", 16), "blob"),
+            (sql_dt.SQLiteInteger("invalid"), "integer"),
+            (sql_dt.SQLiteReal("double"), "double"),
+            (sql_dt.SQLiteNumeric("decimal", 19, 4), "decimal(19, 4)"),
+            (sql_dt.SQLiteNumeric("decimal", 10, 12), "decimal(10, 0)"),
+            (sql_dt.SQLiteNumeric("numeric", None, 4), "numeric"),
+            (sql_dt.SQLiteDatetime("datetime", 6), "datetime(6)"),
+            (sql_dt.SQLiteDatetime("date", 6), "date"),
+        ])
+    def test_datatype_format(self, datatype, expected_result):
+        assert datatype.datatype_format() == expected_result
+
+    def test_datatype_parameters(self):
+        datatype = sql_dt.SQLiteNumeric("decimal", 19, 4)
+        assert datatype.datatype_parameters() == {
+            "datatype_name": "decimal", "numeric_precision": 19, "numeric_scale": 4
+        }
+        assert datatype.datatype_convert(SQLSystem.SQLITE) is datatype
+
+    @pytest.mark.parametrize(
+        "datatype, expected_mssql, expected_mysql", [
+            (sql_dt.SQLiteText("varchar", 50), "varchar(50)", "varchar(50) character set utf8mb4"),
+            (sql_dt.SQLiteText("nchar", 10), "nchar(10)", "char(10) character set utf8mb4"),
+            (sql_dt.SQLiteText("varchar", 20000), "varchar(max)", "longtext character set utf8mb4"),
+            (sql_dt.SQLiteText("text"), "nvarchar(max)", "longtext character set utf8mb4"),
+            (sql_dt.SQLiteBlob("binary", 16), "binary(16)", "binary(16)"),
+            (sql_dt.SQLiteBlob("varbinary", 1000), "varbinary(1000)", "varbinary(1000)"),
+            (sql_dt.SQLiteBlob("blob"), "varbinary(max)", "longblob"),
+            (sql_dt.SQLiteInteger("integer"), "bigint", "bigint"),
+            (sql_dt.SQLiteInteger("tinyint"), "smallint", "tinyint"),
+            (sql_dt.SQLiteInteger("boolean"), "bit", "tinyint"),
+            (sql_dt.SQLiteReal("real"), "float", "double"),
+            (sql_dt.SQLiteNumeric("decimal", 19, 4), "decimal(19, 4)", "decimal(19, 4)"),
+            (sql_dt.SQLiteNumeric("numeric"), "numeric(38, 10)", "decimal(38, 10)"),
+            (sql_dt.SQLiteDatetime("date"), "date", "date"),
+            (sql_dt.SQLiteDatetime("datetime", 3), "datetime2(3)", "datetime(3)"),
+            (sql_dt.SQLiteDatetime("time"), "time(7)", "time(6)"),
+        ])
+    def test_datatype_convert(self, datatype, expected_mssql, expected_mysql):
+        assert datatype.datatype_convert(SQLSystem.MSSQL).datatype_format() == expected_mssql
+        assert datatype.datatype_convert(SQLSystem.MYSQL).datatype_format().strip() == expected_mysql
+
+    @pytest.mark.parametrize(
+        "datatype, expected_result", [
+            (sql_dt.MsSQLVarchar("nvarchar", 50), "nvarchar(50)"),
+            (sql_dt.MsSQLVarchar("varchar", -1), "varchar"),
+            (sql_dt.MsSQLText("ntext"), "text"),
+            (sql_dt.MsSQLChar("char", 3), "char(3)"),
+            (sql_dt.MsSQLVarbinary(-1), "varbinary"),
+            (sql_dt.MsSQLOther("uniqueidentifier"), "char(36)"),
+            (sql_dt.MsSQLOther("geography"), "blob"),
+            (sql_dt.MsSQLNumeric("numeric", 18, 2), "numeric(18, 2)"),
+            (sql_dt.MsSQLMoney("money"), "decimal(19, 4)"),
+            (sql_dt.MsSQLFloat("float"), "float"),
+            (sql_dt.MsSQLInteger("bit"), "boolean"),
+            (sql_dt.MsSQLDatetimeOne("smalldatetime"), "datetime"),
+            (sql_dt.MsSQLDatetimeTwo("datetimeoffset", 7), "datetime(7)"),
+            (sql_dt.MsSQLTimestamp(), "binary(8)"),
+            (sql_dt.MySQLVarchar(50, "utf8mb4"), "nvarchar(50)"),
+            (sql_dt.MySQLChar(5, "latin1"), "char(5)"),
+            (sql_dt.MySQLOtherText("mediumtext"), "text"),
+            (sql_dt.MySQLOtherBlob("tinyblob"), "blob"),
+            (sql_dt.MySQLDecimal(10, 2), "decimal(10, 2)"),
+            (sql_dt.MySQLInteger("int", "unsigned"), "bigint"),
+            (sql_dt.MySQLInteger("serial"), "numeric(20, 0)"),
+            (sql_dt.MySQLBit(1), "boolean"),
+            (sql_dt.MySQLDatetime("timestamp", 3), "timestamp(3)"),
+            (sql_dt.MySQLYear(), "smallint"),
+        ])
+    def test_datatype_convert_to_sqlite(self, datatype, expected_result):
+        assert datatype.datatype_convert(SQLSystem.SQLITE).datatype_format() == expected_result
@@ -2,7 +2,7 @@ import pytest
 from sql_system_transfer.datatype_dictionary import DatatypeDictionary, SQLSystem, SQLSystemError
 from frozendict import frozendict
 
-system_parameters = [SQLSystem.MSSQL, SQLSystem.MYSQL, ]
+system_parameters = [SQLSystem.MSSQL, SQLSystem.MYSQL, SQLSystem.SQLITE, ]
 pytest_parameters_sql_system = pytest.mark.parametrize("system", system_parameters)
 
 @pytest_parameters_sql_system
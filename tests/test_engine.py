@@ -1,7 +1,15 @@
 import pytest
+import sqlite3
+from random import Random
 import unittest
-from unittest.mock import patch
-from sql_system_transfer.engine import SQLSystem, Engine, Database, MsSQLTable, MySQLTable, Column
+from unittest.mock import MagicMock, patch
+from sql_system_transfer.engine import SQLSystem, Engine, Database, MsSQLTable, MySQLTable, SQLiteTable, Column, \
+    SQLTableError, engine_driver_installed
+from sql_system_transfer.report import TransferReport
+from sql_system_transfer.retry import RetryPolicy
+from sql_system_transfer.scheduler import TransferTask
+from sql_system_transfer.sqlite import SQLiteError
+import sql_system_transfer.verify as sql_vf
 
 """
 functional, integrated test think about how to implement.
@@ -11,7 +19,9 @@ to send the correct responses, we can mock the HTTP library and replace all the
 reduces test complexity and dependencies, and gives us precise control over what the HTTP library returns, which may be
 difficult to accomplish otherwise.
 
-In the Engine class we will try to mock the pyodbc library and replace all the pyodbc calls with mock calls.
+In the Engine class we will try to mock the pyodbc library and replace all the pyodbc calls with mock calls.  Engine
+also takes a connection_factory, and sql_system_transfer.fake.FakeBackend serves generated tables in process, see
+test_fake.py.
 """
 
 
@@ -59,6 +69,51 @@ class TestDatabase:
         assert len(database.database_tables) == 1
         assert isinstance(database.database_tables[0], MsSQLTable)
 
+    @pytest.mark.parametrize(
+        "convert_to_system", [SQLSystem.MSSQL, SQLSystem.MYSQL])
+    def test_database_table_convert_columns(self, database, convert_to_system):
+        table = {'schema': 'dbo', 'table': 'DimCurrency', 'table_type': 'BASE TABLE'}
+        table_columns = [
+            {'column_name': 'CurrencyKey', 'nullable': 'NO', 'datatype_name': 'int', 'character_size': None,
+             'character_set': None, 'numeric_precision': 10, 'numeric_scale': 0, 'datetime_precision': None},
+            {'column_name': 'CurrencyName', 'nullable': 'NO', 'datatype_name': 'nvarchar', 'character_size': 50,
+             'character_set': 'UNICODE', 'numeric_precision': None, 'numeric_scale': None, 'datetime_precision': None},
+        ]
+        database.add_table_to_database(table=table, columns=table_columns)
+        columns = {"Testing.dbo.DimCurrency": ["CurrencyName"]}
+        old_tables = database.database_table_convert_old(tables=["Testing.dbo.DimCurrency"], columns=columns)
+        new_tables = database.database_table_convert_new(
+            tables=["Testing.dbo.DimCurrency"], convert_to_system=convert_to_system, columns=columns
+        )
+        assert [column.column_name for column in old_tables[0].table_columns] == ["CurrencyName"]
+        assert [column.column_name for column in new_tables[0].table_columns] == ["CurrencyName"]
+
+    def test_database_table_dependencies(self, database):
+        columns = [{'column_name': 'CurrencyKey', 'datatype_name': 'int'}]
+        foreign_key = {
+            'constraint': 'FK_Child_Parent', 'columns': ['CurrencyKey'], 'referenced_schema': 'dbo',
+            'referenced_table': 'Parent', 'referenced_columns': ['CurrencyKey']
+        }
+        database.add_table_to_database(table={'table': 'Parent', 'table_type': 'BASE TABLE'}, columns=columns)
+        database.add_table_to_database(
+            table={'table': 'Child', 'table_type': 'BASE TABLE', 'table_foreign_keys': [foreign_key]}, columns=columns
+        )
+        dependencies = database.database_table_dependencies(tables=["Testing.dbo.Parent", "Testing.dbo.Child"])
+        assert dependencies == {"Testing.dbo.Parent": set(), "Testing.dbo.Child": {"Testing.dbo.Parent"}}
+        dependencies = database.database_table_dependencies(tables=["Testing.dbo.Child"])
+        assert dependencies == {"Testing.dbo.Child": set()}
+
+    def test_database_table_keys(self, database):
+        columns = [{'column_name': 'CurrencyKey', 'datatype_name': 'int'}, {'column_name': 'Name', 'datatype_name': 'int'}]
+        index = {'index': 'PRIMARY', 'index_type': 'PRIMARY KEY', 'columns': ['CurrencyKey']}
+        database.add_table_to_database(
+            table={'table': 'DimCurrency', 'table_type': 'BASE TABLE', 'table_indexes': [index]}, columns=columns
+        )
+        database.add_table_to_database(table={'table': 'Heap', 'table_type': 'BASE TABLE'}, columns=columns)
+        tables = ["Testing.dbo.DimCurrency", "Testing.dbo.Heap"]
+        assert database.database_table_keys(tables=tables) == {"Testing.dbo.DimCurrency": ["CurrencyKey"]}
+        assert database.database_table_keys(tables=tables, columns={"Testing.dbo.DimCurrency": ["Name"]}) == {}
+
 
 class TestMsSQLTable:
 
@@ -84,6 +139,16 @@ class TestMsSQLTable:
         table_parameters = table.table_parameters()
         assert table_parameters == {"table": "DimAccount", "table_type": "BASE TABLE", "schema": "dbo"}
 
+    def test_table_statistics(self):
+        table = MsSQLTable(
+            table="DimAccount", table_type="BASE TABLE", table_rows=99, table_data_bytes=16384, table_index_bytes=8192,
+            init_table_columns=self.table_columns
+        )
+        convert_table = table.table_convert(convert_to_system=SQLSystem.MYSQL)
+        expected_result = {"table_rows": 99, "table_data_bytes": 16384, "table_index_bytes": 8192}
+        assert table.table_statistics() == expected_result
+        assert convert_table.table_statistics() == expected_result
+
     @pytest.mark.parametrize(
         "convert_to_system, expected_result", [
             (SQLSystem.MSSQL, MsSQLTable),
@@ -131,6 +196,215 @@ class TestMsSQLTable:
         statement = table.statement_select_table(database="testing", alt_table_name=alt_table_name)
         assert statement in expected_result
 
+    def test_statement_insert_table_lock(self, table):
+        statement = table.statement_insert_table(database="testing", table_lock=True)
+        assert statement.startswith("INSERT INTO testing.dbo.DimAccount WITH (TABLOCK) (AccountKey")
+
+    def test_statement_cache(self, table):
+        statement = table.statement_insert_table(database="testing")
+        assert table.statement_insert_table(database="testing") is statement
+        assert table.statement_insert_table(database="testing", alt_table_name="new_name") is not statement
+        assert table.statement_insert_table(database="testing", table_lock=True) is not statement
+        assert table.statement_select_table_page(database="testing", keys=["AccountKey"], page_size=10) is \
+            table.statement_select_table_page(database="testing", keys=["AccountKey"], page_size=10)
+
+    def test_statement_cache_invalidate(self, table):
+        statement = table.statement_insert_table(database="testing")
+        table.table_columns.pop()
+        assert table.statement_insert_table(database="testing") == \
+            "INSERT INTO testing.dbo.DimAccount (AccountKey, ParentAccountKey) VALUES (?,?);"
+        assert statement.endswith("VALUES (?,?,?);")
+
+    def test_statement_fast_load(self, table):
+        assert table.statement_fast_load(database="testing") == []
+        assert table.statement_fast_load_restore(database="testing") == []
+
+    def test_statement_select_table_predicate(self, table):
+        statement = table.statement_select_table(database="testing", predicate="AccountKey > ?")
+        assert statement == "SELECT * FROM testing.dbo.DimAccount WHERE AccountKey > ?;"
+
+    def test_statement_select_table_columns(self, table):
+        statement = table.statement_select_table(database="testing", columns=["AccountKey", "ParentAccountKey"])
+        assert statement == "SELECT AccountKey, ParentAccountKey FROM testing.dbo.DimAccount;"
+
+    @pytest.mark.parametrize(
+        "convert_to_system, expected_result", [
+            (SQLSystem.MSSQL, "CREATETABLEtesting.dbo.DimAccount(ParentAccountKeyintnull,AccountKeyintnotnull);"),
+            (SQLSystem.MYSQL, "CREATETABLEtesting.DimAccount(ParentAccountKeyintnull,AccountKeyintnotnull);"),
+        ])
+    def test_table_convert_columns(self, table, convert_to_system, expected_result):
+        convert_table = table.table_convert(convert_to_system=convert_to_system, columns=["ParentAccountKey", "AccountKey"])
+        statement = convert_table.statement_create_table(database="testing").replace("\n", "").replace(" ", "")
+        assert statement == expected_result
+
+    def test_table_project(self, table):
+        project_table = table.table_project(columns=["AccountKey"])
+        assert isinstance(project_table, MsSQLTable)
+        assert [column.column_name for column in project_table.table_columns] == ["AccountKey"]
+
+    def test_table_project_raise_exception(self, table):
+        with pytest.raises(SQLTableError):
+            table.table_project(columns=["AccountKey", "invalid"])
+
+    table_indexes = [
+        {'index': 'PK_DimAccount', 'index_type': 'PRIMARY KEY', 'columns': ['AccountKey']},
+        {'index': 'AK_DimAccount', 'index_type': 'UNIQUE', 'columns': ['AccountCodeAlternateKey']},
+        {'index': 'IX_DimAccount', 'index_type': 'INDEX', 'columns': ['ParentAccountKey', 'AccountKey']},
+    ]
+
+    @pytest.mark.parametrize(
+        "convert_to_system, expected_result", [
+            (SQLSystem.MSSQL, [
+                "ALTER TABLE testing.dbo.DimAccount ADD CONSTRAINT PK_DimAccount PRIMARY KEY (AccountKey);",
+                "CREATE UNIQUE INDEX AK_DimAccount ON testing.dbo.DimAccount (AccountCodeAlternateKey);",
+                "CREATE INDEX IX_DimAccount ON testing.dbo.DimAccount (ParentAccountKey, AccountKey);",
+            ]),
+            (SQLSystem.MYSQL, [
+                "ALTER TABLE testing.DimAccount ADD CONSTRAINT PK_DimAccount PRIMARY KEY (AccountKey);",
+                "CREATE UNIQUE INDEX AK_DimAccount ON testing.DimAccount (AccountCodeAlternateKey);",
+                "CREATE INDEX IX_DimAccount ON testing.DimAccount (ParentAccountKey, AccountKey);",
+            ]),
+        ])
+    def test_statement_create_indexes(self, convert_to_system, expected_result):
+        table = MsSQLTable(
+            table="DimAccount", table_type="BASE TABLE", table_indexes=self.table_indexes,
+            init_table_columns=self.table_columns
+        )
+        convert_table = table.table_convert(convert_to_system=convert_to_system)
+        assert convert_table.statement_create_indexes(database="testing") == expected_result
+        assert table.table_project(columns=["AccountKey"]).statement_create_indexes(database="testing") == [
+            "ALTER TABLE testing.dbo.DimAccount ADD CONSTRAINT PK_DimAccount PRIMARY KEY (AccountKey);"
+        ]
+
+    def test_table_primary_key(self, table):
+        assert table.table_primary_key() is None
+        table = MsSQLTable(
+            table="DimAccount", table_type="BASE TABLE", table_indexes=self.table_indexes,
+            init_table_columns=self.table_columns
+        )
+        assert table.table_primary_key() == ["AccountKey"]
+
+    @pytest.mark.parametrize(
+        "convert_to_system, expected_result", [
+            (SQLSystem.MSSQL, ["ALTER TABLE testing.dbo.DimAccount ADD CONSTRAINT FK_DimAccount_DimAccount "
+                               "FOREIGN KEY (ParentAccountKey) REFERENCES testing.dbo.DimAccount (AccountKey);"]),
+            (SQLSystem.MYSQL, ["ALTER TABLE testing.DimAccount ADD CONSTRAINT FK_DimAccount_DimAccount "
+                               "FOREIGN KEY (ParentAccountKey) REFERENCES testing.DimAccount (AccountKey);"]),
+        ])
+    def test_statement_add_foreign_keys(self, convert_to_system, expected_result):
+        foreign_keys = [{
+            'constraint': 'FK_DimAccount_DimAccount', 'columns': ['ParentAccountKey'], 'referenced_schema': 'dbo',
+            'referenced_table': 'DimAccount', 'referenced_columns': ['AccountKey']
+        }]
+        table = MsSQLTable(
+            table="DimAccount", table_type="BASE TABLE", table_foreign_keys=foreign_keys,
+            init_table_columns=self.table_columns
+        )
+        convert_table = table.table_convert(convert_to_system=convert_to_system)
+        assert convert_table.statement_add_foreign_keys(database="testing") == expected_result
+        assert table.table_convert(convert_to_system=convert_to_system, columns=["AccountKey"]).table_foreign_keys == []
+
+    def test_statement_select_checksum(self, table):
+        statement = table.statement_select_checksum(database="testing", predicate="AccountKey >= ?")
+        assert statement == (
+            "SELECT COUNT(*), SUM(CONVERT(bigint, CONVERT(binary(4), HASHBYTES('MD5', "
+            "CONCAT(COALESCE(CAST(AccountKey AS varchar(max)), '~'), '|', "
+            "COALESCE(CAST(ParentAccountKey AS varchar(max)), '~'), '|', "
+            "COALESCE(CAST(AccountCodeAlternateKey AS varchar(max)), '~'), '|'))))) "
+            "FROM testing.dbo.DimAccount WHERE AccountKey >= ?;"
+        )
+
+    @pytest.mark.parametrize(
+        "keys, expected_result", [
+            (["AccountKey"], "SELECT * FROM testing.dbo.DimAccount WHERE AccountKey IN (?, ?, ?);"),
+            (["AccountKey", "ParentAccountKey"], "SELECT * FROM testing.dbo.DimAccount WHERE "
+             "(AccountKey = ? AND ParentAccountKey = ?) OR (AccountKey = ? AND ParentAccountKey = ?) OR "
+             "(AccountKey = ? AND ParentAccountKey = ?);"),
+        ])
+    def test_statement_select_keys(self, table, keys, expected_result):
+        statement = table.statement_select_keys(database="testing", keys=keys, key_count=3)
+        assert statement == expected_result
+
+    def test_statement_select_sample_keys(self, table):
+        statement = table.statement_select_sample_keys(database="testing", keys=["AccountKey"], sample_size=100)
+        assert statement == "SELECT TOP (100) AccountKey FROM testing.dbo.DimAccount TABLESAMPLE (100.0000 PERCENT);"
+
+    @pytest.mark.parametrize(
+        "datatype_name, expected_result", [
+            ("money", "CAST(CAST(Amount AS decimal(38, 6)) AS varchar(max))"),
+            ("datetime2", "CONVERT(varchar(19), Amount, 120)"),
+            ("varbinary", "CONVERT(varchar(max), CAST(Amount AS varbinary(max)), 2)"),
+            ("nchar", "RTRIM(CAST(Amount AS varchar(max)))"),
+            ("float", "CASE WHEN Amount = 0 THEN '0' WHEN Amount IS NOT NULL THEN CONCAT(CAST(ROUND(Amount / "
+                      "POWER(CAST(10 AS float), FLOOR(LOG10(ABS(Amount)))), 12) AS decimal(15, 12)), 'E', "
+                      "CAST(FLOOR(LOG10(ABS(Amount))) AS int)) END"),
+            ("uniqueidentifier", "REPLACE(CAST(Amount AS char(36)), '-', '')"),
+        ])
+    def test_checksum_column(self, table, datatype_name, expected_result):
+        column = Column(system=SQLSystem.MSSQL, column_name="Amount", datatype_name=datatype_name, character_size=10,
+                        numeric_precision=19, numeric_scale=4, datetime_precision=7)
+        assert table._checksum_column(column) == expected_result
+
+    def test_checksum_uniqueidentifier(self, table):
+        # the source text of a GUID against the HEX of the binary(16) a MySQL target holds, both evaluated in SQLite
+        column = Column(system=SQLSystem.MSSQL, column_name="?", datatype_name="uniqueidentifier")
+        guid = "6F9619FF-8B86-D011-B42D-00C04FD430C8"
+        connection = sqlite3.connect(":memory:")
+        source = connection.execute(f"SELECT {table._checksum_column(column)};", (guid,)).fetchone()[0]
+        target = connection.execute("SELECT hex(?);", (sql_vf.verify_parameter(guid, "uniqueidentifier", "binary"),))
+        assert source == target.fetchone()[0] == sql_vf.verify_value(guid, "uniqueidentifier")
+
+    def test_statement_select_max(self, table):
+        statement = table.statement_select_max(database="testing", column_name="AccountKey")
+        assert statement == "SELECT MAX(AccountKey) FROM testing.dbo.DimAccount;"
+
+    def test_statement_select_range(self, table):
+        statement = table.statement_select_range(database="testing", column_name="AccountKey", predicate="AccountKey > 0")
+        assert statement == "SELECT MIN(AccountKey), MAX(AccountKey) FROM testing.dbo.DimAccount WHERE AccountKey > 0;"
+
+    @pytest.mark.parametrize(
+        "keys, predicate, first_page, expected_result", [
+            (["AccountKey"], None, True, "SELECT TOP (500) * FROM testing.dbo.DimAccount ORDER BY AccountKey;"),
+            (["AccountKey"], None, False,
+             "SELECT TOP (500) * FROM testing.dbo.DimAccount WHERE ((AccountKey > ?)) ORDER BY AccountKey;"),
+            (["AccountKey", "ParentAccountKey"], "ParentAccountKey > ?", False,
+             "SELECT TOP (500) * FROM testing.dbo.DimAccount WHERE (ParentAccountKey > ?) AND ((AccountKey > ?) OR "
+             "(AccountKey = ? AND ParentAccountKey > ?)) ORDER BY AccountKey, ParentAccountKey;"),
+        ])
+    def test_statement_select_table_page(self, table, keys, predicate, first_page, expected_result):
+        statement = table.statement_select_table_page(
+            database="testing", keys=keys, page_size=500, predicate=predicate, first_page=first_page
+        )
+        assert statement == expected_result
+
+    @pytest.mark.parametrize(
+        "last_key, expected_result", [
+            ([10], [10]),
+            ([10, 20, 30], [10, 10, 20, 10, 20, 30]),
+        ])
+    def test_table_keyset_parameters(self, table, last_key, expected_result):
+        keyset_parameters = table.table_keyset_parameters(last_key)
+        assert keyset_parameters == expected_result
+
+    @pytest.mark.parametrize(
+        "keys, expected_result", [
+            (["AccountKey"], "MERGEINTOtesting.dbo.DimAccountAStargetUSING(SELECT?ASAccountKey,?ASParentAccountKey,"
+                             "?ASAccountCodeAlternateKey)ASsourceONtarget.AccountKey=source.AccountKeyWHENMATCHEDTHEN"
+                             "UPDATESETtarget.ParentAccountKey=source.ParentAccountKey,target.AccountCodeAlternateKey="
+                             "source.AccountCodeAlternateKeyWHENNOTMATCHEDTHENINSERT(AccountKey,ParentAccountKey,"
+                             "AccountCodeAlternateKey)VALUES(source.AccountKey,source.ParentAccountKey,"
+                             "source.AccountCodeAlternateKey);"),
+            (["AccountKey", "ParentAccountKey", "AccountCodeAlternateKey"],
+             "MERGEINTOtesting.dbo.DimAccountAStargetUSING(SELECT?ASAccountKey,?ASParentAccountKey,"
+             "?ASAccountCodeAlternateKey)ASsourceONtarget.AccountKey=source.AccountKeyANDtarget.ParentAccountKey="
+             "source.ParentAccountKeyANDtarget.AccountCodeAlternateKey=source.AccountCodeAlternateKeyWHENNOTMATCHED"
+             "THENINSERT(AccountKey,ParentAccountKey,AccountCodeAlternateKey)VALUES(source.AccountKey,"
+             "source.ParentAccountKey,source.AccountCodeAlternateKey);"),
+        ])
+    def test_statement_upsert_table(self, table, keys, expected_result):
+        statement = table.statement_upsert_table(database="testing", keys=keys).replace("\n", "").replace(" ", "")
+        assert statement == expected_result
+
     @pytest.mark.parametrize(
         "alt_table_name, expected_result", [
             (None, "DROP TABLE IF EXISTS testing.dbo.DimAccount;"),
@@ -220,6 +494,108 @@ class TestMySQLTable:
         statement = table.statement_select_table(database="testing", alt_table_name=alt_table_name)
         assert statement in expected_result
 
+    def test_statement_insert_table_lock(self, table):
+        statement = table.statement_insert_table(database="testing", table_lock=True)
+        assert statement.startswith("INSERT INTO testing.DimCurrency (CurrencyKey")
+
+    def test_statement_fast_load(self, table):
+        assert table.statement_fast_load(database="testing") == [
+            "SET @sst_unique_checks = @@unique_checks, unique_checks = 0;",
+            "SET @sst_foreign_key_checks = @@foreign_key_checks, foreign_key_checks = 0;",
+        ]
+        assert table.statement_fast_load_restore(database="testing") == [
+            "SET foreign_key_checks = @sst_foreign_key_checks;",
+            "SET unique_checks = @sst_unique_checks;",
+        ]
+
+    def test_statement_select_table_predicate(self, table):
+        statement = table.statement_select_table(database="testing", predicate="CurrencyKey > ?")
+        assert statement == "SELECT * FROM testing.DimCurrency WHERE CurrencyKey > ?;"
+
+    def test_statement_select_checksum(self, table):
+        statement = table.statement_select_checksum(database="testing")
+        assert statement == (
+            "SELECT COUNT(*), SUM(CAST(CONV(LEFT(MD5(CONCAT(COALESCE(CAST(CurrencyKey AS CHAR), '~'), '|', "
+            "COALESCE(CAST(CurrencyAlternateKey AS CHAR), '~'), '|', "
+            "COALESCE(CAST(CurrencyName AS CHAR), '~'), '|')), 8), 16, 10) AS UNSIGNED)) FROM testing.DimCurrency;"
+        )
+
+    def test_checksum_concat(self):
+        # 300 columns are 600 arguments, more than SQL Server's CONCAT takes; the nested groups give the same row text
+        columns = [{'column_name': f"c{index}", 'nullable': 'YES', 'datatype_name': 'int', 'character_size': None,
+                    'character_set': None, 'numeric_precision': 10, 'numeric_scale': 0, 'datetime_precision': None}
+                   for index in range(300)]
+        table = MySQLTable(table="Wide", table_type="BASE TABLE", init_table_columns=columns)
+        arguments = []
+
+        def concat(*values):
+            arguments.append(len(values))
+            return "".join(values)
+
+        connection = sqlite3.connect(":memory:")
+        connection.create_function("CONCAT", -1, concat)
+        connection.execute(f"CREATE TABLE Wide ({', '.join([column['column_name'] for column in columns])});")
+        connection.execute(f"INSERT INTO Wide VALUES ({', '.join(['?'] * 300)});", [*range(299), None])
+        row = table._checksum_concat([part for column in table.table_columns
+                                      for part in [f"COALESCE({table._checksum_column(column)}, '~')", "'|'"]])
+        assert connection.execute(f"SELECT {row} FROM Wide;").fetchone()[0] == \
+            "".join([f"{value}|" for value in [*range(299), "~"]])
+        assert max(arguments) <= 254 and min(arguments) >= 2
+
+    def test_statement_select_keys(self, table):
+        statement = table.statement_select_keys(database="testing", keys=["CurrencyKey"], key_count=2,
+                                                columns=["CurrencyKey"])
+        assert statement == "SELECT CurrencyKey FROM testing.DimCurrency WHERE CurrencyKey IN (?, ?);"
+
+    def test_statement_select_sample_keys(self, table):
+        statement = table.statement_select_sample_keys(database="testing", keys=["CurrencyKey"], sample_size=100)
+        assert statement == "SELECT CurrencyKey FROM testing.DimCurrency WHERE RAND() < 1.000000 LIMIT 100;"
+
+    @pytest.mark.parametrize(
+        "datatype_name, expected_result", [
+            ("double", "CASE WHEN Amount = 0 THEN '0' WHEN Amount IS NOT NULL THEN CONCAT(CAST(ROUND(Amount / "
+                       "POW(10, FLOOR(LOG10(ABS(Amount)))), 12) AS DECIMAL(15, 12)), 'E', "
+                       "CAST(FLOOR(LOG10(ABS(Amount))) AS SIGNED)) END"),
+            ("decimal", "CAST(CAST(Amount AS DECIMAL(38, 6)) AS CHAR)"),
+            ("datetime", "DATE_FORMAT(Amount, '%Y-%m-%d %H:%i:%s')"),
+            ("blob", "HEX(Amount)"),
+            ("bit", "CAST(CAST(Amount AS UNSIGNED) AS CHAR)"),
+        ])
+    def test_checksum_column(self, table, datatype_name, expected_result):
+        column = Column(system=SQLSystem.MYSQL, column_name="Amount", datatype_name=datatype_name, character_size=10,
+                        numeric_precision=19, numeric_scale=4, datetime_precision=0)
+        assert table._checksum_column(column) == expected_result
+
+    def test_statement_select_max(self, table):
+        statement = table.statement_select_max(database="testing", column_name="CurrencyKey")
+        assert statement == "SELECT MAX(CurrencyKey) FROM testing.DimCurrency;"
+
+    @pytest.mark.parametrize(
+        "keys, predicate, first_page, expected_result", [
+            (["CurrencyKey"], None, True, "SELECT * FROM testing.DimCurrency ORDER BY CurrencyKey LIMIT 500;"),
+            (["CurrencyKey"], "CurrencyName > ?", False,
+             "SELECT * FROM testing.DimCurrency WHERE (CurrencyName > ?) AND ((CurrencyKey > ?)) "
+             "ORDER BY CurrencyKey LIMIT 500;"),
+        ])
+    def test_statement_select_table_page(self, table, keys, predicate, first_page, expected_result):
+        statement = table.statement_select_table_page(
+            database="testing", keys=keys, page_size=500, predicate=predicate, first_page=first_page
+        )
+        assert statement == expected_result
+
+    @pytest.mark.parametrize(
+        "keys, expected_result", [
+            (["CurrencyKey"], "INSERTINTOtesting.DimCurrency(CurrencyKey,CurrencyAlternateKey,CurrencyName)VALUES(?,?,?)"
+                              "ONDUPLICATEKEYUPDATECurrencyAlternateKey=VALUES(CurrencyAlternateKey),"
+                              "CurrencyName=VALUES(CurrencyName);"),
+            (["CurrencyKey", "CurrencyAlternateKey", "CurrencyName"],
+             "INSERTINTOtesting.DimCurrency(CurrencyKey,CurrencyAlternateKey,CurrencyName)VALUES(?,?,?)"
+             "ONDUPLICATEKEYUPDATECurrencyKey=CurrencyKey;"),
+        ])
+    def test_statement_upsert_table(self, table, keys, expected_result):
+        statement = table.statement_upsert_table(database="testing", keys=keys).replace("\n", "").replace(" ", "")
+        assert statement == expected_result
+
     @pytest.mark.parametrize(
         "alt_table_name, expected_result", [
             (None, "DROP TABLE IF EXISTS testing.DimCurrency;"),
@@ -239,6 +615,93 @@ class TestMySQLTable:
         assert table_format == expected_result
 
 
+class TestSQLiteTable:
+
+    table_columns = [
+        {'column_name': 'AccountKey', 'nullable': 'NO', 'datatype_name': 'integer', 'character_size': None,
+         'character_set': None, 'numeric_precision': None, 'numeric_scale': None, 'datetime_precision': None},
+        {'column_name': 'ParentAccountKey', 'nullable': 'YES', 'datatype_name': 'int', 'character_size': None,
+         'character_set': None, 'numeric_precision': None, 'numeric_scale': None, 'datetime_precision': None},
+        {'column_name': 'AccountName', 'nullable': 'YES', 'datatype_name': 'varchar', 'character_size': 50,
+         'character_set': None, 'numeric_precision': 50, 'numeric_scale': None, 'datetime_precision': 50},
+    ]
+
+    @pytest.fixture()
+    def table(self):
+        return SQLiteTable(
+            table="DimAccount",
+            table_type="BASE TABLE",
+            table_indexes=[
+                {'index': 'PRIMARY', 'index_type': 'PRIMARY KEY', 'columns': ['AccountKey']},
+                {'index': 'UX_AccountName', 'index_type': 'UNIQUE', 'columns': ['AccountName']},
+            ],
+            table_foreign_keys=[
+                {'constraint': 'FK_DimAccount_0', 'columns': ['ParentAccountKey'], 'referenced_schema': None,
+                 'referenced_table': 'DimAccount', 'referenced_columns': ['AccountKey']},
+            ],
+            init_table_columns=self.table_columns
+        )
+
+    @pytest.mark.parametrize(
+        "convert_to_system, expected_result", [
+            (SQLSystem.MSSQL, "testing.dbo.DimAccount"),
+            (SQLSystem.MYSQL, "testing.DimAccount"),
+            (SQLSystem.SQLITE, "testing.DimAccount"),
+        ])
+    def test_table_convert(self, table, convert_to_system, expected_result):
+        assert table.table_convert(convert_to_system=convert_to_system).table_format(database="testing") == expected_result
+
+    def test_statement_create_table(self, table):
+        assert table.statement_create_table(database="main") == (
+            "CREATE TABLE main.DimAccount (\n\nAccountKey integer not null,\nParentAccountKey int null,\n"
+            "AccountName varchar(50) null,\nPRIMARY KEY (AccountKey),\n"
+            "FOREIGN KEY (ParentAccountKey) REFERENCES DimAccount (AccountKey)\n\n);"
+        )
+
+    def test_statement_create_indexes(self, table):
+        assert table.statement_create_indexes(database="main") == [
+            "CREATE UNIQUE INDEX main.UX_AccountName ON DimAccount (AccountName);"
+        ]
+        assert table.statement_add_foreign_keys(database="main") == []
+
+    def test_statement_select_checksum(self, table):
+        assert table.statement_select_checksum(database="main") == (
+            "SELECT COUNT(*), SUM(sst_checksum(COALESCE(CAST(AccountKey AS TEXT), '~') || '|' || "
+            "COALESCE(CAST(ParentAccountKey AS TEXT), '~') || '|' || COALESCE(CAST(AccountName AS TEXT), '~') || '|')) "
+            "FROM main.DimAccount;"
+        )
+
+    def test_statement_select_table_page(self, table):
+        statement = table.statement_select_table_page(database="main", keys=["AccountKey"], page_size=100)
+        assert statement == "SELECT * FROM main.DimAccount WHERE ((AccountKey > ?)) ORDER BY AccountKey LIMIT 100;"
+
+    def test_statement_select_sample_keys(self, table):
+        statement = table.statement_select_sample_keys(database="main", keys=["AccountKey"], sample_size=10,
+                                                       fraction=0.5)
+        assert statement == "SELECT AccountKey FROM main.DimAccount WHERE (RANDOM() & 1048575) < 524288 LIMIT 10;"
+
+    @pytest.mark.parametrize(
+        "settings, expected_result", [
+            (None, ["PRAGMA main.synchronous = FULL;"]),
+            ((1,), ["PRAGMA main.synchronous = 1;"]),
+        ])
+    def test_statement_fast_load_restore(self, table, settings, expected_result):
+        assert table.statement_fast_load_settings(database="main") == "PRAGMA main.synchronous;"
+        assert table.statement_fast_load_restore(database="main", settings=settings) == expected_result
+
+    @pytest.mark.parametrize(
+        "keys, expected_result", [
+            (["AccountKey"], "INSERT INTO main.DimAccount (AccountKey, ParentAccountKey, AccountName) VALUES (?,?,?) "
+                             "ON CONFLICT (AccountKey) DO UPDATE SET ParentAccountKey = excluded.ParentAccountKey, "
+                             "AccountName = excluded.AccountName;"),
+            (["AccountKey", "ParentAccountKey", "AccountName"],
+             "INSERT INTO main.DimAccount (AccountKey, ParentAccountKey, AccountName) VALUES (?,?,?) "
+             "ON CONFLICT (AccountKey, ParentAccountKey, AccountName) DO NOTHING;"),
+        ])
+    def test_statement_upsert_table(self, table, keys, expected_result):
+        assert table.statement_upsert_table(database="main", keys=keys) == expected_result
+
+
 class TestColumn:
 
     @pytest.fixture()
@@ -276,3 +739,202 @@ class TestColumn:
     def test_column_convert(self, column, convert_to_system):
         convert_column = column.column_convert(convert_to_system=convert_to_system)
         assert isinstance(convert_column, Column)
+
+
+class TestEngine:
+
+    class Cursor:
+
+        def __init__(self, errors=None, commit_errors=None):
+            self.errors = [] if errors is None else errors
+            self.commit_errors = [] if commit_errors is None else commit_errors
+            self.connection = MagicMock()
+            self.rows, self.commits, self.rollbacks = [], 0, 0
+
+        def executemany(self, statement, rows):
+            if self.errors:
+                raise self.errors.pop(0)
+            self.rows.extend(rows)
+
+        def commit(self):
+            if self.commit_errors:
+                raise self.commit_errors.pop(0)
+            self.commits += 1
+
+        def rollback(self):
+            self.rollbacks += 1
+
+    @pytest.fixture()
+    def engine(self):
+        with patch.object(Engine, "_engine_system_error"), patch.object(Engine, "_engine_connect"), \
+                patch.object(Engine, "_initialize_database"):
+            yield Engine(system=SQLSystem.MSSQL, server="localhost", database="testing")
+
+    @pytest.fixture()
+    def task(self):
+        table = MsSQLTable(table="DimAccount", table_type="BASE TABLE", init_table_columns=TestMsSQLTable.table_columns)
+        return TransferTask(table_name="testing.dbo.DimAccount", old_table=table, new_table=table)
+
+    def test_write_batch_retry(self, engine, task):
+        cursor = self.Cursor(errors=[SQLiteError("40001", "[40001] Transaction was deadlocked")])
+        report = TransferReport()
+        with patch("sql_system_transfer.engine.sleep") as sleep:
+            new_cursor = engine._write_batch(
+                engine=engine, task=task, new_cursor=cursor, insert_statement="", rows=[(1, 2, 3)],
+                retry=RetryPolicy(retries=3), report=report
+            )
+        assert new_cursor is cursor
+        assert report.report_table("testing.dbo.DimAccount").retries == 1
+        assert (cursor.rows, cursor.commits, cursor.rollbacks, sleep.call_count) == ([(1, 2, 3)], 1, 1, 1)
+
+    def test_write_batch_retry_commit_events(self, task):
+        events = []
+        with patch.object(Engine, "_engine_system_error"), patch.object(Engine, "_engine_connect"), \
+                patch.object(Engine, "_initialize_database"):
+            engine = Engine(system=SQLSystem.MSSQL, server="localhost", database="testing", hooks=(events.append,))
+        cursor = self.Cursor(commit_errors=[SQLiteError("40001", "[40001] Transaction was deadlocked")])
+        with patch("sql_system_transfer.engine.sleep"):
+            engine._write_batch(engine=engine, task=task, new_cursor=cursor, insert_statement="", rows=[(1, 2, 3)],
+                                retry=RetryPolicy(retries=3))
+        assert [(event.phase, event.rows) for event in events] == [("retry", 1), ("write", 1), ("commit", 1)]
+
+    def test_write_batch_reconnect(self, engine, task):
+        cursor = self.Cursor(errors=[SQLiteError("08S01", "[08S01] Communication link failure")])
+        reconnected = self.Cursor()
+        engine._engine_connect.return_value.cursor.return_value = reconnected
+        with patch("sql_system_transfer.engine.sleep"):
+            new_cursor = engine._write_batch(
+                engine=engine, task=task, new_cursor=cursor, insert_statement="", rows=[(1, 2, 3)],
+                retry=RetryPolicy(retries=3)
+            )
+        assert new_cursor is reconnected
+        assert (cursor.rows, reconnected.rows, reconnected.commits) == ([], [(1, 2, 3)], 1)
+        cursor.connection.close.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "errors, retry", [
+            ([SQLiteError("23000", "[23000] Violation of PRIMARY KEY constraint")], RetryPolicy(retries=3)),
+            ([SQLiteError("40001", "[40001] Transaction was deadlocked")] * 3, RetryPolicy(retries=2)),
+            ([SQLiteError("40001", "[40001] Transaction was deadlocked")], None),
+        ])
+    def test_write_batch_raise_exception(self, engine, task, errors, retry):
+        cursor = self.Cursor(errors=[*errors])
+        with patch("sql_system_transfer.engine.sleep"), pytest.raises(SQLiteError):
+            engine._write_batch(
+                engine=engine, task=task, new_cursor=cursor, insert_statement="", rows=[(1, 2, 3)], retry=retry
+            )
+
+    def test_restore_statements(self, engine, caplog):
+        cursor = MagicMock()
+        cursor.execute.side_effect = [SQLiteError("08S01", "[08S01] Communication link failure"), None]
+        engine._restore_statements(cursor=cursor, statements=["ALTER TABLE a", "ALTER DATABASE b"])
+        assert [call.args[0] for call in cursor.execute.call_args_list] == ["ALTER TABLE a", "ALTER DATABASE b"]
+        assert caplog.messages[0].startswith("fast load setting could not be restored - ALTER TABLE a")
+
+    def test_column_information_schema(self, engine):
+        cursor = MagicMock()
+        cursor.fetchone.side_effect = [("AccountKey", "NO", "int", None, None, 10, 0, None), None] * 2
+        for table in ["DimAccount", "DimCurrency"]:
+            columns = engine._column_information_schema(table=table, schema="dbo", cursor=cursor)
+            assert columns[0]["column_name"] == "AccountKey"
+        statements = {call.args[0] for call in cursor.execute.call_args_list}
+        assert len(statements) == 1
+        assert [call.args[1:] for call in cursor.execute.call_args_list] == [("dbo", "DimAccount"), ("dbo", "DimCurrency")]
+        cursor.close.assert_not_called()
+
+    def test_engine_deferred_connection(self):
+        with patch.object(Engine, "_engine_connect") as connect, patch.object(Engine, "_initialize_database") as initialize:
+            engine = Engine(system=SQLSystem.MSSQL, server="localhost", database="testing")
+            connect.assert_not_called()
+            assert engine.connection is engine.connection
+            assert engine.database_object is engine.database_object
+        assert (connect.call_count, initialize.call_count) == (1, 1)
+
+    def test_engine_driver_installed(self):
+        engine_driver_installed.cache_clear()
+        # the lazy pyodbc module is replaced whole, so that the test runs without the ODBC driver manager
+        pyodbc = MagicMock(**{"drivers.return_value": ["ODBC Driver 17 for SQL Server"]})
+        with patch("sql_system_transfer.engine.pyodbc", new=pyodbc):
+            assert engine_driver_installed("{ODBC Driver 17 for SQL Server}")
+            assert engine_driver_installed("{ODBC Driver 17 for SQL Server}")
+            assert not engine_driver_installed("{MySQL ODBC 8.0 ANSI Driver}")
+        assert pyodbc.drivers.call_count == 2
+        engine_driver_installed.cache_clear()
+
+
+class TestSQLiteEngine:
+
+    @pytest.fixture()
+    def engines(self, tmp_path):
+        connection = sqlite3.connect(tmp_path / "source.db")
+        connection.executescript("""
+            CREATE TABLE DimAccount (AccountKey INTEGER PRIMARY KEY, AccountName varchar(50) NOT NULL,
+                Amount decimal(19, 4), Modified datetime, Flag boolean);
+            CREATE INDEX IX_AccountName ON DimAccount (AccountName);
+        """)
+        connection.executemany(
+            "INSERT INTO DimAccount VALUES (?, ?, ?, ?, ?);",
+            [(key, f"Account {key}", key / 4, f"2020-01-01 00:00:{key % 60:02d}", key % 2) for key in range(1, 1001)]
+        )
+        connection.commit()
+        connection.close()
+        source = Engine(system=SQLSystem.SQLITE, server=str(tmp_path / "source.db"), database="main")
+        target = Engine(system=SQLSystem.SQLITE, server=str(tmp_path / "target.db"), database="main")
+        yield source, target
+        source.connection.close()
+        target.connection.close()
+
+    def test_engine_transfer_tables(self, engines):
+        source, target = engines
+        source.engine_transfer_tables(tables=["main.DimAccount"], engine=target, batch_size=300, workers=2)
+        cursor = target.connection.cursor()
+        assert cursor.execute("SELECT COUNT(*), SUM(Amount) FROM main.DimAccount;").fetchone() == (1000, 125125.0)
+        assert cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index';").fetchall() == [("IX_AccountName",)]
+        verifications = source.engine_verify_tables(tables=["main.DimAccount"], engine=target)
+        assert verifications[0].verification_passed()
+
+    def test_engine_transfer_tables_fast_load(self, engines):
+        source, target = engines
+        target.connection.execute("PRAGMA main.synchronous = NORMAL;")
+        source.engine_transfer_tables(tables=["main.DimAccount"], engine=target, fast_load=True)
+        cursor = target.connection.cursor()
+        assert cursor.execute("SELECT COUNT(*) FROM main.DimAccount;").fetchone() == (1000,)
+        assert cursor.execute("PRAGMA main.synchronous;").fetchone() == (1,)
+
+    def test_engine_verify_tables_bisect(self, engines):
+        source, target = engines
+        source.engine_transfer_tables(tables=["main.DimAccount"], engine=target)
+        for statement in [
+            "DELETE FROM main.DimAccount WHERE AccountKey = 10;",
+            "UPDATE main.DimAccount SET AccountName = 'changed' WHERE AccountKey = 500;",
+            "INSERT INTO main.DimAccount VALUES (2000, 'extra', 0, NULL, 0);",
+        ]:
+            target.connection.execute(statement)
+        fetched = []
+
+        def verify_rows(old_rows, new_rows, **kwargs):
+            fetched.append(max(len(old_rows), len(new_rows)))
+            return sql_vf.verify_rows(old_rows=old_rows, new_rows=new_rows, **kwargs)
+
+        with patch("sql_system_transfer.engine.sql_vf.VERIFY_LEAF_ROWS", 50), \
+                patch("sql_system_transfer.engine.sql_vf.verify_rows", side_effect=verify_rows):
+            verification = source.engine_verify_tables(tables=["main.DimAccount"], engine=target)[0]
+        assert (verification.verification_missing_keys(), verification.verification_extra_keys(),
+                verification.verification_changed_keys()) == ([(10,)], [(2000,)], [(500,)])
+        assert fetched and max(fetched) <= 50
+
+    @pytest.mark.parametrize("keys", [["AccountName"], ["AccountKey", "AccountName"]])
+    def test_sample_table_keys(self, engines, keys):
+        source, _ = engines
+        table = source.database_object.database_table_convert_old(tables=["main.DimAccount"])[0]
+        cursor = source.connection.cursor()
+        sample_keys = source._sample_table_keys(table=table, cursor=cursor, keys=keys, sample_size=10, rng=Random(1))
+        assert len(set(sample_keys)) == 10 and all([len(key) == len(keys) for key in sample_keys])
+
+    def test_engine_transfer_tables_upsert(self, engines):
+        source, target = engines
+        source.engine_transfer_tables(tables=["main.DimAccount"], engine=target)
+        target.connection.execute("UPDATE main.DimAccount SET AccountName = 'changed' WHERE AccountKey = 1;")
+        source.engine_transfer_tables(tables=["main.DimAccount"], engine=target, write_mode="upsert", retries=1)
+        samples = source.engine_sample_tables(tables=["main.DimAccount"], engine=target, sample_size=1000, seed=1)
+        assert samples[0].verification_passed()
@@ -0,0 +1,58 @@
+import pytest
+from json import loads
+from logging import INFO
+from sql_system_transfer.engine import Engine
+from sql_system_transfer.events import PHASES, STATES, JsonLinesSink, LoggingSink, TransferEvent
+from sql_system_transfer.fake import FakeBackend, FakeTable
+from sql_system_transfer.system import SQLSystem
+
+
+@pytest.mark.parametrize(
+    "event, expected_result", [
+        (TransferEvent(phase="connect", seconds=0.0125, database="Testing"), "connect 12.5 ms"),
+        (TransferEvent(phase="fetch", seconds=0.5, database="Testing", table_name="Testing.dbo.Fake", partition=1,
+                       rows=1000), "fetch Testing.dbo.Fake [2] 500.0 ms - 1,000 rows"),
+    ])
+def test_event_format(event, expected_result):
+    assert event.event_format() == expected_result
+
+
+def test_logging_sink(caplog):
+    with caplog.at_level(INFO, logger="sql_system_transfer"):
+        LoggingSink(level=INFO)(TransferEvent(phase="create", seconds=0.001, database="Testing", table_name="Fake"))
+    assert caplog.messages == ["create Fake 1.0 ms"]
+
+
+def test_json_lines_sink(tmp_path):
+    with JsonLinesSink(str(tmp_path / "events.jsonl")) as sink:
+        sink(TransferEvent(phase="write", seconds=0.25, database="Testing", table_name="Fake", rows=10, bytes=1000))
+        sink(TransferEvent(phase="commit", seconds=0.01, database="Testing", table_name="Fake", rows=10))
+        assert len((tmp_path / "events.jsonl").read_text().splitlines()) == 2
+    sink(TransferEvent(phase="error", seconds=0.0, database="Testing", table_name="Fake"))
+    sink.close()
+    events = [loads(line) for line in (tmp_path / "events.jsonl").read_text().splitlines()]
+    assert [event["phase"] for event in events] == ["write", "commit", "error"]
+    assert events[0]["rows"] == 10 and events[0]["bytes"] == 1000
+
+
+def test_engine_transfer_events():
+    events = []
+    source = FakeBackend(tables=[FakeTable(table="Fake", row_count=2500, row_width=100)])
+    source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source,
+                           hooks=(events.append,))
+    target_engine = Engine(system=SQLSystem.MYSQL, server="fake", database="Testing", connection_factory=FakeBackend())
+    source_engine.engine_transfer_tables(tables=["Testing.dbo.Fake"], engine=target_engine, batch_size=1000, retries=1)
+    phases = [event.phase for event in events]
+    assert set(phases) <= {*PHASES, *STATES}
+    assert phases[0:2] == ["connect", "catalog"]
+    assert [(event.phase, event.queued) for event in events if event.phase in STATES] == [
+        ("estimate", None), ("worker_start", None), ("task", 0), ("table", None), ("worker_stop", None)
+    ]
+    assert [(event.rows, event.bytes) for event in events if event.phase == "table"] == [(2500, 250000)]
+    assert phases.count("first_row") == 1
+    assert [event.rows for event in events if event.phase == "fetch"] == [1000, 1000, 500]
+    assert [event.rows for event in events if event.phase == "write"] == [1000, 1000, 500]
+    assert [event.bytes for event in events if event.phase == "write"] == [100000, 100000, 50000]
+    assert phases.count("commit") == 3
+    assert all([event.table_name == "Testing.dbo.Fake" for event in events if event.phase in PHASES[2:]])
+    assert all([event.seconds >= 0 for event in events])
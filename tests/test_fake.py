@@ -0,0 +1,109 @@
+import pytest
+from sql_system_transfer.engine import Engine
+from sql_system_transfer.fake import FakeBackend, FakeTable, fake_table_name, fake_tables
+from sql_system_transfer.system import SQLSystem
+
+
+@pytest.mark.parametrize(
+    "row_width, columns, expected_result", [
+        (100, 4, [24, 24, 24, 24]),
+        (14, 3, [4, 3, 3]),
+        (2, 2, [1, 1]),
+    ])
+def test_fake_column_sizes(row_width, columns, expected_result):
+    assert FakeTable(table="Fake", row_width=row_width, columns=columns).fake_column_sizes() == expected_result
+
+
+@pytest.mark.parametrize(
+    "statement, expected_result", [
+        ("INSERT INTO Testing.dbo.Fake WITH (TABLOCK) (id, c0) VALUES (?,?);", "Fake"),
+        ("MERGE INTO Testing.dbo.Fake AS target\nUSING (SELECT ? AS id) AS source", "Fake"),
+        ("DROP TABLE IF EXISTS `Testing`.`Fake`;", "Fake"),
+        ("CREATE TABLE main.Fake (\n\nid int not null\n\n);", "Fake"),
+        ("SELECT TOP (10) * FROM [Testing].[dbo].[Fake] ORDER BY id;", "Fake"),
+        ("SET FOREIGN_KEY_CHECKS = 0;", None),
+    ])
+def test_fake_table_name(statement, expected_result):
+    assert fake_table_name(statement) == expected_result
+
+
+def test_fake_tables():
+    tables = fake_tables(3, row_count=10)
+    assert [table.table for table in tables] == ["FakeTable0", "FakeTable1", "FakeTable2"]
+    assert all([table.row_count == 10 for table in tables])
+
+
+class TestFakeBackend:
+
+    @pytest.fixture()
+    def source(self):
+        return FakeBackend(tables=[
+            FakeTable(table="Narrow", row_count=2500, row_width=20, columns=2),
+            FakeTable(table="Lob", row_count=10, row_width=5000, columns=1, lob=True),
+        ])
+
+    @pytest.mark.parametrize(
+        "system, expected_lob", [
+            (SQLSystem.MSSQL, "varchar(max)"),
+            (SQLSystem.MYSQL, "longtext"),
+            (SQLSystem.SQLITE, "text"),
+        ])
+    def test_fake_catalog(self, source, system, expected_lob):
+        engine = Engine(system=system, server="fake", database="Testing", connection_factory=source)
+        tables = {table.table: table for table in engine.database_object.database_tables}
+        assert list(tables) == ["Narrow", "Lob"]
+        assert tables["Narrow"].table_rows == 2500
+        assert tables["Narrow"].table_data_bytes == 2500 * 20
+        assert tables["Narrow"].table_primary_key() == ["id"]
+        assert [column.column_name for column in tables["Narrow"].table_columns] == ["id", "c0", "c1"]
+        assert tables["Lob"].table_columns[1].column_format().split()[1] == expected_lob
+
+    def test_fake_select_rows(self, source):
+        engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source)
+        cursor = engine.connection.cursor()
+        cursor.execute("SELECT * FROM Testing.dbo.Narrow WHERE ((id >= ?) AND (id < ?));", 11, 21)
+        rows = cursor.fetchmany(100)
+        assert [row[0] for row in rows] == list(range(11, 21))
+        assert rows[0][1:] == ("x" * 8, "x" * 8)
+        cursor.execute("SELECT MIN(id), MAX(id) FROM Testing.dbo.Narrow;")
+        assert cursor.fetchone() == (1, 2500)
+        cursor.execute("SELECT TOP (5) * FROM Testing.dbo.Narrow WHERE ((id > ?)) ORDER BY id;", 2497)
+        assert [row[0] for row in cursor.fetchall()] == [2498, 2499, 2500]
+
+    def test_fake_round_trips(self, source):
+        source.latency = 0.001
+        engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source)
+        cursor = engine.connection.cursor()
+        cursor.execute("SELECT * FROM Testing.dbo.Narrow;")
+        while cursor.fetchmany(1000):
+            pass
+        cursor.executemany("INSERT INTO Testing.dbo.Copy (id) VALUES (?);", [(1,), (2,)])
+        cursor.commit()
+        assert cursor.execute("SELECT MAX(id) FROM Testing.dbo.Narrow;").fetchone() == (2500,)
+        assert source.round_trips == 9
+        assert source.rows_written == {"Copy": 2}
+        source.fake_reset()
+        assert source.round_trips == 0 and source.rows_written == {}
+
+    @pytest.mark.parametrize("workers, split_threshold", [(1, None), (3, 10000)])
+    def test_fake_transfer_tables(self, source, workers, split_threshold):
+        target = FakeBackend(keep_rows=True)
+        source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source)
+        target_engine = Engine(system=SQLSystem.MYSQL, server="fake", database="Testing", connection_factory=target)
+        source_engine.engine_transfer_tables(
+            tables=["Testing.dbo.Narrow", "Testing.dbo.Lob"], engine=target_engine, batch_size=500, workers=workers,
+            split_threshold=split_threshold, keys={"Testing.dbo.Narrow": ["id"]}
+        )
+        assert target.rows_written == {"Narrow": 2500, "Lob": 10}
+        assert sorted([row[0] for row in target.rows["Narrow"]]) == list(range(1, 2501))
+        assert any([statement.startswith("CREATE TABLE Testing.Narrow") for statement in target.statements])
+
+    def test_fake_transfer_tables_append(self, source):
+        target = FakeBackend()
+        source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source)
+        target_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=target)
+        source_engine.engine_transfer_tables(
+            tables=["Testing.dbo.Narrow"], engine=target_engine, write_mode="append", page_size=1000,
+            keys={"Testing.dbo.Narrow": ["id"]}
+        )
+        assert target.rows_written == {"Narrow": 2500}
@@ -0,0 +1,12 @@
+import sys
+from sql_system_transfer.lazy import LazyModule, lazy_import
+
+
+def test_lazy_import():
+    sys.modules.pop("colorsys", None)
+    module = lazy_import("colorsys")
+    assert isinstance(module, LazyModule)
+    assert "colorsys" not in sys.modules
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert "colorsys" in sys.modules
+    assert "rgb_to_hsv" in vars(module)
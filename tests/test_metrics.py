@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError
+from urllib.request import urlopen
+import pytest
+from sql_system_transfer.engine import Engine
+from sql_system_transfer.events import TransferEvent
+from sql_system_transfer.fake import FakeBackend, FakeTable
+from sql_system_transfer.metrics import PREFIX, PrometheusMetrics, metrics_label
+from sql_system_transfer.system import SQLSystem
+
+
+def metrics_feed(metrics: PrometheusMetrics) -> None:
+    metrics(TransferEvent(phase="worker_start", seconds=0.0, database="Testing"))
+    metrics(TransferEvent(phase="task", seconds=0.0, database="Testing", table_name="Fake", queued=3))
+    metrics(TransferEvent(phase="fetch", seconds=0.002, database="Testing", table_name="Fake", rows=10))
+    metrics(TransferEvent(phase="write", seconds=0.2, database="Testing", table_name="Fake", rows=10, bytes=1000))
+    metrics(TransferEvent(phase="retry", seconds=0.0, database="Testing", table_name="Fake", rows=10))
+    metrics(TransferEvent(phase="error", seconds=0.0, database="Testing", table_name="Fake"))
+
+
+@pytest.mark.parametrize(
+    "value, expected_result", [
+        (None, ""),
+        ("Testing.dbo.Fake", "Testing.dbo.Fake"),
+        ('Testing.dbo."Fake\\1"', 'Testing.dbo.\\"Fake\\\\1\\"'),
+    ])
+def test_metrics_label(value, expected_result):
+    assert metrics_label(value) == expected_result
+
+
+def test_metrics_text():
+    metrics = PrometheusMetrics()
+    metrics_feed(metrics)
+    lines = metrics.metrics_text().splitlines()
+    assert f'{PREFIX}_rows_read_total{{table="Fake"}} 10' in lines
+    assert f'{PREFIX}_rows_written_total{{table="Fake"}} 10' in lines
+    assert f'{PREFIX}_bytes_written_total{{table="Fake"}} 1000' in lines
+    assert f'{PREFIX}_retries_total{{table="Fake"}} 1' in lines
+    assert f'{PREFIX}_errors_total{{table="Fake"}} 1' in lines
+    assert f"{PREFIX}_queue_depth 3" in lines and f"{PREFIX}_active_workers 1" in lines
+    assert f'{PREFIX}_batch_seconds_bucket{{phase="fetch",le="0.001"}} 0' in lines
+    assert f'{PREFIX}_batch_seconds_bucket{{phase="fetch",le="0.005"}} 1' in lines
+    assert f'{PREFIX}_batch_seconds_bucket{{phase="write",le="0.1"}} 0' in lines
+    assert f'{PREFIX}_batch_seconds_bucket{{phase="write",le="+Inf"}} 1' in lines
+    assert f'{PREFIX}_batch_seconds_count{{phase="commit"}} 0' in lines
+    assert lines.count(f"# TYPE {PREFIX}_rows_read_total counter") == 1
+
+
+def test_metrics_textfile(tmp_path):
+    textfile = tmp_path / "sql_system_transfer.prom"
+    metrics = PrometheusMetrics(textfile=str(textfile), interval=3600.0)
+    metrics_feed(metrics)
+    assert not textfile.exists()
+    metrics(TransferEvent(phase="worker_stop", seconds=0.0, database="Testing"))
+    assert f"{PREFIX}_active_workers 0" in textfile.read_text().splitlines()
+    assert [file.name for file in tmp_path.iterdir()] == ["sql_system_transfer.prom"]
+
+
+def test_metrics_textfile_workers(tmp_path):
+    textfile = tmp_path / "sql_system_transfer.prom"
+    metrics = PrometheusMetrics(textfile=str(textfile), interval=3600.0)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(metrics, TransferEvent(phase="worker_stop", seconds=0.0, database="Testing"))
+                   for _ in range(32)]
+    for future in futures:
+        future.result()
+    assert f"{PREFIX}_active_workers -32" in textfile.read_text().splitlines()
+    assert [file.name for file in tmp_path.iterdir()] == ["sql_system_transfer.prom"]
+
+
+def test_metrics_serve():
+    metrics = PrometheusMetrics()
+    metrics_feed(metrics)
+    server = metrics.metrics_serve(port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        with urlopen(f"{url}/metrics") as response:
+            assert response.read().decode() == metrics.metrics_text()
+        with pytest.raises(HTTPError):
+            urlopen(f"{url}/other")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_engine_transfer_metrics():
+    metrics = PrometheusMetrics()
+    source = FakeBackend(tables=[FakeTable(table="Fake", row_count=2500, row_width=100)])
+    source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source,
+                           hooks=(metrics,))
+    target_engine = Engine(system=SQLSystem.MYSQL, server="fake", database="Testing", connection_factory=FakeBackend())
+    source_engine.engine_transfer_tables(
+        tables=["Testing.dbo.Fake"], engine=target_engine, workers=2, split_threshold=100000
+    )
+    lines = metrics.metrics_text().splitlines()
+    assert f'{PREFIX}_rows_written_total{{table="Testing.dbo.Fake"}} 2500' in lines
+    assert f'{PREFIX}_bytes_written_total{{table="Testing.dbo.Fake"}} 250000' in lines
+    assert f"{PREFIX}_active_workers 0" in lines and f"{PREFIX}_queue_depth 0" in lines
@@ -0,0 +1,121 @@
+import pytest
+from sql_system_transfer.engine import Engine, MsSQLTable
+from sql_system_transfer.fake import FakeBackend, FakeTable
+from sql_system_transfer.scheduler import TransferTask
+from sql_system_transfer.system import SQLSystem
+from sql_system_transfer.planner import TablePlan, TransferPlan, task_rows, task_seconds, plan_makespan, \
+    read_strategy, write_strategy, table_plan
+
+
+table_columns = [
+    {'column_name': 'AccountKey', 'nullable': 'NO', 'datatype_name': 'int', 'character_size': None,
+     'character_set': None, 'numeric_precision': 10, 'numeric_scale': 0, 'datetime_precision': None},
+]
+
+
+def create_table(table_rows=None, table_data_bytes=None):
+    return MsSQLTable(
+        table="DimAccount",
+        table_type="BASE TABLE",
+        table_rows=table_rows,
+        table_data_bytes=table_data_bytes,
+        init_table_columns=table_columns
+    )
+
+
+def create_task(name="Db.dbo.DimAccount", table_rows=None, partitions=1, partition=None, **kwargs):
+    table = create_table(table_rows=table_rows)
+    return TransferTask(
+        table_name=name, old_table=table, new_table=table, cost=0 if table_rows is None else table_rows,
+        partition=partition, partitions=partitions, **kwargs
+    )
+
+
+@pytest.mark.parametrize(
+    "table_rows, partitions, expected_result", [
+        (None, 1, 0),
+        (1000, 1, 1000),
+        (1000, 4, 250),
+    ])
+def test_task_rows(table_rows, partitions, expected_result):
+    assert task_rows(create_task(table_rows=table_rows, partitions=partitions)) == expected_result
+
+
+@pytest.mark.parametrize(
+    "rows_per_second, expected_result", [
+        (1000, 2.0),
+        (0, 0.0),
+    ])
+def test_task_seconds(rows_per_second, expected_result):
+    assert task_seconds(create_task(table_rows=2000), rows_per_second) == expected_result
+
+
+def test_plan_makespan():
+    tasks = [create_task(name=name, table_rows=rows) for name, rows in zip("abcde", [7000, 5000, 4000, 3000, 3000])]
+    assert plan_makespan(tasks=tasks, workers=1, rows_per_second=1000) == 22.0
+    assert plan_makespan(tasks=tasks, workers=2, rows_per_second=1000) == 12.0
+    assert plan_makespan(tasks=[], workers=2) == 0.0
+
+
+@pytest.mark.parametrize(
+    "task, page_size, predicate, watermark, expected_result", [
+        (create_task(), None, None, None, "streamed select, fetch 1000"),
+        (create_task(keys=["AccountKey"]), 500, None, None, "keyset pages of 500 on AccountKey"),
+        (create_task(keys=["AccountKey"], partitions=4, partition=0), None, "AccountKey > 0", None,
+         "streamed select, fetch 1000, 4 ranges on AccountKey, where AccountKey > 0"),
+        (create_task(write_mode="append"), None, None, "Modified", "streamed select, fetch 1000, past target MAX(Modified)"),
+        (create_task(write_mode="append", created=True), None, None, "Modified", "streamed select, fetch 1000"),
+    ])
+def test_read_strategy(task, page_size, predicate, watermark, expected_result):
+    strategy = read_strategy(task=task, page_size=page_size, predicate=predicate, watermark=watermark)
+    assert strategy == expected_result
+
+
+@pytest.mark.parametrize(
+    "task, fast_load, expected_result", [
+        (create_task(), False, "insert, batches of 1000"),
+        (create_task(), True, "insert, batches of 1000, fast load"),
+        (create_task(write_mode="upsert", keys=["AccountKey"]), False, "upsert on AccountKey, batches of 1000"),
+    ])
+def test_write_strategy(task, fast_load, expected_result):
+    assert write_strategy(task=task, fast_load=fast_load) == expected_result
+
+
+def test_table_plan():
+    tasks = [create_task(table_rows=4000, partitions=2, partition=index, keys=["AccountKey"]) for index in range(2)]
+    plan = table_plan(
+        tasks=tasks, new_table_name="Db.DimAccount", statements=["CREATE TABLE Db.DimAccount (AccountKey int);"],
+        index_statements=[], rows_per_second=1000
+    )
+    assert plan.table_name == "Db.dbo.DimAccount"
+    assert plan.partitions == 2
+    assert plan.rows == 4000
+    assert plan.estimated_seconds == 4.0
+    assert plan.read_strategy == "streamed select, fetch 1000, 2 ranges on AccountKey"
+    assert "    CREATE TABLE Db.DimAccount (AccountKey int);" in plan.plan_format().split("\n")
+
+
+def test_transfer_plan():
+    plans = [
+        TablePlan(table_name="a", new_table_name="a", write_mode="replace", rows=10, data_bytes=100),
+        TablePlan(table_name="b", new_table_name="b", write_mode="replace"),
+    ]
+    plan = TransferPlan(tables=plans, skipped={"c": "not found in the catalog"}, workers=2, rows_per_second=1000,
+                        estimated_seconds=1.5)
+    assert plan.plan_rows() == 10
+    assert plan.plan_data_bytes() == 100
+    assert plan.plan_format().split("\n")[-1] == \
+        "2 tables, rows: 10, bytes: 100, workers: 2, estimate: 1.5s at 1,000 rows/s"
+    assert "c skipped - not found in the catalog" in plan.plan_format().split("\n")
+
+
+def test_engine_plan_tables():
+    source = FakeBackend(tables=[FakeTable(table="Fake", row_count=2500, row_width=100)])
+    source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source)
+    target = FakeBackend()
+    target_engine = Engine(system=SQLSystem.MYSQL, server="fake", database="Testing", connection_factory=target)
+    plan = source_engine.engine_plan_tables(tables=["Testing.dbo.Fake", "Testing.dbo.Missing"], engine=target_engine)
+    assert plan.skipped == {"Testing.dbo.Missing": "not found in the catalog"}
+    assert target.statements == []
+    source_engine.engine_transfer_tables(tables=["Testing.dbo.Fake"], engine=target_engine, indexes=False)
+    assert target.statements[:2] == plan.tables[0].statements
@@ -0,0 +1,82 @@
+from pstats import Stats
+import tracemalloc
+import pytest
+from sql_system_transfer.engine import Engine
+from sql_system_transfer.fake import FakeBackend, FakeTable
+from sql_system_transfer.profiler import TableProfiler, profiler_file_name
+from sql_system_transfer.system import SQLSystem
+
+
+@pytest.mark.parametrize(
+    "table_name, expected_result", [
+        ("Testing.dbo.Fake", "Testing.dbo.Fake"),
+        ("Testing.dbo.Fake Sales/2024", "Testing.dbo.Fake_Sales_2024"),
+    ])
+def test_profiler_file_name(table_name, expected_result):
+    assert profiler_file_name(table_name) == expected_result
+
+
+def test_table_profiler(tmp_path):
+    profiler = TableProfiler(directory=str(tmp_path), memory=True, top=5)
+    for _ in range(2):
+        with profiler.profiler_table(table_name="Testing.dbo.Fake"):
+            rows = [(index, f"row {index}") for index in range(1000)]
+    assert len(profiler.profiles["Testing.dbo.Fake"]) == 2
+    assert profiler.peaks["Testing.dbo.Fake"] > 0
+    assert profiler.profiler_write() == [
+        str(tmp_path / "Testing.dbo.Fake.pstats"), str(tmp_path / "Testing.dbo.Fake.allocations.txt")
+    ]
+    assert not tracemalloc.is_tracing()
+    lines = (tmp_path / "Testing.dbo.Fake.allocations.txt").read_text().splitlines()
+    assert lines[0].startswith("Testing.dbo.Fake - peak") and len(lines) <= 3 + 5
+    assert rows
+
+
+def test_table_profiler_batch(tmp_path):
+    profiler = TableProfiler(directory=str(tmp_path), memory=True, top=5)
+    with profiler.profiler_table(table_name="Testing.dbo.Fake"):
+        rows = [f"row {index}" for index in range(10000)]
+        profiler.profiler_batch()
+        rows = []
+        profiler.profiler_batch()
+    profiler.profiler_write()
+    size, _ = max(profiler.allocations["Testing.dbo.Fake"].values())
+    assert size > 10000 * 40 and rows == []
+
+
+@pytest.mark.parametrize("profile_memory", [False, True])
+def test_engine_transfer_tables_profile_workers(tmp_path, profile_memory):
+    events = []
+    source = FakeBackend(tables=[
+        FakeTable(table="Fake", row_count=2500, row_width=100), FakeTable(table="Other", row_count=10, row_width=10)
+    ])
+    source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source,
+                           hooks=(events.append,))
+    target_engine = Engine(system=SQLSystem.MYSQL, server="fake", database="Testing", connection_factory=FakeBackend())
+    source_engine.engine_transfer_tables(
+        tables=["Testing.dbo.Fake", "Testing.dbo.Other"], engine=target_engine, workers=2, profile=True,
+        profile_memory=profile_memory, profile_directory=str(tmp_path)
+    )
+    assert [event.phase for event in events].count("worker_start") == 1
+    assert sorted([file.name for file in tmp_path.iterdir() if file.suffix == ".pstats"]) == [
+        "Testing.dbo.Fake.pstats", "Testing.dbo.Other.pstats"
+    ]
+
+
+def test_engine_transfer_tables_profile(tmp_path):
+    source = FakeBackend(tables=[
+        FakeTable(table="Fake", row_count=2500, row_width=100), FakeTable(table="Other", row_count=10, row_width=10)
+    ])
+    source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source)
+    target_engine = Engine(system=SQLSystem.MYSQL, server="fake", database="Testing", connection_factory=FakeBackend())
+    report = source_engine.engine_transfer_tables(
+        tables=["Testing.dbo.Fake", "Testing.dbo.Other"], engine=target_engine, workers=2, split_threshold=100000,
+        profile=True, profile_memory=True, profile_directory=str(tmp_path)
+    )
+    assert report.report_rows_written() == 2510
+    assert sorted([file.name for file in tmp_path.iterdir()]) == [
+        "Testing.dbo.Fake.allocations.txt", "Testing.dbo.Fake.pstats",
+        "Testing.dbo.Other.allocations.txt", "Testing.dbo.Other.pstats",
+    ]
+    stats = Stats(str(tmp_path / "Testing.dbo.Fake.pstats"))
+    assert [call for (_, _, function), call in stats.stats.items() if function == "_write_batch"][0][1] == 3
@@ -0,0 +1,73 @@
+from io import StringIO
+import pytest
+from sql_system_transfer.engine import Engine
+from sql_system_transfer.events import TransferEvent
+from sql_system_transfer.fake import FakeBackend, FakeTable
+from sql_system_transfer.progress import TableProgress, TransferProgress
+from sql_system_transfer.system import SQLSystem
+
+
+def progress_event(phase: str, timestamp: float, table_name: str = "Fake", rows: int = 0) -> TransferEvent:
+    return TransferEvent(phase=phase, seconds=0.0, database="Testing", table_name=table_name, rows=rows,
+                         timestamp=timestamp)
+
+
+@pytest.mark.parametrize(
+    "table, expected_result", [
+        (TableProgress(table_name="Fake", rows_total=10000, rows_done=2500, rows_per_second=250.0, started=0.0,
+                       updated=5.0), "Fake - 2,500 of 10,000 rows (25.0%), 250 rows/s now, 500 rows/s average, "
+                                     "ETA 0:00:30"),
+        (TableProgress(table_name="Fake", rows_done=2500, rows_per_second=250.0, started=0.0, updated=5.0),
+         "Fake - 2,500 rows, 250 rows/s now, 500 rows/s average"),
+        (TableProgress(table_name="Fake", rows_total=1000, rows_done=1500), "Fake - 1,500 of 1,000 rows (100.0%), "
+                                                                            "0 rows/s now, 0 rows/s average"),
+    ])
+def test_table_progress_format(table, expected_result):
+    assert table.progress_format() == expected_result
+
+
+def test_table_progress_tick():
+    table = TableProgress(table_name="Fake", rows_total=10000)
+    table.progress_start(timestamp=0.0)
+    table.rows_done = 1000
+    table.progress_tick(timestamp=1.0, smoothing=0.5)
+    assert table.rows_per_second == 1000.0
+    table.rows_done = 1500
+    table.progress_tick(timestamp=2.0, smoothing=0.5)
+    assert table.rows_per_second == 750.0
+    assert table.progress_eta() == 8500 / 750.0
+
+
+def test_transfer_progress():
+    stream = StringIO()
+    progress = TransferProgress(stream=stream, interval=10.0)
+    progress(progress_event("estimate", 0.0, rows=3000))
+    progress(progress_event("estimate", 0.0, table_name="Other", rows=0))
+    assert (progress.tables["Other"].rows_total, progress.total.rows_total) == (None, 3000)
+    progress(progress_event("task", 0.0))
+    progress(progress_event("write", 1.0, table_name=None, rows=500))
+    for second in range(1, 6):
+        progress(progress_event("write", second * 5.0, rows=500))
+    assert stream.getvalue().splitlines() == [
+        "Fake - 1,000 of 3,000 rows (33.3%), 100 rows/s now, 100 rows/s average, ETA 0:00:20",
+        "total - 1,000 of 3,000 rows (33.3%), 100 rows/s now, 100 rows/s average, ETA 0:00:20",
+        "Fake - 2,000 of 3,000 rows (66.7%), 100 rows/s now, 100 rows/s average, ETA 0:00:10",
+        "total - 2,000 of 3,000 rows (66.7%), 100 rows/s now, 100 rows/s average, ETA 0:00:10",
+    ]
+    progress(progress_event("worker_stop", 26.0, table_name=None))
+    assert stream.getvalue().splitlines()[-1].startswith("total - 2,500 of 3,000 rows (83.3%)")
+
+
+def test_engine_transfer_progress():
+    stream = StringIO()
+    progress = TransferProgress(stream=stream, interval=0.0)
+    source = FakeBackend(tables=[FakeTable(table="Fake", row_count=2500, row_width=100)])
+    source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source,
+                           hooks=(progress,))
+    target_engine = Engine(system=SQLSystem.MYSQL, server="fake", database="Testing", connection_factory=FakeBackend())
+    source_engine.engine_transfer_tables(tables=["Testing.dbo.Fake"], engine=target_engine, batch_size=1000)
+    lines = stream.getvalue().splitlines()
+    assert [line.split(" rows")[0] for line in lines[0::2]] == [
+        "Testing.dbo.Fake - 1,000 of 2,500", "Testing.dbo.Fake - 2,000 of 2,500", "Testing.dbo.Fake - 2,500 of 2,500"
+    ]
+    assert lines[-1].startswith("total - 2,500 of 2,500 rows (100.0%)")
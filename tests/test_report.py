@@ -0,0 +1,140 @@
+import pytest
+from json import loads
+from unittest.mock import patch
+from sql_system_transfer.engine import Database, Engine, MySQLTable
+from sql_system_transfer.fake import FakeBackend, FakeTable
+from sql_system_transfer.report import TableReport, TransferReport, report_merge
+from sql_system_transfer.sqlite import SQLiteError
+from sql_system_transfer.system import SQLSystem
+
+
+@pytest.mark.parametrize(
+    "table, expected_result", [
+        (TableReport(table_name="Db.dbo.DimAccount", rows_written=1000, seconds=0.5, retries=2),
+         "Db.dbo.DimAccount transferred - 1,000 rows in 0.5s (2,000 rows/s, 2 retries)"),
+        (TableReport(table_name="Db.dbo.DimAccount"), "Db.dbo.DimAccount transferred - 0 rows in 0.0s (0 rows/s)"),
+        (TableReport(table_name="Db.dbo.DimAccount", reason="index could not be created"),
+         "Db.dbo.DimAccount transferred - 0 rows in 0.0s (0 rows/s) - index could not be created"),
+        (TableReport(table_name="Db.dbo.vDimAccount", status="skipped", reason="table type VIEW is not BASE TABLE"),
+         "Db.dbo.vDimAccount skipped - table type VIEW is not BASE TABLE"),
+        (TableReport(table_name="Db.dbo.DimAccount", status="failed", reason="[08S01] link failure"),
+         "Db.dbo.DimAccount failed - [08S01] link failure"),
+    ])
+def test_table_report_format(table, expected_result):
+    assert table.report_format() == expected_result
+
+
+def test_transfer_report_task():
+    report = TransferReport()
+    report.report_expect(table_name="Db.dbo.FactSales", tasks=2)
+    assert report.report_task(table_name="Db.dbo.FactSales", started=10.0, finished=12.0, rows_read=100,
+                              rows_written=100, bytes=1000) is None
+    assert [table.table_name for table in report.report_unfinished()] == ["Db.dbo.FactSales"]
+    assert report.report_task(table_name="Db.dbo.FactSales", started=9.0, finished=11.0, rows_read=50,
+                              rows_written=50) is report.report_table("Db.dbo.FactSales")
+    assert report.report_unfinished() == []
+    report.report_retry(table_name="Db.dbo.FactSales")
+    table = report.report_table("Db.dbo.FactSales")
+    assert (table.rows_read, table.rows_written, table.bytes, table.seconds) == (150, 150, 1000, 3.0)
+    assert (table.retries, table.partitions) == (1, 2)
+
+
+def test_transfer_report_warn():
+    report = TransferReport()
+    report.report_task(table_name="Db.dbo.FactSales", started=0.0, finished=1.0, rows_read=100, rows_written=100)
+    report.report_warn(table_name="Db.dbo.FactSales", reason="index could not be created")
+    report.report_warn(table_name="Db.dbo.FactSales", reason="foreign key could not be added")
+    table = report.report_table("Db.dbo.FactSales")
+    assert (table.status, table.reason) == ("transferred", "index could not be created; foreign key could not be added")
+    assert report.report_failed() == []
+
+
+def test_transfer_report_json():
+    report = TransferReport(seconds=2.0)
+    report.report_task(table_name="Db.dbo.FactSales", started=0.0, finished=1.0, rows_read=100, rows_written=100)
+    report.report_skip(table_name="Db.dbo.vFactSales", reason="table type VIEW is not BASE TABLE")
+    result = loads(report.report_json())
+    assert (result["rows_written"], result["rows_per_second"]) == (100, 50.0)
+    assert [table["status"] for table in result["tables"]] == ["transferred", "skipped"]
+    assert [table.table_name for table in report.report_skipped()] == ["Db.dbo.vFactSales"]
+
+
+def test_report_merge():
+    first, second = TransferReport(seconds=1.0), TransferReport(seconds=2.0)
+    first.report_skip(table_name="Db.dbo.A", reason="not found in the catalog")
+    second.report_skip(table_name="Db.dbo.B", reason="not found in the catalog")
+    merged = report_merge([first, second])
+    assert (merged.seconds, list(merged.tables)) == (3.0, ["Db.dbo.A", "Db.dbo.B"])
+
+
+def test_database_add_skipped_table():
+    database = Database(system=SQLSystem.MSSQL, database="Testing")
+    database.add_skipped_table(table={"table": "DimGeography", "table_type": "BASE TABLE"}, reason="unsupported")
+    assert database.database_skipped_tables == {"Testing.dbo.DimGeography": "unsupported"}
+
+
+def test_engine_transfer_tables_report():
+    source = FakeBackend(tables=[FakeTable(table="Fake", row_count=2500, row_width=100)])
+    source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source)
+    target_engine = Engine(system=SQLSystem.MYSQL, server="fake", database="Testing", connection_factory=FakeBackend())
+    report = source_engine.engine_transfer_tables(
+        tables=["Testing.dbo.Fake", "Testing.dbo.Missing"], engine=target_engine, workers=2, split_threshold=100000
+    )
+    fake, missing = report.report_table("Testing.dbo.Fake"), report.report_table("Testing.dbo.Missing")
+    assert (fake.status, fake.rows_read, fake.rows_written, fake.bytes, fake.partitions) == \
+        ("transferred", 2500, 2500, 250000, 3)
+    assert 0 < fake.seconds <= report.seconds
+    assert (missing.status, missing.reason) == ("skipped", "not found in the catalog")
+
+
+def test_engine_transfer_tables_report_failed():
+    source = FakeBackend(tables=[
+        FakeTable(table="Fake", row_count=2500, row_width=100), FakeTable(table="Other", row_count=10, row_width=10)
+    ])
+    source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source)
+    target_engine = Engine(system=SQLSystem.MYSQL, server="fake", database="Testing", connection_factory=FakeBackend())
+    with patch.object(Engine, "_write_batch", side_effect=SQLiteError("08S01", "link failure")), \
+            pytest.raises(SQLiteError) as error:
+        source_engine.engine_transfer_tables(tables=["Testing.dbo.Fake", "Testing.dbo.Other"], engine=target_engine)
+    report = error.value.report
+    assert [(table.table_name, table.reason) for table in report.report_failed()] == [
+        ("Testing.dbo.Fake", "('08S01', 'link failure')"), ("Testing.dbo.Other", "not finished - ('08S01', 'link failure')")
+    ]
+
+
+def test_engine_transfer_tables_report_index_failed(caplog):
+    events = []
+    source = FakeBackend(tables=[FakeTable(table="Fake", row_count=10, row_width=10)])
+    source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source,
+                           hooks=(events.append,))
+    target = FakeBackend()
+    target_engine = Engine(system=SQLSystem.MYSQL, server="fake", database="Testing", connection_factory=target)
+    fake_execute = target.fake_execute
+
+    def execute(statement):
+        if statement.startswith("CREATE INDEX"):
+            raise SQLiteError("42000", "duplicate key name")
+        fake_execute(statement)
+
+    with patch.object(MySQLTable, "statement_create_indexes", return_value=["CREATE INDEX ix ON Fake (Id)"]), \
+            patch.object(target, "fake_execute", side_effect=execute):
+        report = source_engine.engine_transfer_tables(tables=["Testing.dbo.Fake"], engine=target_engine)
+    table = report.report_table("Testing.dbo.Fake")
+    assert (table.status, table.rows_written) == ("transferred", 10)
+    assert table.reason == "index could not be created - CREATE INDEX ix ON Fake (Id) - ('42000', 'duplicate key name')"
+    assert [event.table_name for event in events if event.phase == "error"] == ["Testing.dbo.Fake"]
+    assert caplog.messages == [f"Testing.dbo.Fake {table.reason}"]
+
+
+def test_engine_migrate_database_report():
+    source = FakeBackend(tables=[FakeTable(table="Fake", row_count=10, row_width=10)])
+    source_engine = Engine(system=SQLSystem.MSSQL, server="fake", database="Testing", connection_factory=source)
+    target_engine = Engine(system=SQLSystem.MYSQL, server="fake", database="Testing", connection_factory=FakeBackend())
+    database = source_engine.database_object
+    database.add_table_to_database(table={"table": "vFake", "table_type": "VIEW"}, columns=[])
+    database.add_skipped_table(table={"table": "DimGeography", "table_type": "BASE TABLE"}, reason="unsupported")
+    report = source_engine.engine_migrate_database(engine=target_engine, workers=1)
+    assert [(table.table_name, table.status, table.reason) for table in report.tables.values()] == [
+        ("Testing.dbo.Fake", "transferred", None), ("Testing.dbo.DimGeography", "skipped", "unsupported"),
+        ("Testing.dbo.vFake", "skipped", "table type VIEW is not BASE TABLE")
+    ]
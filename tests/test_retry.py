@@ -0,0 +1,45 @@
+import pytest
+from random import Random
+from sql_system_transfer.retry import RetryPolicy, error_sqlstate, error_transient, error_connection
+
+
+class DriverError(Exception):
+    pass
+
+
+@pytest.mark.parametrize(
+    "attempt, expected_result", [
+        (1, 0.5),
+        (2, 1.0),
+        (3, 2.0),
+        (10, 30.0),
+    ])
+def test_retry_delay(attempt, expected_result):
+    policy = RetryPolicy()
+    delays = [policy.retry_delay(attempt=attempt, rng=Random(seed)) for seed in range(50)]
+    assert all([0 <= delay <= expected_result for delay in delays])
+    assert max(delays) > expected_result / 2
+
+
+@pytest.mark.parametrize(
+    "error, expected_result", [
+        (DriverError("40001", "[40001] Transaction was deadlocked (1205)"), "40001"),
+        (DriverError("message only"), "message only"),
+        (DriverError(), None),
+    ])
+def test_error_sqlstate(error, expected_result):
+    assert error_sqlstate(error) == expected_result
+
+
+@pytest.mark.parametrize(
+    "error, transient, connection", [
+        (DriverError("40001", "[40001] Transaction was deadlocked"), True, False),
+        (DriverError("HYT00", "[HYT00] Query timeout expired"), True, False),
+        (DriverError("08S01", "[08S01] Communication link failure"), True, True),
+        (DriverError("HY000", "[HY000] Lock wait timeout exceeded; try restarting transaction (1205)"), True, False),
+        (DriverError("HY000", "[HY000] MySQL server has gone away (2006)"), True, True),
+        (DriverError("23000", "[23000] Violation of PRIMARY KEY constraint"), False, False),
+    ])
+def test_error_transient(error, transient, connection):
+    assert error_transient(error) == transient
+    assert error_connection(error) == connection
@@ -0,0 +1,98 @@
+import pytest
+from sql_system_transfer.engine import MsSQLTable
+from sql_system_transfer.scheduler import DEFAULT_ROW_BYTES, TransferTask, table_cost, table_partition_count, partition_ranges, \
+    schedule_order, schedule_tasks, schedule_makespan, schedule_waves
+
+
+table_columns = [
+    {'column_name': 'AccountKey', 'nullable': 'NO', 'datatype_name': 'int', 'character_size': None,
+     'character_set': None, 'numeric_precision': 10, 'numeric_scale': 0, 'datetime_precision': None},
+]
+
+
+def create_table(table_rows=None, table_data_bytes=None):
+    return MsSQLTable(
+        table="DimAccount",
+        table_type="BASE TABLE",
+        table_rows=table_rows,
+        table_data_bytes=table_data_bytes,
+        init_table_columns=table_columns
+    )
+
+
+def create_task(name, cost):
+    table = create_table()
+    return TransferTask(table_name=name, old_table=table, new_table=table, cost=cost)
+
+
+@pytest.mark.parametrize(
+    "table_rows, table_data_bytes, expected_result", [
+        (None, None, 0),
+        (100, None, 100 * DEFAULT_ROW_BYTES),
+        (100, 8192, 8192),
+    ])
+def test_table_cost(table_rows, table_data_bytes, expected_result):
+    cost = table_cost(create_table(table_rows=table_rows, table_data_bytes=table_data_bytes))
+    assert cost == expected_result
+
+
+@pytest.mark.parametrize(
+    "cost, split_threshold, expected_result", [
+        (1000, None, 1),
+        (1000, 0, 1),
+        (1000, 1000, 1),
+        (1001, 1000, 2),
+        (5000, 1000, 5),
+    ])
+def test_table_partition_count(cost, split_threshold, expected_result):
+    partitions = table_partition_count(cost=cost, split_threshold=split_threshold)
+    assert partitions == expected_result
+
+
+@pytest.mark.parametrize(
+    "lower, upper, partitions, expected_result", [
+        (1, 100, 1, [(None, None)]),
+        (1, 100, 4, [(None, 26), (26, 51), (51, 76), (76, None)]),
+        (1, 2, 4, [(None, 2), (2, None)]),
+    ])
+def test_partition_ranges(lower, upper, partitions, expected_result):
+    ranges = partition_ranges(lower=lower, upper=upper, partitions=partitions)
+    assert ranges == expected_result
+
+
+def test_transfer_task_task_name():
+    table = create_table()
+    task = TransferTask(table_name="Testing.dbo.DimAccount", old_table=table, new_table=table, partition=1, partitions=3)
+    assert task.task_name() == "Testing.dbo.DimAccount [2/3]"
+    assert create_task("Testing.dbo.DimAccount", 0).task_name() == "Testing.dbo.DimAccount"
+
+
+def test_schedule_order():
+    tasks = [create_task("a", 1), create_task("b", 10), create_task("c", 5)]
+    assert [task.table_name for task in schedule_order(tasks)] == ["b", "c", "a"]
+
+
+def test_schedule_tasks():
+    tasks = [create_task(name, cost) for name, cost in [("a", 7), ("b", 5), ("c", 4), ("d", 3), ("e", 3)]]
+    schedule = schedule_tasks(tasks=tasks, workers=2)
+    assert [[task.table_name for task in worker] for worker in schedule] == [["a", "d"], ["b", "c", "e"]]
+    assert schedule_makespan(schedule) == 12
+
+
+def test_schedule_tasks_more_workers_than_tasks():
+    schedule = schedule_tasks(tasks=[create_task("a", 7)], workers=3)
+    assert len(schedule) == 3
+    assert schedule_makespan(schedule) == 7
+
+
+@pytest.mark.parametrize(
+    "dependencies, expected_result", [
+        ({}, []),
+        ({"a": set(), "b": set()}, [["a", "b"]]),
+        ({"a": set(), "b": {"a"}, "c": {"a", "b"}, "d": set()}, [["a", "d"], ["b"], ["c"]]),
+        ({"a": {"missing"}, "b": {"a"}}, [["a"], ["b"]]),
+        ({"a": {"b"}, "b": {"a"}, "c": set()}, [["c"], ["a", "b"]]),
+    ])
+def test_schedule_waves(dependencies, expected_result):
+    waves = schedule_waves(dependencies)
+    assert waves == expected_result
@@ -0,0 +1,91 @@
+import pytest
+import sqlite3
+from datetime import date, datetime, time
+from decimal import Decimal
+from hashlib import md5
+from uuid import UUID
+from sql_system_transfer.sqlite import SQLiteError, sqlite_checksum, sqlite_connect, sqlite_float
+
+
+@pytest.fixture()
+def connection():
+    connection = sqlite_connect(database=":memory:")
+    connection.execute("CREATE TABLE DimAccount (AccountKey int PRIMARY KEY, Amount decimal(19, 4), Modified datetime);")
+    yield connection
+    connection.close()
+
+
+def test_sqlite_checksum():
+    assert sqlite_checksum("1|abc|") == int(md5(b"1|abc|").hexdigest()[0:8], 16)
+    assert sqlite_checksum(None) is None
+
+
+def test_sqlite_execute(connection):
+    cursor = connection.cursor()
+    cursor.execute("INSERT INTO DimAccount VALUES (?, ?, ?);", 1, Decimal("1.5000"), datetime(2020, 1, 2, 3, 4, 5))
+    cursor.execute("INSERT INTO DimAccount VALUES (?, ?, ?);", [2, None, date(2020, 1, 2)])
+    assert cursor.execute("SELECT * FROM DimAccount WHERE AccountKey > ?;", 0).fetchall() == [
+        (1, 1.5, "2020-01-02 03:04:05"), (2, None, "2020-01-02")
+    ]
+    assert cursor.execute("SELECT ?;", time(1, 2, 3)).fetchone() == ("01:02:03",)
+    uuid = UUID("6f9619ff-8b86-d011-b42d-00c04fc964ff")
+    assert cursor.execute("SELECT ?;", uuid).fetchone() == ("6f9619ff-8b86-d011-b42d-00c04fc964ff",)
+
+
+def test_sqlite_adapters():
+    # the values are converted by the cursor, other sqlite3 connections of the process keep the default adapters
+    assert not [key for key in sqlite3.adapters if key[0] in [Decimal, UUID, time]]
+
+
+def test_sqlite_executemany(connection):
+    cursor = connection.cursor()
+    cursor.executemany("INSERT INTO DimAccount (AccountKey) VALUES (?);", [(key,) for key in range(10)])
+    cursor.executemany("INSERT INTO DimAccount VALUES (?, ?, ?);", [(10, Decimal("2.5"), date(2020, 1, 2))])
+    assert cursor.execute("SELECT Amount, Modified FROM DimAccount WHERE AccountKey = 10;").fetchone() == \
+        (2.5, "2020-01-02")
+    cursor.execute("DELETE FROM DimAccount WHERE AccountKey = 10;")
+    with pytest.raises(SQLiteError) as error:
+        cursor.executemany("INSERT INTO DimAccount (AccountKey) VALUES (?);", [(10,), (0,)])
+    assert error.value.args[0] == "23000"
+    assert cursor.execute("SELECT COUNT(*) FROM DimAccount;").fetchone() == (10,)
+
+
+def test_sqlite_autocommit(tmp_path):
+    connection = sqlite_connect(database=str(tmp_path / "testing.db"), autocommit=False)
+    connection.execute("CREATE TABLE DimAccount (AccountKey int);")
+    cursor = connection.cursor()
+    cursor.execute("INSERT INTO DimAccount VALUES (1);")
+    cursor.rollback()
+    assert not connection.autocommit
+    assert cursor.execute("SELECT COUNT(*) FROM DimAccount;").fetchone() == (0,)
+    cursor.execute("INSERT INTO DimAccount VALUES (1);")
+    connection.autocommit = True
+    connection.close()
+    assert sqlite_connect(database=str(tmp_path / "testing.db")).execute("SELECT COUNT(*) FROM DimAccount;").fetchone() == (1,)
+
+
+@pytest.mark.parametrize(
+    "statement, expected_result", [
+        ("SELECT * FROM DimMissing;", "42S02"),
+        ("SELEC 1;", "HY000"),
+    ])
+def test_sqlite_error(connection, statement, expected_result):
+    with pytest.raises(SQLiteError) as error:
+        connection.execute(statement)
+    assert error.value.args[0] == expected_result
+    assert error.value.args[1].startswith(f"[{expected_result}] [SQLite]")
+
+
+@pytest.mark.parametrize(
+    "value, expected_result", [
+        (None, None),
+        (0.0, "0"),
+        (1e32, "1.000000000000E32"),
+        (-2.5e-7, "-2.500000000000E-7"),
+        (1.7976931348623157e308, "1.797693134862E308"),
+        (123456.789, "1.234567890000E5"),
+    ])
+def test_sqlite_float(connection, value, expected_result):
+    # the text the float checksum of SQL Server and MySQL gives for the same value
+    assert sqlite_float(value) == expected_result
+    assert connection.execute("SELECT sst_float(?);", value).fetchone() == (expected_result,)
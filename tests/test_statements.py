@@ -1,5 +1,6 @@
 import pytest
-from sql_system_transfer.statements import MsSQLStatements, MySQLStatements
+import sqlite3
+from sql_system_transfer.statements import MsSQLStatements, MySQLStatements, SQLiteStatements
 from textwrap import dedent
 
 class TestMsSQLStatements:
@@ -9,7 +10,7 @@ class TestMsSQLStatements:
         return MsSQLStatements()
 
     def test_statement_information_schema_columns(self, statements):
-        statement = statements.statement_information_schema_columns(database="Testing", table="DimTable", schema="dbo")
+        statement = statements.statement_information_schema_columns(database="Testing")
         assert statement == dedent(f"""
             SELECT COLUMN_NAME 
                 ,IS_NULLABLE
@@ -20,11 +21,20 @@ class TestMsSQLStatements:
                 ,NUMERIC_SCALE
                 ,DATETIME_PRECISION  
             FROM Testing.INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = 'dbo'
-            AND TABLE_NAME = 'DimTable'
+            WHERE TABLE_SCHEMA = ?
+            AND TABLE_NAME = ?
             ORDER BY ORDINAL_POSITION;
         """)
 
+    @pytest.mark.parametrize(
+        "schema, expected_result", [
+            ("sales", ("sales", "DimTable")),
+            (None, ("dbo", "DimTable")),
+        ])
+    def test_parameters_information_schema_columns(self, statements, schema, expected_result):
+        parameters = statements.parameters_information_schema_columns(database="Testing", table="DimTable", schema=schema)
+        assert parameters == expected_result
+
     def test_statement_information_schema_tables(self, statements):
         statement = statements.statement_information_schema_tables(database="Testing")
         assert statement == dedent(f"""
@@ -35,15 +45,74 @@ class TestMsSQLStatements:
         """)
 
     def test_statement_table_exists(self, statements):
-        statement = statements.statement_table_exists(
-            database="Testing", table="DimTable", schema="dbo", table_type="BASE TABLE"
-        )
+        statement = statements.statement_table_exists(database="Testing")
         assert statement == dedent(f"""
             SELECT count(*) as Cnt
             FROM Testing.INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_NAME = 'DimTable'
-            AND TABLE_TYPE = 'BASE TABLE';
+            WHERE TABLE_SCHEMA = ?
+            AND TABLE_NAME = ?
+            AND TABLE_TYPE = ?;
         """)
+        parameters = statements.parameters_table_exists(
+            database="Testing", table="DimTable", schema="dbo", table_type="BASE TABLE"
+        )
+        assert parameters == ("dbo", "DimTable", "BASE TABLE")
+
+    @pytest.mark.parametrize(
+        "schema, table, expected_result", [
+            ("dbo", "DimTable", 1),
+            (None, "DimTable", 1),
+            ("sales", "DimTable", 0),
+            ("sales", "FactSales", 1),
+            (None, "FactSales", 0),
+        ])
+    def test_statement_table_exists_schema(self, statements, schema, table, expected_result):
+        # the same table name in another schema is another table, evaluated in sqlite3 against a TABLES copy
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE TABLES (TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE)")
+        connection.executemany("INSERT INTO TABLES VALUES (?, ?, ?)", [
+            ("dbo", "DimTable", "BASE TABLE"), ("sales", "FactSales", "BASE TABLE")
+        ])
+        statement = statements.statement_table_exists(database="Testing").replace(
+            "Testing.INFORMATION_SCHEMA.TABLES", "TABLES"
+        )
+        parameters = statements.parameters_table_exists(
+            database="Testing", table=table, schema=schema, table_type="BASE TABLE"
+        )
+        assert connection.execute(statement, parameters).fetchone()[0] == expected_result
+        connection.close()
+
+    def test_statement_table_statistics(self, statements):
+        statement = statements.statement_table_statistics(database="Testing")
+        assert "FROM Testing.sys.dm_db_partition_stats ps" in statement
+        assert statement.strip().endswith("GROUP BY s.name, t.name;")
+
+    def test_statement_foreign_keys(self, statements):
+        statement = statements.statement_foreign_keys(database="Testing")
+        assert "FROM Testing.INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc" in statement
+        assert "JOIN Testing.INFORMATION_SCHEMA.KEY_COLUMN_USAGE ref" in statement
+
+    def test_statement_indexes(self, statements):
+        statement = statements.statement_indexes(database="Testing")
+        assert "FROM Testing.sys.indexes i" in statement
+        assert "AND ic.is_included_column = 0" in statement
+
+    @pytest.mark.parametrize(
+        "method", [
+            "parameters_information_schema_tables", "parameters_table_statistics", "parameters_foreign_keys",
+            "parameters_indexes",
+        ])
+    def test_parameters_database(self, statements, method):
+        assert getattr(statements, method)(database="Testing") == ()
+
+    def test_statement_recovery_model(self, statements):
+        statement = statements.statement_recovery_model(database="Testing")
+        assert statement == "SELECT recovery_model_desc FROM sys.databases WHERE name = ?;"
+        assert statements.parameters_recovery_model(database="Testing") == ("Testing",)
+
+    def test_statement_set_recovery_model(self, statements):
+        statement = statements.statement_set_recovery_model(database="Testing", recovery_model="BULK_LOGGED")
+        assert statement == "ALTER DATABASE Testing SET RECOVERY BULK_LOGGED;"
 
 class TestMySQLStatements:
 
@@ -52,7 +121,7 @@ class TestMySQLStatements:
         return MySQLStatements()
 
     def test_statement_information_schema_columns(self, statements):
-        statement = statements.statement_information_schema_columns(database="Testing", table="DimTable")
+        statement = statements.statement_information_schema_columns(database="Testing")
         assert statement == dedent(f"""
             SELECT COLUMN_NAME 
                 ,IS_NULLABLE
@@ -63,10 +132,12 @@ class TestMySQLStatements:
                 ,NUMERIC_SCALE
                 ,DATETIME_PRECISION  
             FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = 'Testing'
-            AND TABLE_NAME = 'DimTable'
+            WHERE TABLE_SCHEMA = ?
+            AND TABLE_NAME = ?
             ORDER BY ORDINAL_POSITION;
         """)
+        parameters = statements.parameters_information_schema_columns(database="Testing", table="DimTable")
+        assert parameters == ("Testing", "DimTable")
 
     def test_statement_information_schema_tables(self, statements):
         statement = statements.statement_information_schema_tables(database="Testing")
@@ -75,17 +146,122 @@ class TestMySQLStatements:
                 TABLE_NAME, 
                 TABLE_TYPE
             FROM INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_SCHEMA = 'Testing';
+            WHERE TABLE_SCHEMA = ?;
         """)
 
     def test_statement_table_exists(self, statements):
-        statement = statements.statement_table_exists(
-            database="Testing", table="DimTable", table_type="BASE TABLE"
-        )
+        statement = statements.statement_table_exists(database="Testing")
         assert statement == dedent(f"""
             SELECT count(*) as Cnt
             FROM INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_SCHEMA = 'Testing'
-            AND TABLE_NAME = 'DimTable'
+            WHERE TABLE_SCHEMA = ?
+            AND TABLE_NAME = ?
+            AND TABLE_TYPE = ?;
+        """)
+        parameters = statements.parameters_table_exists(database="Testing", table="DimTable", table_type="BASE TABLE")
+        assert parameters == ("Testing", "DimTable", "BASE TABLE")
+
+    def test_statement_table_statistics(self, statements):
+        statement = statements.statement_table_statistics(database="Testing")
+        assert statement == dedent(f"""
+            SELECT '',
+                TABLE_NAME,
+                TABLE_ROWS,
+                DATA_LENGTH,
+                INDEX_LENGTH
+            FROM INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA = ?
             AND TABLE_TYPE = 'BASE TABLE';
-        """)
\ No newline at end of file
+        """)
+
+    def test_statement_foreign_keys(self, statements):
+        statement = statements.statement_foreign_keys(database="Testing")
+        assert "WHERE rc.CONSTRAINT_SCHEMA = ?" in statement
+        assert "kcu.REFERENCED_TABLE_NAME" in statement
+
+    def test_statement_indexes(self, statements):
+        statement = statements.statement_indexes(database="Testing")
+        assert "FROM INFORMATION_SCHEMA.STATISTICS" in statement
+        assert "WHERE TABLE_SCHEMA = ?" in statement
+
+    @pytest.mark.parametrize(
+        "method", [
+            "parameters_information_schema_tables", "parameters_table_statistics", "parameters_foreign_keys",
+            "parameters_indexes",
+        ])
+    def test_parameters_database(self, statements, method):
+        assert getattr(statements, method)(database="Testing") == ("Testing",)
+
+    def test_statement_recovery_model(self, statements):
+        assert statements.statement_recovery_model(database="Testing") is None
+        assert statements.parameters_recovery_model(database="Testing") == ()
+        assert statements.statement_set_recovery_model(database="Testing", recovery_model="BULK_LOGGED") is None
+
+
+class TestSQLiteStatements:
+
+    @pytest.fixture()
+    def statements(self):
+        return SQLiteStatements()
+
+    @pytest.fixture()
+    def cursor(self):
+        connection = sqlite3.connect(":memory:")
+        connection.executescript("""
+            CREATE TABLE DimAccount (AccountKey INTEGER PRIMARY KEY, ParentKey int REFERENCES DimAccount (AccountKey),
+                AccountName varchar(50) NOT NULL, Amount decimal(19, 4), Modified datetime(3), Notes);
+            CREATE UNIQUE INDEX UX_AccountName ON DimAccount (AccountName);
+            CREATE TABLE FactBalance (AccountKey int, DateKey int, Balance real, PRIMARY KEY (AccountKey, DateKey));
+            CREATE VIEW DimAccountView AS SELECT * FROM DimAccount;
+        """)
+        yield connection.cursor()
+        connection.close()
+
+    def test_statement_information_schema_columns(self, statements, cursor):
+        statement = statements.statement_information_schema_columns(database="main")
+        cursor.execute(statement, statements.parameters_information_schema_columns(database="main", table="DimAccount"))
+        assert cursor.fetchall() == [
+            ("AccountKey", "NO", "integer", None, None, None, None, None),
+            ("ParentKey", "YES", "int", None, None, None, None, None),
+            ("AccountName", "NO", "varchar", 50, None, 50, None, 50),
+            ("Amount", "YES", "decimal", 19, None, 19, 4, 19),
+            ("Modified", "YES", "datetime", 3, None, 3, None, 3),
+            ("Notes", "YES", "", None, None, None, None, None),
+        ]
+
+    def test_statement_information_schema_tables(self, statements, cursor):
+        cursor.execute(statements.statement_information_schema_tables(database="main"))
+        assert sorted(cursor.fetchall()) == [
+            ("", "DimAccount", "BASE TABLE"), ("", "DimAccountView", "VIEW"), ("", "FactBalance", "BASE TABLE")
+        ]
+
+    @pytest.mark.parametrize(
+        "table, table_type, expected_result", [
+            ("DimAccount", "BASE TABLE", 1),
+            ("DimAccountView", "BASE TABLE", 0),
+            ("DimAccountView", "VIEW", 1),
+        ])
+    def test_statement_table_exists(self, statements, cursor, table, table_type, expected_result):
+        parameters = statements.parameters_table_exists(database="main", table=table, table_type=table_type)
+        cursor.execute(statements.statement_table_exists(database="main"), parameters)
+        assert cursor.fetchone()[0] == expected_result
+
+    def test_statement_table_statistics(self, statements, cursor):
+        cursor.execute(statements.statement_table_statistics(database="main"))
+        assert sorted(cursor.fetchall()) == [("", "DimAccount", None, None, None), ("", "FactBalance", None, None, None)]
+
+    def test_statement_foreign_keys(self, statements, cursor):
+        cursor.execute(statements.statement_foreign_keys(database="main"), statements.parameters_foreign_keys("main"))
+        assert cursor.fetchall() == [("FK_DimAccount_0", "", "DimAccount", "ParentKey", "", "DimAccount", "AccountKey")]
+
+    def test_statement_indexes(self, statements, cursor):
+        cursor.execute(statements.statement_indexes(database="main"), statements.parameters_indexes("main"))
+        assert [row[0:5] for row in cursor.fetchall()] == [
+            ("", "DimAccount", "PRIMARY", "PRIMARY KEY", "AccountKey"),
+            ("", "DimAccount", "UX_AccountName", "UNIQUE", "AccountName"),
+            ("", "FactBalance", "PRIMARY", "PRIMARY KEY", "AccountKey"),
+            ("", "FactBalance", "PRIMARY", "PRIMARY KEY", "DateKey"),
+        ]
+
+    def test_statement_recovery_model(self, statements):
+        assert statements.statement_recovery_model(database="main") is None
@@ -5,6 +5,7 @@ from sql_system_transfer.system import SQLSystem
     "system, expected_result", [
         (SQLSystem.MSSQL, "MsSQL"),
         (SQLSystem.MYSQL, "MySQL"),
+        (SQLSystem.SQLITE, "SQLite"),
     ])
 def test_system_abbreviation(system, expected_result):
     system_abbreviation = system.system_abbreviation()
@@ -14,6 +15,7 @@ def test_system_abbreviation(system, expected_result):
     "system, expected_result", [
         (SQLSystem.MSSQL, "mssql"),
         (SQLSystem.MYSQL, "mysql"),
+        (SQLSystem.SQLITE, "sqlite"),
     ])
 def test_system_abbreviation_lower(system, expected_result):
     system_abbreviation = system.system_abbreviation_lower()
@@ -23,7 +25,18 @@ def test_system_abbreviation_lower(system, expected_result):
     "system, expected_result", [
         (SQLSystem.MSSQL, "{ODBC Driver 17 for SQL Server}"),
         (SQLSystem.MYSQL, "{MySQL ODBC 8.0 Unicode Driver}"),
+        (SQLSystem.SQLITE, None),
     ])
 def test_system_driver(system, expected_result):
     driver = system.system_driver()
-    assert driver == expected_result
\ No newline at end of file
+    assert driver == expected_result
+
+@pytest.mark.parametrize(
+    "system, expected_result", [
+        (SQLSystem.MSSQL, True),
+        (SQLSystem.MYSQL, False),
+        (SQLSystem.SQLITE, False),
+    ])
+def test_system_fast_executemany(system, expected_result):
+    fast_executemany = system.system_fast_executemany()
+    assert fast_executemany == expected_result
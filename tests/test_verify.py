@@ -0,0 +1,125 @@
+import pytest
+from datetime import date, datetime, time
+from decimal import Decimal
+from sql_system_transfer.verify import ChunkVerification, TableVerification, SampleVerification, verify_value, \
+    verify_parameter, verify_row, verify_checksum, verify_rows, wilson_upper_bound, sample_batches
+
+
+@pytest.mark.parametrize(
+    "value, expected_result", [
+        (None, None),
+        (True, 1),
+        (b"\x01\xab", "01AB"),
+        (datetime(2022, 5, 1, 12, 30, 15, 500), "2022-05-01 12:30:15"),
+        (date(2022, 5, 1), "2022-05-01"),
+        (time(12, 30, 15), "12:30:15"),
+        (Decimal("1.5000"), 1.5),
+        (1.0000001, 1.0),
+        ("USD  ", "USD"),
+        (42, 42),
+    ])
+def test_verify_value(value, expected_result):
+    assert verify_value(value) == expected_result
+
+
+def test_verify_value_uniqueidentifier():
+    value = verify_value("6f9619ff-8b86-d011-b42d-00c04fc964ff", "uniqueidentifier")
+    assert value == verify_value(bytes.fromhex("6F9619FF8B86D011B42D00C04FC964FF"))
+
+
+@pytest.mark.parametrize(
+    "value, datatype_name, new_datatype_name, expected_result", [
+        ("6f9619ff-8b86-d011-b42d-00c04fc964ff", "uniqueidentifier", "binary",
+         bytes.fromhex("6F9619FF8B86D011B42D00C04FC964FF")),
+        ("6f9619ff-8b86-d011-b42d-00c04fc964ff", "uniqueidentifier", "char", "6f9619ff-8b86-d011-b42d-00c04fc964ff"),
+        (42, "int", "int", 42),
+    ])
+def test_verify_parameter(value, datatype_name, new_datatype_name, expected_result):
+    assert verify_parameter(value, datatype_name, new_datatype_name) == expected_result
+
+
+def test_verify_row():
+    assert verify_row((1, Decimal("2.50"), "a ")) == (1, 2.5, "a")
+
+
+@pytest.mark.parametrize(
+    "result, expected_result", [
+        (None, (0, 0)),
+        ((0, None), (0, 0)),
+        ((10, Decimal("12345")), (10, 12345)),
+    ])
+def test_verify_checksum(result, expected_result):
+    assert verify_checksum(result) == expected_result
+
+
+def test_verify_rows():
+    old_rows = [(1, "a"), (2, "b"), (3, "c")]
+    new_rows = [(1, "a"), (3, "x"), (4, "d")]
+    assert verify_rows(old_rows=old_rows, new_rows=new_rows, key_index=[0]) == ([(2,)], [(4,)], [(3,)])
+
+
+def test_verify_rows_limit():
+    old_rows = [(key, "a") for key in range(150)]
+    assert len(verify_rows(old_rows=old_rows, new_rows=[], key_index=[0])[0]) == 100
+    assert len(verify_rows(old_rows=old_rows, new_rows=[], key_index=[0], limit=None)[0]) == 150
+
+
+def test_verify_rows_no_keys():
+    assert verify_rows(old_rows=[(1, "a"), (2, "b")], new_rows=[(1, "a"), (2, "c")]) == ([(2, "b")], [(2, "c")], [])
+
+
+def test_table_verification():
+    chunks = [
+        ChunkVerification(table_name="a", partition=0, source_rows=10, target_rows=10),
+        ChunkVerification(table_name="a", partition=1, source_rows=5, target_rows=5, matched=False),
+    ]
+    verification = TableVerification(table_name="a", chunks=chunks)
+    assert verification.verification_source_rows() == 15
+    assert verification.verification_mismatched_chunks() == 1
+    assert verification.verification_passed()
+
+
+def test_table_verification_failed():
+    chunks = [
+        ChunkVerification(table_name="a", source_rows=3, target_rows=2, matched=False, missing_keys=[(2,)]),
+    ]
+    verification = TableVerification(table_name="a", chunks=chunks)
+    assert not verification.verification_passed()
+    assert verification.verification_missing_keys() == [(2,)]
+    assert verification.verification_format() == \
+        "a FAILED - rows: 3 source, 2 target, chunks: 1, mismatched: 1, missing: 1, extra: 0, changed: 0"
+
+
+@pytest.mark.parametrize(
+    "mismatches, samples, expected_result", [
+        (0, 0, 1.0),
+        (0, 1000, 0.0038),
+        (10, 1000, 0.0183),
+        (1000, 1000, 1.0),
+    ])
+def test_wilson_upper_bound(mismatches, samples, expected_result):
+    assert round(wilson_upper_bound(mismatches=mismatches, samples=samples), 4) == expected_result
+
+
+@pytest.mark.parametrize("confidence, expected_result", [(0.8, 0.0149), (0.9, 0.0167), (0.95, 0.0183)])
+def test_wilson_upper_bound_confidence(confidence, expected_result):
+    assert round(wilson_upper_bound(mismatches=10, samples=1000, confidence=confidence), 4) == expected_result
+
+
+@pytest.mark.parametrize(
+    "key_count, expected_result", [
+        (1, [500, 500, 200]),
+        (4, [125] * 9 + [75]),
+    ])
+def test_sample_batches(key_count, expected_result):
+    keys = [(key,) for key in range(1200)]
+    assert [len(batch) for batch in sample_batches(keys=keys, key_count=key_count)] == expected_result
+
+
+def test_sample_verification():
+    verification = SampleVerification(table_name="a", samples=1000, missing_keys=[(1,)], changed_keys=[(2,), (3,)])
+    assert verification.verification_mismatches() == 3
+    assert verification.verification_mismatch_rate() == 0.003
+    assert not verification.verification_passed()
+    assert verification.verification_format() == \
+        "a FAILED - samples: 1,000, missing: 1, changed: 2, mismatch rate: 0.3000% (<= 0.8783% at 95%)"